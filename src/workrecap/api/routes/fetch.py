@@ -8,7 +8,7 @@ from pydantic import BaseModel
 from workrecap.api.deps import get_config, get_job_store
 from workrecap.api.job_store import JobStore
 from workrecap.config import AppConfig
-from workrecap.infra.client_pool import GHESClientPool
+from workrecap.infra.etag_cache import ETagCache
 from workrecap.infra.ghes_client import GHESClient
 from workrecap.models import JobStatus
 from workrecap.services.daily_state import DailyStateStore
@@ -50,7 +50,10 @@ def _fetch_single_task(
 
     ghes = None
     try:
-        ghes = GHESClient(config.ghes_url, config.ghes_token, search_interval=2.0)
+        etag_cache = ETagCache.from_config(config)
+        ghes = GHESClient(
+            config.ghes_url, config.ghes_token, search_interval=2.0, etag_cache=etag_cache
+        )
         ds = DailyStateStore(config.daily_state_path)
         ps = FetchProgressStore(config.state_dir / "fetch_progress")
         service = FetcherService(config, ghes, daily_state=ds, progress_store=ps, repos=repos or [])
@@ -80,17 +83,17 @@ def _fetch_range_task(
     logger.info("Background task start: fetch_range %s..%s (job=%s)", since, until, job_id)
     store.update(job_id, JobStatus.RUNNING)
 
-    pool = None
     ghes = None
     try:
-        ghes = GHESClient(config.ghes_url, config.ghes_token, search_interval=2.0)
+        etag_cache = ETagCache.from_config(config)
+        ghes = GHESClient(
+            config.ghes_url, config.ghes_token, search_interval=2.0, etag_cache=etag_cache
+        )
         ds = DailyStateStore(config.daily_state_path)
         ps = FetchProgressStore(config.state_dir / "fetch_progress")
         fetch_kwargs: dict = {"daily_state": ds, "progress_store": ps}
         if max_workers > 1:
-            pool = GHESClientPool(config.ghes_url, config.ghes_token, size=max_workers)
             fetch_kwargs["max_workers"] = max_workers
-            fetch_kwargs["client_pool"] = pool
         service = FetcherService(config, ghes, repos=repos or [], **fetch_kwargs)
         results = service.fetch_range(since, until, types=types, force=force)
 
@@ -106,8 +109,6 @@ def _fetch_range_task(
     finally:
         if ghes:
             ghes.close()
-        if pool:
-            pool.close()
 
 
 @router.post("/range", status_code=202)
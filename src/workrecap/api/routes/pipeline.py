@@ -14,7 +14,7 @@ from workrecap.api.deps import get_config, get_job_store
 from workrecap.api.job_store import JobStore
 from workrecap.config import AppConfig
 from workrecap.exceptions import SummarizeError
-from workrecap.infra.client_pool import GHESClientPool
+from workrecap.infra.etag_cache import ETagCache
 from workrecap.infra.ghes_client import GHESClient
 from workrecap.api.deps import get_llm_router
 from workrecap.models import JobStatus
@@ -133,7 +133,10 @@ def _run_pipeline_task(
 
     ghes = None
     try:
-        ghes = GHESClient(config.ghes_url, config.ghes_token, search_interval=2.0)
+        etag_cache = ETagCache.from_config(config)
+        ghes = GHESClient(
+            config.ghes_url, config.ghes_token, search_interval=2.0, etag_cache=etag_cache
+        )
         llm = get_llm_router(config)
         ds = DailyStateStore(config.daily_state_path)
         ps = FetchProgressStore(config.state_dir / "fetch_progress")
@@ -181,18 +184,18 @@ def _run_range_task(
     )
     store.update(job_id, JobStatus.RUNNING)
 
-    pool = None
     ghes = None
     try:
-        ghes = GHESClient(config.ghes_url, config.ghes_token, search_interval=2.0)
+        etag_cache = ETagCache.from_config(config)
+        ghes = GHESClient(
+            config.ghes_url, config.ghes_token, search_interval=2.0, etag_cache=etag_cache
+        )
         llm = get_llm_router(config)
         ds = DailyStateStore(config.daily_state_path)
         ps = FetchProgressStore(config.state_dir / "fetch_progress")
         fetch_kwargs: dict = {"daily_state": ds, "progress_store": ps}
         if max_workers > 1:
-            pool = GHESClientPool(config.ghes_url, config.ghes_token, size=max_workers)
             fetch_kwargs["max_workers"] = max_workers
-            fetch_kwargs["client_pool"] = pool
         fetcher = FetcherService(config, ghes, repos=repos or [], **fetch_kwargs)
         normalizer = NormalizerService(config, daily_state=ds, llm=llm if enrich else None)
         summarizer = SummarizerService(config, llm, daily_state=ds)
@@ -241,8 +244,6 @@ def _run_range_task(
     finally:
         if ghes:
             ghes.close()
-        if pool:
-            pool.close()
 
 
 @router.post("/run/range", status_code=202)
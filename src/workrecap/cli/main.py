@@ -1,7 +1,6 @@
 """work-recap CLI — Typer 기반."""
 
 import calendar
-import json
 import logging
 from datetime import date
 from pathlib import Path
@@ -12,6 +11,7 @@ from workrecap.config import AppConfig
 from workrecap.exceptions import WorkRecapError, SummarizeError
 from workrecap.infra.model_discovery import discover_models
 from workrecap.logging_config import setup_file_logging, setup_logging
+from workrecap.models import load_json
 from workrecap.services import date_utils
 from workrecap.services.daily_state import DailyStateStore
 from workrecap.services.failed_dates import FailedDateStore
@@ -61,9 +61,10 @@ def _get_config() -> AppConfig:
 
 
 def _get_ghes_client(config: AppConfig):
+    from workrecap.infra.etag_cache import ETagCache
     from workrecap.infra.ghes_client import GHESClient
 
-    return GHESClient(config.ghes_url, config.ghes_token)
+    return GHESClient(config.ghes_url, config.ghes_token, etag_cache=ETagCache.from_config(config))
 
 
 def _get_llm_router(config: AppConfig):
@@ -107,27 +108,21 @@ def _read_last_fetch_date(config: AppConfig) -> str | None:
     cp_path = config.checkpoints_path
     if not cp_path.exists():
         return None
-    with open(cp_path, encoding="utf-8") as f:
-        data = json.load(f)
-    return data.get("last_fetch_date")
+    return load_json(cp_path).get("last_fetch_date")
 
 
 def _read_last_normalize_date(config: AppConfig) -> str | None:
     cp_path = config.checkpoints_path
     if not cp_path.exists():
         return None
-    with open(cp_path, encoding="utf-8") as f:
-        data = json.load(f)
-    return data.get("last_normalize_date")
+    return load_json(cp_path).get("last_normalize_date")
 
 
 def _read_last_summarize_date(config: AppConfig) -> str | None:
     cp_path = config.checkpoints_path
     if not cp_path.exists():
         return None
-    with open(cp_path, encoding="utf-8") as f:
-        data = json.load(f)
-    return data.get("last_summarize_date")
+    return load_json(cp_path).get("last_summarize_date")
 
 
 def _parse_weekly(value: str) -> tuple[int, int]:
@@ -277,7 +272,6 @@ def fetch(
 
     # 3. Fetch 실행
     config = _get_config()
-    pool = None
     try:
         with _get_ghes_client(config) as client:
             from workrecap.services.fetch_progress import FetchProgressStore
@@ -294,11 +288,7 @@ def fetch(
                 "failed_date_store": failed_store,
             }
             if workers > 1:
-                from workrecap.infra.client_pool import GHESClientPool
-
-                pool = GHESClientPool(config.ghes_url, config.ghes_token, size=workers)
                 fetch_kwargs["max_workers"] = workers
-                fetch_kwargs["client_pool"] = pool
             service = FetcherService(config, client, repos=repo, **fetch_kwargs)
 
             # 다중 날짜 → fetch_range (월 단위 최적화)
@@ -338,9 +328,6 @@ def fetch(
                     _echo(f"  {dates[0]} {type_name}: {path}")
     except WorkRecapError as e:
         _handle_error(e)
-    finally:
-        if pool is not None:
-            pool.close()
 
 
 def _print_range_results(label: str, range_results: list[dict]) -> None:
@@ -676,7 +663,6 @@ def run(
 
     config = _get_config()
     max_workers = workers if workers is not None else config.max_workers
-    pool = None
     storage = None
 
     try:
@@ -697,11 +683,7 @@ def run(
             "failed_date_store": failed_store,
         }
         if max_workers > 1:
-            from workrecap.infra.client_pool import GHESClientPool
-
-            pool = GHESClientPool(config.ghes_url, config.ghes_token, size=max_workers)
             fetch_kwargs["max_workers"] = max_workers
-            fetch_kwargs["client_pool"] = pool
 
         fetcher = FetcherService(config, ghes, repos=repo, **fetch_kwargs)
         normalizer = NormalizerService(config, daily_state=ds, llm=llm if enrich else None)
@@ -794,8 +776,6 @@ def run(
     except WorkRecapError as e:
         _handle_error(e)
     finally:
-        if pool is not None:
-            pool.close()
         if storage is not None:
             try:
                 storage.close_sync()
@@ -26,6 +26,29 @@ class AppConfig(BaseSettings):
 
     # 병렬 실행
     max_workers: int = 5
+    # 날짜 하나의 PR/Commit/Issue enrich를 동시에 수행할 스레드 수.
+    # 모든 요청은 공유 GHESClient(스레드 안전, HTTP/2 multiplexing)로 나간다.
+    enrich_concurrency: int = 8
+    # PR/Issue detail·코멘트·리뷰를 GraphQL 쿼리 1회로 조회 (PR files는 patch 때문에 REST 유지).
+    # GraphQL(POST)은 ETag 조건부 요청(state/http_cache)을 쓸 수 없어, 변경 없는 날짜를
+    # 반복 재수집하는 경우에는 REST + 304 재사용이 rate limit을 덜 쓴다.
+    graphql_enrich: bool = False
+    # PR batch 하나가 반환할 것으로 추정되는 GraphQL node 수 상한 (코멘트 많은 PR은 작은 batch).
+    graphql_batch_node_budget: int = 2500
+    # fetch_range의 PR 3축(author/reviewed-by/commenter) 검색을 alias GraphQL search 쿼리
+    # 1회로 묶는다. 실패하면 REST Search로 fallback.
+    graphql_search: bool = False
+    # PR/Issue 검색 축을 (author:u OR commenter:u ...) 쿼리 1회로 묶는다. OR qualifier를
+    # 지원하는 서버에서만 켠다 — 거부되거나 1000건 cap에 닿으면 축별 쿼리로 fallback.
+    search_or_axes: bool = False
+    # GHES GET 응답의 ETag 조건부 요청 캐시 (state/http_cache). 304 응답은 rate limit을 쓰지
+    # 않지만 응답 본문을 raw와 별도로 한 벌 더 디스크에 둔다. 마지막 기록 후
+    # http_cache_max_age_days가 지난 entry는 무시·삭제한다 (0이면 만료 없음).
+    http_cache_enabled: bool = True
+    http_cache_max_age_days: int = 30
+    # LLM enrichment 1회 요청에 넣을 activity 수. 초과하면 chunk로 나눠 동시에 요청한다
+    # (0이면 날짜 전체를 요청 1회로). 동시 요청 수는 날짜 병렬 처리와 합쳐 max_workers개까지.
+    enrich_chunk_size: int = 20
 
     # 복원력 (Resilience)
     # Maximum retry attempts for failed dates before giving up.
@@ -69,6 +92,10 @@ class AppConfig(BaseSettings):
     def state_dir(self) -> Path:
         return self.data_dir / "state"
 
+    @property
+    def http_cache_dir(self) -> Path:
+        return self.state_dir / "http_cache"
+
     @property
     def checkpoints_path(self) -> Path:
         return self.state_dir / "checkpoints.json"
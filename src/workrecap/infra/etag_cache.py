@@ -0,0 +1,131 @@
+"""On-disk ETag cache for conditional GHES requests."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+from workrecap.config import AppConfig
+from workrecap.models import load_json, save_json
+
+logger = logging.getLogger(__name__)
+
+# How often from_config() sweeps expired entries (marker file mtime in the cache dir).
+PRUNE_INTERVAL_SECONDS = 24 * 60 * 60
+_PRUNE_MARKER = ".last_prune"
+
+
+class ETagCache:
+    """Stores the last ETag and response body per request URL.
+
+    GHESClient sends the stored ETag as If-None-Match; a 304 Not Modified reply
+    carries no body and does not count against the rate limit, so re-fetching
+    unchanged PRs/commits/issues reuses the cached body instead of re-downloading it.
+
+    Storage layout:
+        {cache_dir}/{sha256(key)[:2]}/{sha256(key)}.json → {"etag": ..., "body": ...}
+
+    Entries last written more than max_age_days ago are treated as misses and deleted,
+    and prune() sweeps them from disk, so the cache does not grow without bound.
+    max_age_days=0 disables expiry.
+
+    Thread-safe: each entry is written to a per-thread temp file and renamed into
+    place, so requests running concurrently on the shared client never observe a
+    partially written entry.
+    """
+
+    def __init__(self, cache_dir: Path, max_age_days: int = 30) -> None:
+        self._dir = cache_dir
+        self._max_age = max_age_days * 24 * 60 * 60
+
+    @classmethod
+    def from_config(cls, config: AppConfig) -> ETagCache | None:
+        """Build the cache from config, or None when http_cache_enabled is off.
+
+        Expired entries are swept at most once per PRUNE_INTERVAL_SECONDS.
+        """
+        if not config.http_cache_enabled:
+            return None
+        cache = cls(config.http_cache_dir, max_age_days=config.http_cache_max_age_days)
+        cache.prune_if_due()
+        return cache
+
+    def _key_to_path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self._dir / digest[:2] / f"{digest}.json"
+
+    def _expired(self, mtime: float, now: float) -> bool:
+        return self._max_age > 0 and now - mtime > self._max_age
+
+    def get(self, key: str) -> tuple[str, dict | list] | None:
+        """Return (etag, body) for a key, or None if not cached or expired."""
+        path = self._key_to_path(key)
+        try:
+            if self._expired(path.stat().st_mtime, time.time()):
+                path.unlink(missing_ok=True)
+                return None
+            entry = load_json(path)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            logger.warning("Ignoring corrupt ETag cache entry: %s", path)
+            return None
+        return entry["etag"], entry["body"]
+
+    def put(self, key: str, etag: str, body: dict | list) -> None:
+        """Persist the ETag and body for a key.
+
+        Disk errors are logged and swallowed — the cache is an optimization and
+        must never fail the request whose response is being stored.
+        """
+        path = self._key_to_path(key)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        try:
+            save_json({"etag": etag, "body": body}, tmp_path)
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning("Failed to write ETag cache entry %s: %s", path, e)
+            tmp_path.unlink(missing_ok=True)
+
+    def prune(self) -> int:
+        """Delete expired entries. Returns the number of entries removed."""
+        if self._max_age <= 0:
+            return 0
+        now = time.time()
+        removed = 0
+        try:
+            with os.scandir(self._dir) as it:
+                shards = [e.path for e in it if e.is_dir()]
+        except FileNotFoundError:
+            return 0
+        for shard in shards:
+            with os.scandir(shard) as it:
+                for entry in it:
+                    try:
+                        if self._expired(entry.stat().st_mtime, now):
+                            os.unlink(entry.path)
+                            removed += 1
+                    except FileNotFoundError:
+                        continue
+        if removed:
+            logger.info("Pruned %d expired ETag cache entries from %s", removed, self._dir)
+        return removed
+
+    def prune_if_due(self) -> None:
+        """Run prune() unless it already ran within PRUNE_INTERVAL_SECONDS."""
+        marker = self._dir / _PRUNE_MARKER
+        try:
+            if time.time() - marker.stat().st_mtime < PRUNE_INTERVAL_SECONDS:
+                return
+        except FileNotFoundError:
+            pass
+        try:
+            self.prune()
+            self._dir.mkdir(parents=True, exist_ok=True)
+            marker.touch()
+        except OSError as e:
+            logger.warning("Failed to prune ETag cache %s: %s", self._dir, e)
@@ -5,22 +5,40 @@ Resilience design follows GitHub's official rate limit guidance:
 - Secondary limits: "use exponentially increasing amount of time between retries"
 - "Continuing to make requests while rate limited may result in banning"
 - Jitter on all waits prevents thundering herd from parallel workers
+- A rate-limit wait pauses every thread sharing the client, not only the one that
+  hit the limit, so parallel workers stop bursting into an exhausted budget
 """
 
+import importlib.util
 import logging
 import random
 import threading
 import time
+from urllib.parse import urlencode
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # optional speedup (work-recap[fast]); httpx falls back to stdlib json
+    orjson = None
+
 from workrecap.exceptions import FetchError
+from workrecap.infra.etag_cache import ETagCache
 
 logger = logging.getLogger(__name__)
 
 MAX_RETRIES = 3
 BACKOFF_BASE = 2.0
 REQUEST_TIMEOUT = 30.0
+# Keep-alive pool must hold every concurrent enrich worker (config.enrich_concurrency)
+# plus the per-PR detail fan-out, otherwise surplus workers reopen TLS connections
+# or stall on pool acquisition.
+MAX_CONNECTIONS = 32
+# HTTP/2 multiplexes concurrent enrich requests over one TLS connection.
+# Needs the optional `h2` package (httpx[http2]); servers without HTTP/2 fall back
+# to HTTP/1.1 via ALPN, so enabling it is safe whenever h2 is importable.
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
 
 # Rate limit retry constants — separate from server error retries.
 # GitHub may temporarily rate-limit during bursts (common in 10-year history runs)
@@ -36,12 +54,22 @@ RATE_LIMIT_JITTER_FACTOR = 0.25  # ±25% randomization
 class GHESClient:
     """GHES REST API v3 HTTP client with retry and rate limit handling."""
 
-    def __init__(self, base_url: str, token: str, *, search_interval: float = 2.0) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        *,
+        search_interval: float = 2.0,
+        max_connections: int = MAX_CONNECTIONS,
+        etag_cache: ETagCache | None = None,
+    ) -> None:
         self._base_url = base_url.rstrip("/")
         if "api.github.com" in self._base_url:
             self._api_base = self._base_url
+            self._graphql_url = f"{self._base_url}/graphql"
         else:
             self._api_base = f"{self._base_url}/api/v3"
+            self._graphql_url = f"{self._base_url}/api/graphql"
         self._client = httpx.Client(
             base_url=self._api_base,
             headers={
@@ -49,14 +77,27 @@ class GHESClient:
                 "Accept": "application/vnd.github.v3+json",
             },
             timeout=REQUEST_TIMEOUT,
+            http2=HTTP2_ENABLED,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
         )
+        self._etag_cache = etag_cache
         self._search_interval = search_interval
         self._last_search_time: float = 0.0
         self._throttle_lock = threading.Lock()
         self._rate_limit_remaining: int | None = None
         self._rate_limit_reset: int | None = None
+        # time.monotonic() deadline until which no thread starts a new request
+        self._pause_until: float = 0.0
         self._rate_limit_lock = threading.Lock()
 
+    @property
+    def api_base(self) -> str:
+        """REST API base URL (e.g. https://ghes/api/v3)."""
+        return self._api_base
+
     def close(self) -> None:
         self._client.close()
 
@@ -79,7 +120,9 @@ class GHESClient:
 
     def get_pr(self, owner: str, repo: str, number: int) -> dict:
         """PR 상세 정보 조회."""
-        return self._request_with_retry("GET", f"/repos/{owner}/{repo}/pulls/{number}")
+        return self._request_with_retry(
+            "GET", f"/repos/{owner}/{repo}/pulls/{number}", conditional=True
+        )
 
     def get_pr_files(self, owner: str, repo: str, number: int) -> list[dict]:
         """PR 변경 파일 목록. 페이지네이션 포함."""
@@ -107,16 +150,38 @@ class GHESClient:
 
     def get_commit(self, owner: str, repo: str, sha: str) -> dict:
         """Commit 상세 정보 조회."""
-        return self._request_with_retry("GET", f"/repos/{owner}/{repo}/commits/{sha}")
+        return self._request_with_retry(
+            "GET", f"/repos/{owner}/{repo}/commits/{sha}", conditional=True
+        )
 
     def get_issue(self, owner: str, repo: str, number: int) -> dict:
         """Issue 상세 정보 조회."""
-        return self._request_with_retry("GET", f"/repos/{owner}/{repo}/issues/{number}")
+        return self._request_with_retry(
+            "GET", f"/repos/{owner}/{repo}/issues/{number}", conditional=True
+        )
 
     def get_issue_comments(self, owner: str, repo: str, number: int) -> list[dict]:
         """Issue 코멘트 목록. 페이지네이션 포함."""
         return self._paginate(f"/repos/{owner}/{repo}/issues/{number}/comments")
 
+    def graphql(self, query: str, variables: dict) -> dict:
+        """GraphQL API 호출. 응답의 data 반환, errors가 있으면 FetchError."""
+        data, errors = self.graphql_partial(query, variables)
+        if errors:
+            messages = "; ".join(e.get("message", "") for e in errors)
+            raise FetchError(f"GraphQL error: {messages}")
+        return data
+
+    def graphql_partial(self, query: str, variables: dict) -> tuple[dict, list[dict]]:
+        """GraphQL API 호출. 부분 실패를 허용해 (data, errors)를 그대로 반환.
+
+        alias로 여러 객체를 묶은 쿼리에서 일부 alias만 실패해도 나머지 결과를 쓸 수 있다.
+        """
+        result = self._request_with_retry(
+            "POST", self._graphql_url, json={"query": query, "variables": variables}
+        )
+        return result.get("data") or {}, result.get("errors") or []
+
     # ── Internal ──
 
     def _throttle_search(self) -> None:
@@ -141,6 +206,9 @@ class GHESClient:
         path: str,
         params: dict | None = None,
         extra_headers: dict | None = None,
+        *,
+        json: dict | None = None,
+        conditional: bool = False,
     ) -> dict | list:
         """Execute HTTP request with separate retry budgets for rate limits vs server errors.
 
@@ -151,19 +219,38 @@ class GHESClient:
         Counters are independent: a request can survive up to 10 total attempts
         (7 rate limit + 3 server error), enabling resilient ~4,000-day historical runs
         where transient rate limits are common but shouldn't poison server error budget.
+
+        With conditional=True and an ETag cache configured, the cached ETag is sent as
+        If-None-Match and a 304 Not Modified reply returns the cached body.
         """
         last_error: Exception | None = None
         rate_limit_attempts = 0
         server_error_attempts = 0
+        # Pause deadline this thread already slept through after its own rate limit
+        slept_until = 0.0
+
+        cache_key: str | None = None
+        cached: tuple[str, dict | list] | None = None
+        headers = extra_headers
+        if conditional and self._etag_cache is not None:
+            cache_key = f"{self._api_base}{path}?{urlencode(sorted((params or {}).items()))}"
+            cached = self._etag_cache.get(cache_key)
+            if cached is not None:
+                headers = {**(extra_headers or {}), "If-None-Match": cached[0]}
 
         while True:
+            # Re-checked on every attempt: another thread may have hit the limit
+            # while this one was backing off from a 5xx, a network error or its own
+            # rate limit (then only an extension past slept_until is waited for).
+            self._wait_for_pause(slept_until)
             try:
                 logger.debug("Request: %s %s params=%s", method, path, params)
                 response = self._client.request(
                     method,
                     path,
                     params=params,
-                    headers=extra_headers,
+                    headers=headers,
+                    json=json,
                 )
                 logger.debug("Response: %s %s → %d", method, path, response.status_code)
 
@@ -180,12 +267,17 @@ class GHESClient:
                         RATE_LIMIT_MAX_RETRIES,
                     )
                     if rate_limit_attempts <= RATE_LIMIT_MAX_RETRIES:
+                        slept_until = self._pause_all(wait)
                         time.sleep(wait)
                         continue
                     raise FetchError(
                         f"Rate limit exceeded after {RATE_LIMIT_MAX_RETRIES} retries: {path}"
                     )
 
+                if response.status_code == 304 and cached is not None:
+                    self._track_rate_limit(response)
+                    return cached[1]
+
                 if response.status_code >= 500:
                     server_error_attempts += 1
                     logger.warning(
@@ -208,7 +300,12 @@ class GHESClient:
                     )
 
                 self._track_rate_limit(response)
-                return response.json()
+                # PR/commit detail bodies can be hundreds of KB; orjson decodes them in C
+                data = orjson.loads(response.content) if orjson is not None else response.json()
+                etag = response.headers.get("ETag")
+                if cache_key is not None and etag:
+                    self._etag_cache.put(cache_key, etag, data)
+                return data
 
             except httpx.HTTPError as e:
                 server_error_attempts += 1
@@ -261,12 +358,39 @@ class GHESClient:
                     remaining,
                     wait,
                 )
+                self._pause_all(wait)
                 time.sleep(wait)
             else:
                 logger.warning("Rate limit critical: %d remaining, no reset header", remaining)
         elif remaining < 100:
             logger.warning("Rate limit low: %d remaining", remaining)
 
+    def _pause_all(self, wait: float) -> float:
+        """Hold back new requests from every thread for the next `wait` seconds.
+
+        The calling thread sleeps on its own; others block in _wait_for_pause
+        instead of each discovering the limit with a request of their own.
+        Returns the resulting shared deadline.
+        """
+        with self._rate_limit_lock:
+            self._pause_until = max(self._pause_until, time.monotonic() + wait)
+            return self._pause_until
+
+    def _wait_for_pause(self, slept_until: float = 0.0) -> None:
+        """Sleep until a pause set by _pause_all (from any thread) has elapsed.
+
+        A caller that already slept through its own pause passes that deadline as
+        `slept_until`; it then only waits if another thread pushed the deadline later,
+        so a rate-limited retry sleeps once instead of again for the leftover.
+        """
+        with self._rate_limit_lock:
+            if self._pause_until <= slept_until:
+                return
+            wait = self._pause_until - time.monotonic()
+        if wait > 0:
+            logger.debug("Rate limit pause: sleeping %.1fs", wait)
+            time.sleep(wait)
+
     @staticmethod
     def _is_rate_limit_403(response: httpx.Response) -> bool:
         """Detect GitHub 403 responses that indicate rate limiting."""
@@ -296,7 +420,7 @@ class GHESClient:
         3. Exponential backoff min(2^attempt, 300s) — safe fallback
 
         All values get ±25% jitter to prevent thundering herd when multiple
-        parallel workers (GHESClientPool) hit rate limits simultaneously.
+        parallel enrich workers hit rate limits simultaneously.
         The minimum wait is always 1 second to avoid busy-spinning.
         """
         # Tier 1: Retry-After header
@@ -328,7 +452,7 @@ class GHESClient:
 
         while True:
             response_data = self._request_with_retry(
-                "GET", path, params={"page": page, "per_page": per_page}
+                "GET", path, params={"page": page, "per_page": per_page}, conditional=True
             )
 
             if isinstance(response_data, list):
@@ -0,0 +1,271 @@
+"""GHES GraphQL queries for PR/issue enrichment.
+
+One GraphQL query returns a PR's detail, labels, conversation comments, reviews and
+review comments — data that takes 5+ REST calls (detail, review comments, issue
+comments, reviews, each paginated). The converters below reshape the GraphQL nodes
+into the REST payload shapes FetcherService already consumes, so noise filtering and
+Raw model conversion are shared by both paths.
+
+File patches are not exposed by GraphQL (PullRequestChangedFile has no patch),
+so PR files still come from the REST files endpoint.
+"""
+
+from operator import itemgetter
+
+_AUTHOR = "author { __typename login }"
+
+PR_FIELDS_FRAGMENT = f"""
+fragment PRFields on PullRequest {{
+  number title body url state merged createdAt updatedAt mergedAt
+  {_AUTHOR}
+  labels(first: 100) {{ nodes {{ name }} }}
+  comments(first: 100) {{
+    pageInfo {{ hasNextPage }}
+    nodes {{ {_AUTHOR} body createdAt url }}
+  }}
+  reviews(first: 100) {{
+    pageInfo {{ hasNextPage }}
+    nodes {{
+      {_AUTHOR} state body submittedAt url
+      comments(first: 100) {{
+        pageInfo {{ hasNextPage }}
+        nodes {{ {_AUTHOR} body createdAt url path line originalLine diffHunk }}
+      }}
+    }}
+  }}
+}}
+"""
+
+PR_ENRICH_QUERY = (
+    """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) { ...PRFields }
+  }
+}
+"""
+    + PR_FIELDS_FRAGMENT
+)
+
+# Aliased PRs per batch query: replaces N requests with ceil(N/25). PRFields can
+# request up to ~10k nodes per PR (100 reviews x 100 comments), so 25 PRs stay around
+# 260k — under GitHub's 500k node limit and short enough to avoid query timeouts.
+PR_BATCH_SIZE = 25
+
+# Default budget of *returned* nodes per batch (see estimate_pr_nodes). The 500k limit
+# is computed statically from first: arguments, but response time and abuse detection
+# track the data actually returned, so comment-heavy PRs get smaller batches.
+PR_BATCH_NODE_BUDGET = 2_500
+
+
+def estimate_pr_nodes(item: dict) -> int:
+    """Estimate nodes a PR returns from its search result item.
+
+    Search items carry the conversation comment count; review comments usually
+    scale with it, hence the per-comment weight above 1.
+    """
+    return 50 + 3 * (item.get("comments") or 0)
+
+
+def pack_pr_batches(
+    items: list, *, budget: int = PR_BATCH_NODE_BUDGET, max_size: int = PR_BATCH_SIZE
+) -> list[list]:
+    """Greedily pack (key, search item) pairs into batches under the node budget.
+
+    A single PR above the budget still gets a batch of its own.
+    """
+    batches: list[list] = []
+    current: list = []
+    current_nodes = 0
+    for entry in items:
+        nodes = estimate_pr_nodes(entry[1])
+        if current and (current_nodes + nodes > budget or len(current) >= max_size):
+            batches.append(current)
+            current, current_nodes = [], 0
+        current.append(entry)
+        current_nodes += nodes
+    if current:
+        batches.append(current)
+    return batches
+
+
+def build_pr_batch_query(refs: list[tuple[str, str, int]]) -> tuple[str, dict]:
+    """Build one query fetching several PRs under aliases pr0, pr1, ...
+
+    Returns (query, variables). Values are passed as variables so owner/repo names
+    never need escaping inside the query text.
+    """
+    params: list[str] = []
+    fields: list[str] = []
+    variables: dict = {}
+    for i, (owner, repo, number) in enumerate(refs):
+        params.append(f"$o{i}: String!, $r{i}: String!, $n{i}: Int!")
+        fields.append(
+            f"  pr{i}: repository(owner: $o{i}, name: $r{i}) "
+            f"{{ pullRequest(number: $n{i}) {{ ...PRFields }} }}"
+        )
+        variables.update({f"o{i}": owner, f"r{i}": repo, f"n{i}": number})
+    # rateLimit costs nothing extra and reports the batch's actual point cost
+    fields.append("  rateLimit { cost remaining }")
+    query = "query(" + ", ".join(params) + ") {\n" + "\n".join(fields) + "\n}\n"
+    return query + PR_FIELDS_FRAGMENT, variables
+
+
+_PR_SEARCH_NODE = (
+    "... on PullRequest { number title url createdAt updatedAt "
+    "repository { nameWithOwner } comments { totalCount } }"
+)
+
+
+def build_pr_search_query(searches: list[tuple[str, str, str | None]]) -> tuple[str, dict]:
+    """Build one query running several PR searches under their own aliases.
+
+    searches holds (alias, search query, after cursor or None). Each search is
+    paginated independently, so a follow-up query only needs the aliases that
+    still have a next page. Returns (query, variables).
+    """
+    params: list[str] = []
+    fields: list[str] = []
+    variables: dict = {}
+    for alias, search, cursor in searches:
+        params.append(f"$q_{alias}: String!, $c_{alias}: String")
+        fields.append(
+            f"  {alias}: search(query: $q_{alias}, type: ISSUE, first: 100, after: $c_{alias}) "
+            f"{{ pageInfo {{ hasNextPage endCursor }} nodes {{ {_PR_SEARCH_NODE} }} }}"
+        )
+        variables.update({f"q_{alias}": search, f"c_{alias}": cursor})
+    fields.append("  rateLimit { cost remaining }")
+    return "query(" + ", ".join(params) + ") {\n" + "\n".join(fields) + "\n}\n", variables
+
+
+ISSUE_ENRICH_QUERY = f"""
+query($owner: String!, $name: String!, $number: Int!) {{
+  repository(owner: $owner, name: $name) {{
+    issue(number: $number) {{
+      number title body url state createdAt updatedAt closedAt
+      {_AUTHOR}
+      labels(first: 100) {{ nodes {{ name }} }}
+      comments(first: 100) {{
+        pageInfo {{ hasNextPage }}
+        nodes {{ {_AUTHOR} body createdAt url }}
+      }}
+    }}
+  }}
+}}
+"""
+
+
+def _login(author: dict | None) -> str:
+    """GraphQL author → REST login.
+
+    REST reports bot accounts as "name[bot]" and deleted accounts as "ghost";
+    GraphQL returns the bare bot name and a null author respectively.
+    """
+    if author is None:
+        return "ghost"
+    if author.get("__typename") == "Bot":
+        return f"{author['login']}[bot]"
+    return author["login"]
+
+
+def _comment_to_rest(node: dict) -> dict:
+    return {
+        "user": {"login": _login(node.get("author"))},
+        "body": node.get("body") or "",
+        "created_at": node["createdAt"],
+        "html_url": node["url"],
+        "path": node.get("path"),
+        "line": node.get("line"),
+        "original_line": node.get("originalLine"),
+        "diff_hunk": node.get("diffHunk"),
+    }
+
+
+def pr_to_rest(node: dict, api_url: str) -> tuple[dict, list[dict] | None, list[dict] | None]:
+    """PullRequest node → (REST PR detail, REST comments, REST reviews).
+
+    comments/reviews are None when a connection was truncated at 100 nodes;
+    the caller should fetch that part over REST instead.
+    """
+    detail = {
+        "html_url": node["url"],
+        "url": api_url,
+        "number": node["number"],
+        "title": node["title"],
+        "body": node.get("body") or "",
+        "state": "open" if node["state"] == "OPEN" else "closed",
+        "merged": node.get("merged", False),
+        "created_at": node["createdAt"],
+        "updated_at": node["updatedAt"],
+        "merged_at": node.get("mergedAt"),
+        "labels": node["labels"]["nodes"],
+        "user": {"login": _login(node.get("author"))},
+    }
+
+    review_conn = node["reviews"]
+    truncated_reviews = review_conn["pageInfo"]["hasNextPage"] or any(
+        r["comments"]["pageInfo"]["hasNextPage"] for r in review_conn["nodes"]
+    )
+    if truncated_reviews or node["comments"]["pageInfo"]["hasNextPage"]:
+        return detail, None, None
+
+    # Same order as REST get_pr_comments: review comments (by creation) + issue comments
+    review_comments = sorted(
+        (c for r in review_conn["nodes"] for c in r["comments"]["nodes"]),
+        key=itemgetter("createdAt"),
+    )
+    comments = [_comment_to_rest(c) for c in review_comments]
+    comments.extend(_comment_to_rest(c) for c in node["comments"]["nodes"])
+
+    reviews = [
+        {
+            "user": {"login": _login(r.get("author"))},
+            "state": r["state"],
+            "body": r.get("body") or "",
+            "submitted_at": r.get("submittedAt"),
+            "html_url": r["url"],
+        }
+        for r in review_conn["nodes"]
+    ]
+    return detail, comments, reviews
+
+
+def issue_to_rest(node: dict, api_url: str) -> tuple[dict, list[dict] | None]:
+    """Issue node → (REST issue detail, REST comments or None if truncated)."""
+    detail = {
+        "html_url": node["url"],
+        "url": api_url,
+        "number": node["number"],
+        "title": node["title"],
+        "body": node.get("body") or "",
+        "state": "open" if node["state"] == "OPEN" else "closed",
+        "created_at": node["createdAt"],
+        "updated_at": node["updatedAt"],
+        "closed_at": node.get("closedAt"),
+        "labels": node["labels"]["nodes"],
+        "user": {"login": _login(node.get("author"))},
+    }
+    if node["comments"]["pageInfo"]["hasNextPage"]:
+        return detail, None
+    return detail, [_comment_to_rest(c) for c in node["comments"]["nodes"]]
+
+
+def pr_search_item(node: dict, api_base: str) -> dict:
+    """PullRequest search node → REST search/issues item.
+
+    Only the fields FetcherService reads from search results are filled in;
+    API URLs are rebuilt from the repository name so they match REST exactly.
+    """
+    repo_url = f"{api_base}/repos/{node['repository']['nameWithOwner']}"
+    number = node["number"]
+    return {
+        "url": f"{repo_url}/issues/{number}",
+        "html_url": node["url"],
+        "number": number,
+        "title": node["title"],
+        "created_at": node["createdAt"],
+        "updated_at": node["updatedAt"],
+        "repository_url": repo_url,
+        "comments": node["comments"]["totalCount"],
+        "pull_request": {"url": f"{repo_url}/pulls/{number}"},
+    }
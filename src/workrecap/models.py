@@ -1,15 +1,28 @@
 """서비스 간 데이터 교환을 위한 데이터 모델 및 직렬화 유틸리티."""
 
 import json
-from dataclasses import asdict, dataclass, field
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, is_dataclass
 from enum import Enum
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson은 선택적 가속 — 없으면 stdlib json 사용
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson은 선택적 — 없으면 전체 로드 후 순회
+    ijson = None
+
 
 # ── Fetcher 출력 모델 ──
+# enrich 단계에서 수천 개씩 생성되므로 slots로 인스턴스 __dict__를 없앤다.
 
 
-@dataclass
+@dataclass(slots=True)
 class FileChange:
     """PR에서 변경된 개별 파일."""
 
@@ -20,7 +33,7 @@ class FileChange:
     patch: str = ""  # unified diff text
 
 
-@dataclass
+@dataclass(slots=True)
 class Comment:
     """PR에 달린 코멘트."""
 
@@ -33,7 +46,7 @@ class Comment:
     diff_hunk: str = ""  # 코멘트 주변 diff 컨텍스트
 
 
-@dataclass
+@dataclass(slots=True)
 class Review:
     """PR 리뷰."""
 
@@ -44,7 +57,7 @@ class Review:
     url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PRRaw:
     """Fetcher가 수집한 PR 원시 데이터."""
 
@@ -66,7 +79,7 @@ class PRRaw:
     reviews: list[Review] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class CommitRaw:
     """Fetcher가 수집한 Commit 원시 데이터."""
 
@@ -80,7 +93,7 @@ class CommitRaw:
     files: list[FileChange] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class IssueRaw:
     """Fetcher가 수집한 Issue 원시 데이터."""
 
@@ -121,7 +134,9 @@ class ActivityKind(str, Enum):
     JIRA_TICKET_COMMENTED = "jira_ticket_commented"
 
 
-@dataclass
+# 정규화/요약 단계에서 대량 생성되므로 raw 모델과 같이 slots 사용.
+# enrichment가 change_summary/intent를 채우므로 frozen은 아님
+@dataclass(slots=True)
 class Activity:
     """정규화된 단일 활동 레코드."""
 
@@ -270,17 +285,70 @@ def _serialize(obj):
     raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
 
+def _to_payload(data):
+    """dataclass / list[dataclass]를 JSON 호환 객체로 변환. 그 외는 그대로."""
+    if isinstance(data, list):
+        return [asdict(d) if is_dataclass(d) else d for d in data]
+    return asdict(data) if is_dataclass(data) else data
+
+
 def save_json(data, path: Path) -> None:
-    """dataclass 또는 list[dataclass]를 JSON으로 저장."""
+    """dataclass, list[dataclass] 또는 JSON 호환 객체를 JSON으로 저장.
+
+    orjson이 설치되어 있으면 dataclass/enum을 직접 bytes로 직렬화한다.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    payload = asdict(data) if not isinstance(data, list) else [asdict(d) for d in data]
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
     with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2, default=_serialize)
+        json.dump(_to_payload(data), f, ensure_ascii=False, indent=2, default=_serialize)
+
+
+def _dumps_indented(data) -> bytes:
+    """save_json과 같은 형식(indent=2)의 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    text = json.dumps(_to_payload(data), ensure_ascii=False, indent=2, default=_serialize)
+    return text.encode("utf-8")
+
+
+@contextmanager
+def save_json_stream(path: Path) -> Iterator[Callable[[object], None]]:
+    """JSON 배열을 원소 단위로 기록하는 writer 함수를 제공.
+
+    결과는 save_json(list, path)와 같지만 전체 list를 메모리에 둘 필요가 없다.
+    임시 파일에 쓰고 정상 종료 시에만 path로 교체하므로, 중간에 실패하면 기존 파일이 유지된다.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    count = 0
+    try:
+        with open(tmp_path, "wb") as f:
+
+            def write(item) -> None:
+                nonlocal count
+                f.write(b",\n  " if count else b"[\n  ")
+                f.write(_dumps_indented(item).replace(b"\n", b"\n  "))
+                count += 1
+
+            yield write
+            f.write(b"\n]" if count else b"[]")
+        tmp_path.replace(path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
 
 def save_jsonl(items: list, path: Path) -> None:
-    """list[dataclass]를 JSONL로 저장."""
+    """list[dataclass]를 JSONL로 저장.
+
+    orjson이 설치되어 있으면 asdict() 없이 라인별 bytes로 직렬화해 한 번에 기록한다.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        dumps, opt = orjson.dumps, orjson.OPT_APPEND_NEWLINE
+        path.write_bytes(b"".join([dumps(item, option=opt) for item in items]))
+        return
     with open(path, "w", encoding="utf-8") as f:
         for item in items:
             line = json.dumps(asdict(item), ensure_ascii=False, default=_serialize)
@@ -289,18 +357,33 @@ def save_jsonl(items: list, path: Path) -> None:
 
 def load_json(path: Path) -> dict | list:
     """JSON 파일 로드."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
+def iter_json_items(path: Path) -> Iterator:
+    """JSON 배열 파일의 원소를 하나씩 yield.
+
+    ijson이 설치되어 있으면 파일 전체를 Python 객체로 올리지 않고 스트리밍 파싱한다.
+    """
+    if ijson is None:
+        yield from load_json(path)
+        return
+    with open(path, "rb") as f:
+        yield from ijson.items(f, "item", use_float=True)
+
+
 def load_jsonl(path: Path) -> list[dict]:
     """JSONL 파일 로드. 각 라인을 dict로 반환."""
+    loads = orjson.loads if orjson is not None else json.loads
     items = []
-    with open(path, "r", encoding="utf-8") as f:
+    with open(path, "rb") as f:
         for line in f:
             line = line.strip()
             if line:
-                items.append(json.loads(line))
+                items.append(loads(line))
     return items
 
 
@@ -1,11 +1,11 @@
 """스케줄러 실행 이력 관리 -- JSON 파일 기반."""
 
-import json
 import logging
 import threading
 from dataclasses import asdict
 from pathlib import Path
 
+from workrecap.models import load_json, save_json
 from workrecap.scheduler.notifier import SchedulerEvent
 
 logger = logging.getLogger(__name__)
@@ -22,13 +22,10 @@ class SchedulerHistory:
     def _load(self) -> list[dict]:
         if not self._path or not self._path.exists():
             return []
-        with open(self._path) as f:
-            return json.load(f)
+        return load_json(self._path)
 
     def _save(self, entries: list[dict]) -> None:
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self._path, "w") as f:
-            json.dump(entries, f, ensure_ascii=False, indent=2)
+        save_json(entries, self._path)
 
     def record(self, event: SchedulerEvent) -> None:
         with self._lock:
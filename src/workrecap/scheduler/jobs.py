@@ -15,6 +15,7 @@ logger = logging.getLogger(__name__)
 
 def _build_orchestrator(config: AppConfig, schedule_config: ScheduleConfig):
     """Build full pipeline orchestrator (fetch->normalize->summarize)."""
+    from workrecap.infra.etag_cache import ETagCache
     from workrecap.infra.ghes_client import GHESClient
     from workrecap.infra.llm_router import LLMRouter
     from workrecap.infra.pricing import PricingTable
@@ -27,7 +28,12 @@ def _build_orchestrator(config: AppConfig, schedule_config: ScheduleConfig):
     from workrecap.services.orchestrator import OrchestratorService
     from workrecap.services.summarizer import SummarizerService
 
-    ghes = GHESClient(config.ghes_url, config.ghes_token, search_interval=2.0)
+    ghes = GHESClient(
+        config.ghes_url,
+        config.ghes_token,
+        search_interval=2.0,
+        etag_cache=ETagCache.from_config(config),
+    )
     pc = ProviderConfig(config.provider_config_path)
     tracker = UsageTracker(pricing=PricingTable())
     llm = LLMRouter(pc, usage_tracker=tracker)
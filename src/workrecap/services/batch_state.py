@@ -6,12 +6,13 @@ instead of re-submitting.
 
 from __future__ import annotations
 
-import json
 import logging
 import threading
 from datetime import datetime, timezone
 from pathlib import Path
 
+from workrecap.models import load_json, save_json
+
 logger = logging.getLogger(__name__)
 
 _TERMINAL_STATUSES = {"completed", "failed", "expired"}
@@ -76,16 +77,12 @@ class BatchStateStore:
     def _load(self) -> None:
         if self._path.exists():
             try:
-                self._data = json.loads(self._path.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, OSError) as e:
+                self._data = load_json(self._path)
+            except (ValueError, OSError) as e:
                 logger.warning("Failed to load batch state from %s: %s", self._path, e)
                 self._data = {}
         else:
             self._data = {}
 
     def _persist(self) -> None:
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._path.write_text(
-            json.dumps(self._data, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        save_json(self._data, self._path)
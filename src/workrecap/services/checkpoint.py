@@ -1,28 +1,34 @@
 """Thread-safe checkpoint update utility."""
 
-import json
 import logging
 import threading
 from pathlib import Path
 
+from workrecap.models import load_json, save_json
+
 logger = logging.getLogger(__name__)
 
 _lock = threading.Lock()
 
 
 def update_checkpoint(cp_path: Path, key: str, value: str) -> None:
-    """Atomically read-modify-write a checkpoint key. Thread-safe."""
-    with _lock:
-        cp_path.parent.mkdir(parents=True, exist_ok=True)
+    """Atomically read-modify-write a checkpoint key. Thread-safe.
 
+    The new content is written to a temp file and renamed over the checkpoint, so a
+    crash mid-write never leaves a truncated checkpoints file behind.
+    """
+    with _lock:
         checkpoints: dict = {}
         if cp_path.exists():
-            with open(cp_path, encoding="utf-8") as f:
-                checkpoints = json.load(f)
+            checkpoints = load_json(cp_path)
 
         existing = checkpoints.get(key, "")
         if value > existing:
             checkpoints[key] = value
-            with open(cp_path, "w", encoding="utf-8") as f:
-                json.dump(checkpoints, f, indent=2)
+            tmp_path = cp_path.with_name(cp_path.name + ".tmp")
+            try:
+                save_json(checkpoints, tmp_path)
+                tmp_path.replace(cp_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
             logger.debug("Checkpoint updated: %s = %s", key, value)
@@ -1,11 +1,12 @@
 """Per-date timestamp state for staleness detection and cascade reprocessing."""
 
-import json
 import logging
 import threading
 from datetime import date, datetime, timezone
 from pathlib import Path
 
+from workrecap.models import load_json, save_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,16 +27,13 @@ class DailyStateStore:
     def _load(self) -> dict:
         if self._data is None:
             if self._path.exists():
-                with open(self._path, encoding="utf-8") as f:
-                    self._data = json.load(f)
+                self._data = load_json(self._path)
             else:
                 self._data = {}
         return self._data
 
     def _save(self) -> None:
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self._path, "w", encoding="utf-8") as f:
-            json.dump(self._data, f, indent=2)
+        save_json(self._data, self._path)
 
     def get_timestamp(self, phase: str, date_str: str) -> datetime | None:
         """Return the stored timestamp for a phase+date, or None. Thread-safe."""
@@ -58,6 +56,20 @@ class DailyStateStore:
             logger.debug("set_timestamp: %s %s → %s", phase, date_str, ts.isoformat())
             self._save()
 
+    def set_timestamps(self, phase: str, dates: list[str], ts: datetime | None = None) -> None:
+        """Set the same timestamp for several dates and persist once. Thread-safe."""
+        if not dates:
+            return
+        with self._lock:
+            data = self._load()
+            if ts is None:
+                ts = datetime.now(timezone.utc)
+            ts_str = ts.isoformat()
+            for date_str in dates:
+                data.setdefault(date_str, {})[phase] = ts_str
+            logger.debug("set_timestamps: %s %d dates → %s", phase, len(dates), ts_str)
+            self._save()
+
     def is_fetch_stale(self, date_str: str) -> bool:
         """Fetch is stale if no record OR fetched_at.date() <= target_date."""
         fetch_ts = self.get_timestamp("fetch", date_str)
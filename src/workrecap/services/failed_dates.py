@@ -14,13 +14,14 @@ Solution: FailedDateStore persists per-date failure info to JSON, enabling:
 Follows the same pattern as DailyStateStore: JSON file, threading.RLock, _load/_save.
 """
 
-import json
 import logging
 import re
 import threading
 from datetime import datetime, timezone
 from pathlib import Path
 
+from workrecap.models import load_json, save_json
+
 logger = logging.getLogger(__name__)
 
 # Pattern for HTTP status codes in error messages from FetchError
@@ -80,16 +81,13 @@ class FailedDateStore:
     def _load(self) -> dict:
         if self._data is None:
             if self._path.exists():
-                with open(self._path, encoding="utf-8") as f:
-                    self._data = json.load(f)
+                self._data = load_json(self._path)
             else:
                 self._data = {}
         return self._data
 
     def _save(self) -> None:
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self._path, "w", encoding="utf-8") as f:
-            json.dump(self._data, f, indent=2)
+        save_json(self._data, self._path)
 
     def record_failure(
         self, date_str: str, phase: str, error: str, *, permanent: bool = False
@@ -5,6 +5,11 @@ import logging
 import shutil
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson은 선택적 가속 — 없으면 stdlib json 사용
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,6 +19,10 @@ class FetchProgressStore:
 
     Storage layout:
         {progress_dir}/{sanitized_chunk_key}.json
+
+    Entries are compact JSON (no indentation) written and read as bytes, using
+    orjson when installed. Chunks can hold thousands of search items, so this keeps
+    resume cheap without adding a serialization dependency.
     """
 
     def __init__(self, progress_dir: Path) -> None:
@@ -28,8 +37,10 @@ class FetchProgressStore:
         """Persist search results for a chunk."""
         self._dir.mkdir(parents=True, exist_ok=True)
         path = self._key_to_path(chunk_key)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(buckets, f)
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(buckets))
+        else:
+            path.write_bytes(json.dumps(buckets, separators=(",", ":")).encode("utf-8"))
         logger.debug("Saved chunk search: %s → %s", chunk_key, path)
 
     def load_chunk_search(self, chunk_key: str) -> dict | None:
@@ -37,8 +48,8 @@ class FetchProgressStore:
         path = self._key_to_path(chunk_key)
         if not path.exists():
             return None
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
+        raw = path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         logger.debug("Loaded chunk search: %s", chunk_key)
         return data
 
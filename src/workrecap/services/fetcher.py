@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
-from collections.abc import Callable
+import threading
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+from itertools import chain
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from workrecap.infra.client_pool import GHESClientPool
     from workrecap.services.daily_state import DailyStateStore
     from workrecap.services.failed_dates import FailedDateStore
     from workrecap.services.fetch_progress import FetchProgressStore
@@ -17,6 +24,16 @@ if TYPE_CHECKING:
 from workrecap.config import AppConfig
 from workrecap.exceptions import FetchError
 from workrecap.infra.ghes_client import GHESClient
+from workrecap.infra.ghes_graphql import (
+    ISSUE_ENRICH_QUERY,
+    PR_ENRICH_QUERY,
+    build_pr_batch_query,
+    build_pr_search_query,
+    issue_to_rest,
+    pack_pr_batches,
+    pr_search_item,
+    pr_to_rest,
+)
 from workrecap.services.date_utils import date_range, monthly_chunks
 from workrecap.models import (
     Comment,
@@ -25,19 +42,64 @@ from workrecap.models import (
     IssueRaw,
     PRRaw,
     Review,
-    save_json,
+    save_json_stream,
 )
 
 logger = logging.getLogger(__name__)
 
-DEFAULT_NOISE_PATTERNS = [
-    re.compile(r"^LGTM!?$", re.IGNORECASE),
-    re.compile(r"^\+1$"),
-    re.compile(r"^:shipit:$"),
-    re.compile(r"^Ship it!?$", re.IGNORECASE),
-]
+# 노이즈 코멘트는 짧은 정형 문구뿐이라 regex 대신 set 조회 한 번으로 판정한다.
+# 대소문자 무시는 LGTM / Ship it에만 적용 — casefold 결과로 조회.
+NOISE_EXACT = frozenset({"+1", ":shipit:"})
+NOISE_CASEFOLD = frozenset({"lgtm", "lgtm!", "ship it", "ship it!"})
+# 이보다 긴 본문은 noise 문구일 수 없다 (casefold는 길이를 줄이지 않음) — 대부분의 실제
+# 코멘트는 여기서 걸러져 본문 전체 hash/casefold 복사를 하지 않는다.
+NOISE_MAX_LEN = max(map(len, NOISE_EXACT | NOISE_CASEFOLD))
+
+# 소문자 tuple — str.endswith(tuple) 한 번으로 검사.
+BOT_SUFFIXES = ("[bot]", "-bot")
+
+
+# API URL → (owner, repo, number). split/index 대신 match 한 번 (끝의 "/"는 허용).
+PR_URL_RE = re.compile(r"/repos/([^/]+)/([^/]+)/pulls/(\d+)/?$")
+ISSUE_URL_RE = re.compile(r"/repos/([^/]+)/([^/]+)/issues/(\d+)/?$")
+
+# Search API: 페이지당 최대 100건, 쿼리당 최대 1000건까지만 조회 가능.
+SEARCH_PAGE_SIZE = 100
+SEARCH_RESULT_LIMIT = 1000
+SEARCH_MAX_PAGE = SEARCH_RESULT_LIMIT // SEARCH_PAGE_SIZE
+# 동시에 in-flight 상태로 둘 search 페이지 수 (GHESClient throttle이 시작 간격을 보장)
+SEARCH_PREFETCH_PAGES = 2
+
+# PR 하나의 detail/files/comments/reviews 조회는 서로 독립이라 동시에 실행한다.
+# enrich 스레드가 이 pool에 제출하고 대기하므로 enrich pool과 분리해야 deadlock이 없다.
+# 크기가 곧 동시 detail 요청 상한 → GHESClient keep-alive pool 안에 머문다.
+_PR_DETAIL_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="pr-detail")
+
+# 검색 결과가 없는 날짜가 공유하는 읽기 전용 bucket — 날짜마다 dict를 새로 만들지 않는다.
+# 빈 날짜도 저장은 건너뛰지 않는다: 빈 prs.json이 "fetch 완료" 표시이고, 이전 run의
+# commits/issues 파일도 비워야 한다.
+_EMPTY_BUCKET = MappingProxyType({"prs": {}, "commits": [], "issues": {}})
+
 
-BOT_SUFFIXES = ["[bot]", "-bot"]
+@functools.lru_cache(maxsize=4096)
+def _is_bot_login(login: str) -> bool:
+    """bot 계정 여부. 같은 login(dependabot[bot] 등)이 코멘트/리뷰마다 반복되므로 결과 캐시.
+
+    cache hit이면 lower() 문자열 할당과 endswith 검사가 dict 조회 한 번으로 줄어든다.
+    """
+    return login.lower().endswith(BOT_SUFFIXES)
+
+
+def _login_of(entry: dict) -> str:
+    """코멘트/리뷰 작성자 login. user가 없거나 null이면 "".
+
+    user는 거의 항상 있으므로 .get("user", {}) 체인(매번 빈 dict 생성) 대신 subscript로
+    읽고 드문 예외만 처리한다.
+    """
+    try:
+        return entry["user"]["login"]
+    except (KeyError, TypeError):
+        return ""
 
 
 class FetcherService:
@@ -47,7 +109,6 @@ class FetcherService:
         ghes_client: GHESClient,
         daily_state: "DailyStateStore | None" = None,
         max_workers: int = 1,
-        client_pool: "GHESClientPool | None" = None,
         progress_store: "FetchProgressStore | None" = None,
         failed_date_store: "FailedDateStore | None" = None,
         repos: list[str] | None = None,
@@ -57,10 +118,17 @@ class FetcherService:
         self._username = config.username
         self._daily_state = daily_state
         self._max_workers = max_workers
-        self._client_pool = client_pool
+        self._enrich_concurrency = max(1, config.enrich_concurrency)
+        self._graphql_enrich = config.graphql_enrich
+        self._graphql_batch_node_budget = config.graphql_batch_node_budget
+        self._graphql_search = config.graphql_search
+        self._search_or_axes = config.search_or_axes
         self._progress_store = progress_store
         self._failed_date_store = failed_date_store
         self._repos = repos or []
+        self._checkpoint_lock = threading.Lock()
+        self._pending_checkpoint: str | None = None
+        self._pending_fetched: list[str] = []
 
     @property
     def source_name(self) -> str:
@@ -92,25 +160,22 @@ class FetcherService:
         if "prs" in active:
             pr_map = self._search_prs(target_date)
             logger.info("Found %d PRs for %s", len(pr_map), target_date)
-            prs: list[PRRaw] = []
-            for pr_api_url, pr_basic in pr_map.items():
-                try:
-                    logger.debug("Enriching PR %s", pr_api_url)
-                    enriched = self._enrich(pr_basic)
-                    prs.append(enriched)
-                except FetchError:
-                    logger.warning("Failed to enrich PR %s, skipping", pr_api_url)
-            results["prs"] = self._save(target_date, prs)
+            # enrich 결과는 완료되는 대로 파일에 한 건씩 기록된다 (날짜 전체 list를 두지 않음)
+            results["prs"] = self._save(target_date, self._enrich_prs_concurrent(pr_map))
 
         if "commits" in active:
-            commits = self._fetch_commits(target_date)
-            logger.info("Found %d commits for %s", len(commits), target_date)
-            results["commits"] = self._save_commits(target_date, commits)
+            commit_items = self._search_commits(target_date)
+            logger.info("Found %d commits for %s", len(commit_items), target_date)
+            results["commits"] = self._save_commits(
+                target_date, self._enrich_commits_concurrent(commit_items)
+            )
 
         if "issues" in active:
-            issues = self._fetch_issues(target_date)
-            logger.info("Found %d issues for %s", len(issues), target_date)
-            results["issues"] = self._save_issues(target_date, issues)
+            issue_map = self._search_issues(target_date)
+            logger.info("Found %d issues for %s", len(issue_map), target_date)
+            results["issues"] = self._save_issues(
+                target_date, self._enrich_issues_concurrent(issue_map)
+            )
 
         self._update_checkpoint(target_date)
 
@@ -125,7 +190,24 @@ class FetcherService:
         force: bool = False,
         progress: Callable[[str], None] | None = None,
     ) -> list[dict]:
-        """월 단위 chunk 검색 → 날짜별 enrich/save. 실패 시 계속 진행."""
+        """월 단위 chunk 검색 → 날짜별 enrich/save. 실패 시 계속 진행.
+
+        checkpoint와 daily_state는 날짜마다 read-modify-write 하지 않고 메모리에 누적했다가
+        chunk가 끝날 때 한 번씩 기록한다 (예외로 중단돼도 finally에서 flush).
+        """
+        try:
+            return self._fetch_range_chunks(since, until, types, force, progress)
+        finally:
+            self._flush_checkpoint()
+
+    def _fetch_range_chunks(
+        self,
+        since: str,
+        until: str,
+        types: set[str] | None,
+        force: bool,
+        progress: Callable[[str], None] | None,
+    ) -> list[dict]:
         active = types or {"prs", "commits", "issues"}
         all_dates = date_range(since, until)
         logger.info("fetch_range %s..%s (%d dates, force=%s)", since, until, len(all_dates), force)
@@ -137,19 +219,21 @@ class FetcherService:
         # Determine stale dates for range narrowing.
         # When FailedDateStore is available, also include retryable failed dates
         # so that transient failures from previous runs get automatically retried.
+        # 재시도 대상 실패 날짜는 range 전체에 대해 한 번만 조회한다 (날짜별 조회 X).
+        retryable: set[str] = set()
+        if not force and self._failed_date_store is not None:
+            retryable = set(self._failed_date_store.retryable_dates(all_dates))
         if not force and self._daily_state is not None:
             stale = set(self._daily_state.stale_dates("fetch", all_dates))
             # Merge retryable failed dates — these should be retried even if
             # DailyStateStore considers them non-stale (e.g., data exists but is bad)
-            if self._failed_date_store is not None:
-                retryable = set(self._failed_date_store.retryable_dates(all_dates))
-                if retryable:
-                    logger.info(
-                        "Retryable failed dates: %d (merging with %d stale)",
-                        len(retryable),
-                        len(stale),
-                    )
-                stale = stale | retryable
+            if retryable:
+                logger.info(
+                    "Retryable failed dates: %d (merging with %d stale)",
+                    len(retryable),
+                    len(stale),
+                )
+                stale |= retryable
             logger.info("Stale dates: %d/%d", len(stale), len(all_dates))
             if not stale:
                 return [{"date": d, "status": "skipped"} for d in all_dates]
@@ -158,16 +242,22 @@ class FetcherService:
                 if d not in stale:
                     processed.add(d)
                     results.append({"date": d, "status": "skipped"})
-            # Narrow API range to min..max of stale dates
-            sorted_stale = sorted(stale)
-            chunks = monthly_chunks(sorted_stale[0], sorted_stale[-1])
+            # Narrow API range to min..max of stale dates (ISO 날짜라 문자열 비교로 충분)
+            chunks = monthly_chunks(min(stale), max(stale))
         else:
             stale = None  # no narrowing, use per-date check
             chunks = monthly_chunks(since, until)
 
         use_parallel = self._max_workers > 1
+        # chunk별 날짜 목록은 한 번만 만들고 정상/실패 경로 모두에서 재사용.
+        # chunk는 all_dates의 연속 구간이므로 날짜를 다시 생성하지 않고 slice한다
+        # (ISO 날짜 문자열은 정렬 순서 = 날짜 순서).
+        dates_by_chunk = {
+            (start, end): all_dates[bisect_left(all_dates, start) : bisect_right(all_dates, end)]
+            for start, end in chunks
+        }
 
-        for chunk_start, chunk_end in chunks:
+        for (chunk_start, chunk_end), chunk_dates in dates_by_chunk.items():
             chunk_key = f"{chunk_start}__{chunk_end}"
             logger.debug("Processing chunk %s..%s", chunk_start, chunk_end)
             if progress:
@@ -203,35 +293,38 @@ class FetcherService:
                         self._progress_store.save_chunk_search(chunk_key, buckets)
 
                 # Determine which dates to process in this chunk
-                chunk_dates = date_range(chunk_start, chunk_end)
                 dates_to_process: list[str] = []
                 for d in chunk_dates:
                     if d in processed:
                         continue
                     processed.add(d)
-                    if not force:
-                        # Check if this date has a retryable failure record
-                        # — if so, always include it for retry regardless of stale/fetched state
-                        is_retryable = self._failed_date_store is not None and bool(
-                            self._failed_date_store.retryable_dates([d])
-                        )
-                        if not is_retryable:
-                            if stale is not None:
-                                if d not in stale:
-                                    results.append({"date": d, "status": "skipped"})
-                                    continue
-                            elif self._is_date_fetched(d):
+                    # A retryable failure record always includes the date for retry,
+                    # regardless of stale/fetched state
+                    if not force and d not in retryable:
+                        if stale is not None:
+                            if d not in stale:
                                 results.append({"date": d, "status": "skipped"})
                                 continue
+                        elif self._is_date_fetched(d):
+                            results.append({"date": d, "status": "skipped"})
+                            continue
                     dates_to_process.append(d)
 
-                if use_parallel and len(dates_to_process) > 1:
-                    chunk_results = self._process_dates_parallel(dates_to_process, buckets, active)
+                # 활동 없는 날짜는 HTTP 호출 없이 빈 파일 + 상태 기록만 하므로 thread pool에
+                # 태우지 않는다. 병렬 처리는 bucket에 데이터가 있는 날짜에만 적용.
+                active_days = [d for d in dates_to_process if d in buckets]
+                if use_parallel and len(active_days) > 1:
+                    idle_days = [d for d in dates_to_process if d not in buckets]
+                    results.extend(self._process_dates_sequential(idle_days, buckets, active))
+                    results.extend(self._process_dates_parallel(active_days, buckets, active))
                 else:
-                    chunk_results = self._process_dates_sequential(
-                        dates_to_process, buckets, active
+                    results.extend(
+                        self._process_dates_sequential(dates_to_process, buckets, active)
                     )
-                results.extend(chunk_results)
+
+                # 상태를 먼저 기록한 뒤 chunk cache를 지운다 — 그 사이에 중단되면
+                # cache가 남아 있어 resume 시 검색 없이 다시 처리된다.
+                self._flush_checkpoint()
 
                 # Clear chunk cache after all dates processed
                 if self._progress_store:
@@ -239,7 +332,6 @@ class FetcherService:
 
             except Exception as e:
                 # Chunk-level failure: mark all unprocessed dates in chunk as failed
-                chunk_dates = date_range(chunk_start, chunk_end)
                 for d in chunk_dates:
                     if d not in processed:
                         processed.add(d)
@@ -259,9 +351,9 @@ class FetcherService:
         results: list[dict] = []
         for d in dates:
             try:
-                bucket = buckets.get(d, {"prs": {}, "commits": [], "issues": {}})
+                bucket = buckets.get(d, _EMPTY_BUCKET)
                 self._save_date_from_bucket(d, bucket, active)
-                self._update_checkpoint(d)
+                self._record_fetched(d)
                 if self._failed_date_store is not None:
                     self._failed_date_store.record_success(d, "fetch")
                 results.append({"date": d, "status": "success"})
@@ -279,16 +371,17 @@ class FetcherService:
     def _process_dates_parallel(
         self, dates: list[str], buckets: dict, active: set[str]
     ) -> list[dict]:
-        """Process dates in parallel using ThreadPoolExecutor."""
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        """Process dates in parallel using ThreadPoolExecutor.
 
-        results: list[dict] = []
+        process_one never raises, so executor.map is enough — results come back
+        in date order without tracking futures.
+        """
 
         def process_one(d: str) -> dict:
             try:
-                bucket = buckets.get(d, {"prs": {}, "commits": [], "issues": {}})
+                bucket = buckets.get(d, _EMPTY_BUCKET)
                 self._save_date_from_bucket(d, bucket, active)
-                self._update_checkpoint(d)
+                self._record_fetched(d)
                 if self._failed_date_store is not None:
                     self._failed_date_store.record_success(d, "fetch")
                 return {"date": d, "status": "success"}
@@ -303,148 +396,117 @@ class FetcherService:
                 return {"date": d, "status": "failed", "error": str(e)}
 
         with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
-            futures = {executor.submit(process_one, d): d for d in dates}
-            for future in as_completed(futures):
-                results.append(future.result())
-        return results
+            return list(executor.map(process_one, dates))
 
-    def _save_date_from_bucket(self, date_str: str, bucket: dict, active: set[str]) -> None:
+    def _save_date_from_bucket(self, date_str: str, bucket: Mapping, active: set[str]) -> None:
         """bucket 데이터를 날짜별 파일로 enrich+save.
 
-        When max_workers > 1 and client_pool is available, enrichment runs
-        in parallel using ThreadPoolExecutor.
+        Enrichment overlaps HTTP round-trips on the shared client (thread-safe,
+        HTTP/2-multiplexed), bounded by config.enrich_concurrency.
+
+        PR/commit/issue enrich는 하나의 executor에 함께 제출해 서로 겹쳐 실행되고,
+        완료되는 대로 각 파일에 한 건씩 기록된다 — 날짜 전체 list를 메모리에 두지 않는다.
+        저장 규칙은 _save/_save_commits/_save_issues와 같다.
         """
-        use_parallel = self._max_workers > 1 and self._client_pool is not None
+        raw_dir = self._config.date_raw_dir(date_str)
 
+        # (kind, 저장 경로, enrich 함수, [(로그용 key, item)], skip할 예외)
+        jobs: list[tuple[str, Path, Callable, list[tuple[str, dict]], type[Exception]]] = []
         if "prs" in active:
-            if use_parallel:
-                prs = self._enrich_prs_parallel(bucket["prs"])
-            else:
-                prs = self._enrich_prs_sequential(bucket["prs"])
-            self._save(date_str, prs)
-
-        if "commits" in active:
-            if use_parallel:
-                commits = self._enrich_commits_parallel(bucket["commits"])
-            else:
-                commits = self._enrich_commits_sequential(bucket["commits"])
-            self._save_commits(date_str, commits)
-
-        if "issues" in active:
-            if use_parallel:
-                issues = self._enrich_issues_parallel(bucket["issues"])
+            pr_items = list(bucket["prs"].items())
+            if self._graphql_enrich:
+                # 추정 node 수 budget 안에서 alias로 묶어 GraphQL 1회 — 결과는 PRRaw list
+                pr_batches = [
+                    (f"batch of {len(batch)}", [basic for _, basic in batch])
+                    for batch in pack_pr_batches(pr_items, budget=self._graphql_batch_node_budget)
+                ]
+                jobs.append(
+                    ("PR", raw_dir / "prs.json", self._enrich_pr_batch, pr_batches, FetchError)
+                )
             else:
-                issues = self._enrich_issues_sequential(bucket["issues"])
-            self._save_issues(date_str, issues)
-
-    def _enrich_prs_sequential(self, pr_map: dict[str, dict]) -> list[PRRaw]:
-        prs: list[PRRaw] = []
-        for pr_api_url, pr_basic in pr_map.items():
-            try:
-                prs.append(self._enrich(pr_basic))
-            except FetchError:
-                logger.warning("Failed to enrich PR %s, skipping", pr_api_url)
-        return prs
-
-    def _enrich_prs_parallel(self, pr_map: dict[str, dict]) -> list[PRRaw]:
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
-        pool = self._client_pool
-        prs: list[PRRaw] = []
-
-        def enrich_one(pr_api_url: str, pr_basic: dict) -> PRRaw | None:
-            client = pool.acquire()
-            try:
-                return self._enrich(pr_basic, client=client)
-            except FetchError:
-                logger.warning("Failed to enrich PR %s, skipping", pr_api_url)
-                return None
-            finally:
-                pool.release(client)
+                jobs.append(("PR", raw_dir / "prs.json", self._enrich, pr_items, FetchError))
+        commits_path = raw_dir / "commits.json"
+        if "commits" in active and (bucket["commits"] or commits_path.exists()):
+            commit_items = [(c.get("sha", "unknown"), c) for c in bucket["commits"]]
+            jobs.append(("commit", commits_path, self._enrich_commit, commit_items, Exception))
+        issues_path = raw_dir / "issues.json"
+        if "issues" in active and (bucket["issues"] or issues_path.exists()):
+            issue_items = list(bucket["issues"].items())
+            jobs.append(("issue", issues_path, self._enrich_issue, issue_items, Exception))
+
+        with ExitStack() as stack:
+            # enrich할 항목이 없으면(빈 날짜) 파일만 기록하고 pool은 만들지 않는다
+            if any(items for _, _, _, items, _ in jobs):
+                executor = stack.enter_context(
+                    ThreadPoolExecutor(max_workers=self._enrich_concurrency)
+                )
+            futures: dict[Future, tuple[str, str, Callable, type[Exception]]] = {}
+            for kind, path, enrich, items, skip_errors in jobs:
+                write = stack.enter_context(save_json_stream(path))
+                for key, item in items:
+                    future = executor.submit(enrich, item)
+                    futures[future] = (kind, key, write, skip_errors)
 
-        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            for future in as_completed(futures):
+                kind, key, write, skip_errors = futures[future]
+                try:
+                    result = future.result()
+                except skip_errors:
+                    logger.warning("Failed to enrich %s %s, skipping", kind, key)
+                    continue
+                for record in result if isinstance(result, list) else (result,):
+                    write(record)
+
+    def _enrich_prs_concurrent(self, pr_map: dict[str, dict]) -> Iterator[PRRaw]:
+        """공유 client로 PR enrich. enrich_concurrency개 스레드로 RTT를 겹친다."""
+        if not pr_map:
+            return
+        with ThreadPoolExecutor(max_workers=self._enrich_concurrency) as executor:
             futures = {
-                executor.submit(enrich_one, url, basic): url for url, basic in pr_map.items()
+                executor.submit(self._enrich, pr_basic): pr_api_url
+                for pr_api_url, pr_basic in pr_map.items()
             }
             for future in as_completed(futures):
-                result = future.result()
-                if result is not None:
-                    prs.append(result)
-        return prs
-
-    def _enrich_commits_sequential(self, commit_items: list[dict]) -> list[CommitRaw]:
-        commits: list[CommitRaw] = []
-        for item in commit_items:
-            try:
-                commits.append(self._enrich_commit(item))
-            except Exception:
-                logger.warning(
-                    "Failed to enrich commit %s, skipping",
-                    item.get("sha", "unknown"),
-                )
-        return commits
-
-    def _enrich_commits_parallel(self, commit_items: list[dict]) -> list[CommitRaw]:
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
-        pool = self._client_pool
-        commits: list[CommitRaw] = []
-
-        def enrich_one(item: dict) -> CommitRaw | None:
-            client = pool.acquire()
-            try:
-                return self._enrich_commit(item, client=client)
-            except Exception:
-                logger.warning(
-                    "Failed to enrich commit %s, skipping",
-                    item.get("sha", "unknown"),
-                )
-                return None
-            finally:
-                pool.release(client)
-
-        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
-            futures = {executor.submit(enrich_one, item): item for item in commit_items}
+                try:
+                    pr = future.result()
+                except FetchError:
+                    logger.warning("Failed to enrich PR %s, skipping", futures[future])
+                    continue
+                yield pr
+
+    def _enrich_commits_concurrent(self, commit_items: list[dict]) -> Iterator[CommitRaw]:
+        """공유 client로 commit enrich. enrich_concurrency개 스레드로 RTT를 겹친다."""
+        if not commit_items:
+            return
+        with ThreadPoolExecutor(max_workers=self._enrich_concurrency) as executor:
+            futures = {executor.submit(self._enrich_commit, item): item for item in commit_items}
             for future in as_completed(futures):
-                result = future.result()
-                if result is not None:
-                    commits.append(result)
-        return commits
-
-    def _enrich_issues_sequential(self, issue_map: dict[str, dict]) -> list[IssueRaw]:
-        issues: list[IssueRaw] = []
-        for api_url, item in issue_map.items():
-            try:
-                issues.append(self._enrich_issue(item))
-            except Exception:
-                logger.warning("Failed to enrich issue %s, skipping", api_url)
-        return issues
-
-    def _enrich_issues_parallel(self, issue_map: dict[str, dict]) -> list[IssueRaw]:
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
-        pool = self._client_pool
-        issues: list[IssueRaw] = []
-
-        def enrich_one(api_url: str, item: dict) -> IssueRaw | None:
-            client = pool.acquire()
-            try:
-                return self._enrich_issue(item, client=client)
-            except Exception:
-                logger.warning("Failed to enrich issue %s, skipping", api_url)
-                return None
-            finally:
-                pool.release(client)
+                try:
+                    commit = future.result()
+                except Exception:
+                    logger.warning(
+                        "Failed to enrich commit %s, skipping",
+                        futures[future].get("sha", "unknown"),
+                    )
+                    continue
+                yield commit
 
-        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+    def _enrich_issues_concurrent(self, issue_map: dict[str, dict]) -> Iterator[IssueRaw]:
+        """공유 client로 issue enrich. enrich_concurrency개 스레드로 RTT를 겹친다."""
+        if not issue_map:
+            return
+        with ThreadPoolExecutor(max_workers=self._enrich_concurrency) as executor:
             futures = {
-                executor.submit(enrich_one, url, item): url for url, item in issue_map.items()
+                executor.submit(self._enrich_issue, item): api_url
+                for api_url, item in issue_map.items()
             }
             for future in as_completed(futures):
-                result = future.result()
-                if result is not None:
-                    issues.append(result)
-        return issues
+                try:
+                    issue = future.result()
+                except Exception:
+                    logger.warning("Failed to enrich issue %s, skipping", futures[future])
+                    continue
+                yield issue
 
     # ── Repo filtering ──
 
@@ -465,8 +527,24 @@ class FetcherService:
         return [c for c in commits if c.get("repository", {}).get("full_name", "") in self._repos]
 
     @staticmethod
+    def _dedup_commits(commits: list[dict]) -> list[dict]:
+        """(repo, sha) 기준 dedup. 첫 item을 남기고 순서는 유지한다.
+
+        검색 중 결과 순서가 바뀌어 페이지 경계에서 같은 커밋이 다시 나오면
+        get_commit 상세 조회가 중복되므로, enrich 전에 한 건으로 줄인다.
+        """
+        unique: dict[tuple, dict] = {}
+        for c in commits:
+            unique.setdefault((c.get("repository", {}).get("full_name"), c.get("sha")), c)
+        return list(unique.values())
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _extract_repo_name(repository_url: str) -> str:
-        """Extract 'owner/repo' from repository_url like 'https://.../repos/owner/repo'."""
+        """Extract 'owner/repo' from repository_url like 'https://.../repos/owner/repo'.
+
+        Cached: a chunk's search results share a handful of repository_urls.
+        """
         parts = repository_url.rstrip("/").split("/")
         if len(parts) >= 2:
             return f"{parts[-2]}/{parts[-1]}"
@@ -479,33 +557,32 @@ class FetcherService:
         issue_map: dict[str, dict],
     ) -> dict[str, dict]:
         """검색 결과를 날짜별로 분류."""
-        buckets: dict[str, dict] = {}
-
-        def ensure_bucket(d: str) -> dict:
-            if d not in buckets:
-                buckets[d] = {"prs": {}, "commits": [], "issues": {}}
-            return buckets[d]
+        # 날짜 추출은 일반 subscript + slice로 둔다. CPython 3.11+에서는 dict subscript가
+        # 특화 opcode로 처리되어 operator.itemgetter 호출보다 빠르다 (5천 건 기준 ~30%).
+        buckets: defaultdict[str, dict] = defaultdict(
+            lambda: {"prs": {}, "commits": [], "issues": {}}
+        )
 
         for url, item in pr_map.items():
-            d = item["updated_at"][:10]
-            ensure_bucket(d)["prs"][url] = item
+            buckets[item["updated_at"][:10]]["prs"][url] = item
 
         for item in commit_items:
-            d = item["commit"]["committer"]["date"][:10]
-            ensure_bucket(d)["commits"].append(item)
+            buckets[item["commit"]["committer"]["date"][:10]]["commits"].append(item)
 
         for url, item in issue_map.items():
-            d = item["updated_at"][:10]
-            ensure_bucket(d)["issues"][url] = item
+            buckets[item["updated_at"][:10]]["issues"][url] = item
 
-        return buckets
+        # 호출자의 .get() 조회가 빈 bucket을 만들지 않도록 plain dict로 반환
+        return dict(buckets)
 
     def _is_date_fetched(self, date_str: str) -> bool:
-        """daily_state 있으면 timestamp 기반, 없으면 파일 존재 체크."""
+        """daily_state 있으면 timestamp 기반, 없으면 파일 존재 체크.
+
+        빈 날짜는 commits.json/issues.json을 만들지 않으므로 prs.json만 기준으로 본다.
+        """
         if self._daily_state is not None:
             return not self._daily_state.is_fetch_stale(date_str)
-        raw_dir = self._config.date_raw_dir(date_str)
-        return all((raw_dir / f).exists() for f in ("prs.json", "commits.json", "issues.json"))
+        return (self._config.date_raw_dir(date_str) / "prs.json").exists()
 
     # ── Range 검색 ──
 
@@ -521,121 +598,261 @@ class FetcherService:
 
     def _search_prs_range(self, start: str, end: str) -> dict[str, dict]:
         """날짜 범위로 PR 3축 검색 + dedup."""
-        axes = [
-            f"author:{self._username}",
-            f"reviewed-by:{self._username}",
-            f"commenter:{self._username}",
-        ]
-        pr_map: dict[str, dict] = {}
-        for qualifier in axes:
-            query = f"type:pr {qualifier} updated:{start}..{end}"
+        if self._graphql_search:
             try:
-                items = self._search_all_pages(query)
-                self._warn_if_truncated(len(items), query)
-            except FetchError:
-                if "reviewed-by" in qualifier:
+                return self._search_prs_range_graphql(start, end)
+            except FetchError as e:
+                logger.warning("GraphQL PR search failed (%s), falling back to REST search", e)
+        return self._search_pr_axes(f"{start}..{end}")
+
+    def _search_prs_range_graphql(self, start: str, end: str) -> dict[str, dict]:
+        """PR 3축 검색을 alias GraphQL search 쿼리 하나로 묶어 실행 + dedup.
+
+        세 축이 같은 요청으로 나가고, 다음 페이지가 남은 축만 cursor로 이어서 조회한다.
+        reviewed-by 축 실패는 REST 경로처럼 건너뛰고, 다른 축이 실패하면 FetchError.
+        """
+        searches = {
+            "author": f"type:pr author:{self._username} updated:{start}..{end}",
+            "reviewed": f"type:pr reviewed-by:{self._username} updated:{start}..{end}",
+            "commenter": f"type:pr commenter:{self._username} updated:{start}..{end}",
+        }
+        api_base = self._client.api_base
+        found: dict[str, list[dict]] = {alias: [] for alias in searches}
+        cursors: dict[str, str | None] = dict.fromkeys(searches)
+        while cursors:
+            data, errors = self._client.graphql_partial(
+                *build_pr_search_query([(a, searches[a], c) for a, c in cursors.items()])
+            )
+            failed_aliases = {e["path"][0] for e in errors if e.get("path")}
+            for alias in list(cursors):
+                conn = data.get(alias)
+                if conn is None or alias in failed_aliases:
+                    if alias != "reviewed":
+                        raise FetchError(f"GraphQL search failed: {searches[alias]}")
                     logger.warning("reviewed-by qualifier not supported, skipping")
+                    del cursors[alias], found[alias]
                     continue
-                raise
+                # PR이 아닌 node(issue)는 빈 object로 온다
+                found[alias].extend(pr_search_item(n, api_base) for n in conn["nodes"] if n)
+                page_info = conn["pageInfo"]
+                if page_info["hasNextPage"] and len(found[alias]) < SEARCH_RESULT_LIMIT:
+                    cursors[alias] = page_info["endCursor"]
+                else:
+                    del cursors[alias]
+
+        pr_map: dict[str, dict] = {}
+        for alias, items in found.items():
+            self._warn_if_truncated(len(items), searches[alias])
             for item in items:
-                api_url = item.get("pull_request", {}).get("url", item["url"])
-                if api_url not in pr_map:
-                    pr_map[api_url] = item
+                pr_map.setdefault(item["pull_request"]["url"], item)
         return self._filter_items_by_repos(pr_map)
 
     def _search_commits_range(self, start: str, end: str) -> list[dict]:
         """날짜 범위로 커밋 검색."""
         query = f"author:{self._username} committer-date:{start}..{end}"
         try:
-            items = self._search_all_commit_pages(query)
+            items = list(self._search_all_commit_pages(query))
             self._warn_if_truncated(len(items), query)
-            return self._filter_commits_by_repos(items)
+            return self._dedup_commits(self._filter_commits_by_repos(items))
         except FetchError:
             logger.warning("Commit range search not supported, skipping")
             return []
 
     def _search_issues_range(self, start: str, end: str) -> dict[str, dict]:
         """날짜 범위로 Issue 2축 검색 + dedup."""
-        axes = [
-            f"type:issue author:{self._username} updated:{start}..{end}",
-            f"type:issue commenter:{self._username} updated:{start}..{end}",
-        ]
-        issue_map: dict[str, dict] = {}
-        for query in axes:
-            try:
-                items = self._search_all_pages(query)
-                self._warn_if_truncated(len(items), query)
-            except FetchError:
-                logger.warning("Issue range search failed for query '%s', skipping", query)
-                continue
-            for item in items:
-                api_url = item["url"]
-                if api_url not in issue_map:
-                    issue_map[api_url] = item
-        return self._filter_items_by_repos(issue_map)
+        return self._search_issue_axes(f"{start}..{end}")
 
-    # ── 3축 검색 + dedup ──
+    # ── 축별 검색 + dedup (날짜 하나 / 범위 공용) ──
+    # 축 쿼리는 _search_axes_concurrent로 동시에 실행하고, 결과를 쿼리 순서대로
+    # setdefault로 합쳐 앞선 축의 item이 남는다 (lookup+insert 한 번).
 
-    def _search_prs(self, target_date: str) -> dict[str, dict]:
-        """3축 쿼리로 PR 검색 후 API URL 기준 dedup."""
+    def _search_pr_axes(self, updated: str) -> dict[str, dict]:
+        """PR 3축(author/reviewed-by/commenter) 검색 후 PR API URL 기준 dedup.
+
+        reviewed-by 미지원 서버에서는 그 축만 건너뛰고, 다른 축 실패는 FetchError.
+        """
         axes = [
             f"author:{self._username}",
             f"reviewed-by:{self._username}",
             f"commenter:{self._username}",
         ]
+        combined = self._search_combined_axes("type:pr", axes, updated)
+        batches: list[list[dict]] = [combined] if combined is not None else []
+        if combined is None:
+            queries = [f"type:pr {qualifier} updated:{updated}" for qualifier in axes]
+            results = self._search_axes_concurrent(queries)
+            for qualifier, query, items in zip(axes, queries, results):
+                if isinstance(items, FetchError):
+                    if "reviewed-by" not in qualifier:
+                        raise items
+                    logger.warning("reviewed-by qualifier not supported, skipping")
+                    continue
+                self._warn_if_truncated(len(items), query)
+                batches.append(items)
 
         pr_map: dict[str, dict] = {}
+        for items in batches:
+            for item in items:
+                if pr_api_url := item.get("pull_request", {}).get("url"):
+                    pr_map.setdefault(pr_api_url, item)
+        return self._filter_items_by_repos(pr_map)
 
-        for qualifier in axes:
-            query = f"type:pr {qualifier} updated:{target_date}"
-            try:
-                items = self._search_all_pages(query)
-            except FetchError:
-                if "reviewed-by" in qualifier:
-                    logger.warning("reviewed-by qualifier not supported, skipping")
+    def _search_issue_axes(self, updated: str) -> dict[str, dict]:
+        """Issue 2축(author/commenter) 검색 후 API URL 기준 dedup. 실패한 축은 건너뛴다."""
+        qualifiers = [f"author:{self._username}", f"commenter:{self._username}"]
+        combined = self._search_combined_axes("type:issue", qualifiers, updated)
+        batches: list[list[dict]] = [combined] if combined is not None else []
+        if combined is None:
+            queries = [f"type:issue {qualifier} updated:{updated}" for qualifier in qualifiers]
+            for query, items in zip(queries, self._search_axes_concurrent(queries)):
+                if isinstance(items, FetchError):
+                    logger.warning("Issue search failed for query '%s', skipping", query)
                     continue
-                raise
+                self._warn_if_truncated(len(items), query)
+                batches.append(items)
 
+        issue_map: dict[str, dict] = {}
+        for items in batches:
             for item in items:
-                api_url = item.get("pull_request", {}).get("url", item["url"])
-                if api_url not in pr_map:
-                    pr_map[api_url] = item
+                issue_map.setdefault(item["url"], item)
+        return self._filter_items_by_repos(issue_map)
 
-        return self._filter_items_by_repos(pr_map)
+    def _search_combined_axes(
+        self, type_qualifier: str, qualifiers: list[str], updated: str
+    ) -> list[dict] | None:
+        """축 qualifier를 OR로 묶은 Search 쿼리 1회. 사용할 수 없으면 None (축별 쿼리로 진행).
 
-    def _search_all_pages(self, query: str) -> list[dict]:
-        """Search API 전체 페이지 수집."""
-        all_items: list[dict] = []
-        page = 1
+        축이 겹치는 item(직접 작성하고 코멘트도 단 PR 등)은 한 번만 내려오므로 Search 호출이
+        축 수만큼 늘지 않는다. 서버가 쿼리를 거부하거나(422 등) 결과가 1000건 cap에 닿으면
+        축별로 나눠야 빠짐없이 모이므로 None을 반환한다.
+        """
+        if not self._search_or_axes:
+            return None
+        query = f"{type_qualifier} ({' OR '.join(qualifiers)}) updated:{updated}"
+        try:
+            items = list(self._search_all_pages(query))
+        except FetchError as e:
+            logger.warning("Combined search failed (%s), falling back to per-axis queries", e)
+            return None
+        if len(items) >= SEARCH_RESULT_LIMIT:
+            logger.info("Combined search hit the result cap, falling back to per-axis queries")
+            return None
+        return items
+
+    def _search_axes_concurrent(self, queries: list[str]) -> list[list[dict] | FetchError]:
+        """축별 Search 쿼리를 동시에 실행하고 쿼리 순서대로 결과 list 또는 FetchError 반환.
+
+        Search 호출은 GHESClient throttle로 여전히 간격을 두고 나가지만, 한 축의 응답
+        대기가 다른 축의 throttle 대기와 겹친다. 결과를 순서대로 돌려주므로 호출자의
+        setdefault dedup은 순차 실행과 같은 축(앞선 쿼리)의 item을 남긴다.
+        """
 
-        while True:
-            result = self._client.search_issues(query, page=page, per_page=100)
-            items = result.get("items", [])
-            all_items.extend(items)
+        def run(query: str) -> list[dict] | FetchError:
+            try:
+                return list(self._search_all_pages(query))
+            except FetchError as e:
+                return e
 
-            if len(items) < 100:
-                break
-            page += 1
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            return list(executor.map(run, queries))
 
-        return all_items
+    # ── 3축 검색 + dedup ──
+
+    def _search_prs(self, target_date: str) -> dict[str, dict]:
+        """3축 쿼리로 PR 검색 후 API URL 기준 dedup."""
+        return self._search_pr_axes(target_date)
+
+    def _search_all_pages(self, query: str) -> Iterator[dict]:
+        """Search API 전체 페이지를 순서대로 yield."""
+        return self._iter_search_pages(self._client.search_issues, query)
+
+    @staticmethod
+    def _iter_search_pages(
+        search_fn: Callable[..., dict], query: str, prefetch: int = SEARCH_PREFETCH_PAGES
+    ) -> Iterator[dict]:
+        """Search 결과를 페이지 prefetch pipeline으로 받아 한 건씩 yield.
+
+        첫 페이지의 total_count로 마지막 페이지를 알 수 있으므로, 다음 페이지들을
+        최대 ``prefetch``개까지 미리 요청해 RTT를 throttle 대기와 겹친다.
+        total_count가 실제보다 작으면 기존처럼 한 페이지씩 이어간다.
+        짧은 페이지가 오면 남은 요청은 취소한다.
+
+        페이지를 list로 모으지 않고 도착하는 대로 넘기므로, 호출자는 다음 페이지가
+        in-flight인 동안 현재 페이지를 dedup dict에 반영한다.
+        """
+        first = search_fn(query, page=1, per_page=SEARCH_PAGE_SIZE)
+        first_items = first.get("items", [])
+        yield from first_items
+        collected = len(first_items)
+        if collected < SEARCH_PAGE_SIZE:
+            return
+
+        total = min(first.get("total_count", 0), SEARCH_RESULT_LIMIT)
+        last_page = -(-total // SEARCH_PAGE_SIZE)
+        if collected > total:
+            last_page = 2
+        next_page = 2
+        in_flight: deque[Future] = deque()
+
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+
+            def submit_ahead() -> None:
+                nonlocal next_page
+                while next_page <= last_page and len(in_flight) < prefetch:
+                    in_flight.append(
+                        executor.submit(search_fn, query, page=next_page, per_page=SEARCH_PAGE_SIZE)
+                    )
+                    next_page += 1
+
+            try:
+                submit_ahead()
+                while in_flight:
+                    items = in_flight.popleft().result().get("items", [])
+                    collected += len(items)
+                    if len(items) < SEARCH_PAGE_SIZE:
+                        yield from items
+                        break
+                    # total_count보다 결과가 많으면 (stale count) serial fallback으로 한 페이지 더
+                    if not in_flight and collected > total and next_page <= SEARCH_MAX_PAGE:
+                        last_page = next_page
+                    # 다음 페이지 요청을 먼저 띄운 뒤 yield — 소비와 RTT가 겹친다
+                    submit_ahead()
+                    yield from items
+            finally:
+                # 소비자가 중간에 멈추거나 예외가 나면 남은 prefetch 요청은 버린다
+                for future in in_flight:
+                    future.cancel()
 
     # ── PR Enrich ──
 
-    def _enrich(self, pr_basic: dict, client: GHESClient | None = None) -> PRRaw:
+    def _enrich(self, pr_basic: dict) -> PRRaw:
         """기본 PR 정보에 files, comments, reviews를 추가 수집."""
-        c = client or self._client
+        c = self._client
         pr_api_url = pr_basic.get("pull_request", {}).get("url", "")
         owner, repo, number = self._parse_pr_url(pr_api_url)
 
-        pr_detail = c.get_pr(owner, repo, number)
-
-        raw_files = c.get_pr_files(owner, repo, number)
-        raw_comments = c.get_pr_comments(owner, repo, number)
-        raw_reviews = c.get_pr_reviews(owner, repo, number)
-
-        filtered_comments = [c for c in raw_comments if not self._is_noise_comment(c)]
-        filtered_reviews = [r for r in raw_reviews if not self._is_noise_review(r)]
+        if self._graphql_enrich:
+            pr_detail, raw_files, raw_comments, raw_reviews = self._fetch_pr_graphql(
+                owner, repo, number, pr_api_url
+            )
+        else:
+            pr_detail, raw_files, raw_comments, raw_reviews = self._gather_pr_detail(
+                (c.get_pr, c.get_pr_files, c.get_pr_comments, c.get_pr_reviews),
+                owner,
+                repo,
+                number,
+            )
+        return self._to_pr_raw(pr_detail, raw_files, raw_comments, raw_reviews, f"{owner}/{repo}")
 
+    def _to_pr_raw(
+        self,
+        pr_detail: dict,
+        raw_files: list[dict],
+        raw_comments: list[dict],
+        raw_reviews: list[dict],
+        repo_full: str,
+    ) -> PRRaw:
+        """REST 형태의 PR 응답들을 noise 필터링 후 PRRaw로 변환."""
         return PRRaw(
             url=pr_detail["html_url"],
             api_url=pr_detail["url"],
@@ -647,97 +864,136 @@ class FetcherService:
             created_at=pr_detail["created_at"],
             updated_at=pr_detail["updated_at"],
             merged_at=pr_detail.get("merged_at"),
-            repo=f"{owner}/{repo}",
+            repo=repo_full,
             labels=[label["name"] for label in pr_detail.get("labels", [])],
             author=pr_detail["user"]["login"],
-            files=[
-                FileChange(
-                    filename=f["filename"],
-                    additions=f["additions"],
-                    deletions=f["deletions"],
-                    status=f["status"],
-                    patch=f.get("patch", ""),
-                )
-                for f in raw_files
-            ],
-            comments=[
-                Comment(
-                    author=c["user"]["login"],
-                    body=c.get("body") or "",
-                    created_at=c["created_at"],
-                    url=c["html_url"],
-                    path=c.get("path") or "",
-                    line=c.get("line") or c.get("original_line") or 0,
-                    diff_hunk=c.get("diff_hunk") or "",
-                )
-                for c in filtered_comments
-            ],
-            reviews=[
-                Review(
-                    author=r["user"]["login"],
-                    state=r["state"],
-                    body=r.get("body") or "",
-                    submitted_at=r["submitted_at"],
-                    url=r["html_url"],
-                )
-                for r in filtered_reviews
-            ],
+            files=self._to_file_changes(raw_files),
+            comments=self._to_comments(raw_comments),
+            reviews=self._to_reviews(raw_reviews),
         )
 
     @staticmethod
+    def _gather_pr_detail(calls: tuple[Callable, ...], owner: str, repo: str, number: int) -> list:
+        """서로 독립인 PR 조회들을 동시에 실행. 하나라도 실패하면 나머지를 취소하고 raise."""
+        futures = [_PR_DETAIL_POOL.submit(fn, owner, repo, number) for fn in calls]
+        try:
+            return [f.result() for f in futures]
+        except Exception:
+            for f in futures:
+                f.cancel()
+            raise
+
+    def _fetch_pr_graphql(
+        self, owner: str, repo: str, number: int, pr_api_url: str
+    ) -> tuple[dict, list[dict], list[dict], list[dict]]:
+        """GraphQL 1회(detail+comments+reviews) + REST files를 동시에 조회.
+
+        코멘트/리뷰가 100개를 넘어 잘린 PR은 REST로 다시 조회한다.
+        """
+        c = self._client
+
+        def query_pr(owner: str, repo: str, number: int) -> dict:
+            variables = {"owner": owner, "name": repo, "number": number}
+            node = c.graphql(PR_ENRICH_QUERY, variables)["repository"]["pullRequest"]
+            if node is None:
+                raise FetchError(f"PR not found via GraphQL: {owner}/{repo}#{number}")
+            return node
+
+        node, raw_files = self._gather_pr_detail((query_pr, c.get_pr_files), owner, repo, number)
+        pr_detail, raw_comments, raw_reviews = pr_to_rest(node, pr_api_url)
+        if raw_comments is None:
+            raw_comments, raw_reviews = self._gather_pr_detail(
+                (c.get_pr_comments, c.get_pr_reviews), owner, repo, number
+            )
+        return pr_detail, raw_files, raw_comments, raw_reviews
+
+    def _enrich_pr_batch(self, pr_basics: list[dict]) -> list[PRRaw]:
+        """여러 PR을 alias GraphQL 쿼리 1회로 enrich. files는 PR별 REST로 동시에 조회.
+
+        실패한 alias(또는 쿼리 전체 실패)는 해당 PR만 _enrich로 개별 조회하고,
+        그래도 실패한 PR은 warning 후 건너뛴다.
+        """
+        c = self._client
+        api_urls = [basic.get("pull_request", {}).get("url", "") for basic in pr_basics]
+        refs = [self._parse_pr_url(url) for url in api_urls]
+        files_futures = [_PR_DETAIL_POOL.submit(c.get_pr_files, *ref) for ref in refs]
+
+        try:
+            data, errors = c.graphql_partial(*build_pr_batch_query(refs))
+        except FetchError as e:
+            logger.warning("GraphQL batch failed (%s), enriching %d PRs one by one", e, len(refs))
+            data, errors = {}, []
+        failed_aliases = {e["path"][0] for e in errors if e.get("path")}
+        if rate_limit := data.get("rateLimit"):
+            logger.debug(
+                "GraphQL batch of %d PRs: cost=%s remaining=%s",
+                len(refs),
+                rate_limit.get("cost"),
+                rate_limit.get("remaining"),
+            )
+
+        prs: list[PRRaw] = []
+        for i, (basic, api_url, ref) in enumerate(zip(pr_basics, api_urls, refs)):
+            alias = f"pr{i}"
+            node = (data.get(alias) or {}).get("pullRequest")
+            try:
+                if node is None or alias in failed_aliases:
+                    files_futures[i].cancel()
+                    prs.append(self._enrich(basic))
+                    continue
+                pr_detail, raw_comments, raw_reviews = pr_to_rest(node, api_url)
+                if raw_comments is None:
+                    raw_comments, raw_reviews = self._gather_pr_detail(
+                        (c.get_pr_comments, c.get_pr_reviews), *ref
+                    )
+                raw_files = files_futures[i].result()
+                repo_full = f"{ref[0]}/{ref[1]}"
+                prs.append(
+                    self._to_pr_raw(pr_detail, raw_files, raw_comments, raw_reviews, repo_full)
+                )
+            except FetchError:
+                logger.warning("Failed to enrich PR %s, skipping", api_url)
+        return prs
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _parse_pr_url(api_url: str) -> tuple[str, str, int]:
-        """PR API URL에서 owner, repo, number 추출."""
-        parts = api_url.rstrip("/").split("/")
-        pulls_idx = parts.index("pulls")
-        owner = parts[pulls_idx - 2]
-        repo = parts[pulls_idx - 1]
-        number = int(parts[pulls_idx + 1])
-        return owner, repo, number
+        """PR API URL에서 owner, repo, number 추출. URL별 결과 캐시.
+
+        형식이 맞지 않으면 HTTP 호출 전에 FetchError — enrich 호출자가 해당 PR만 건너뛴다.
+        """
+        m = PR_URL_RE.search(api_url)
+        if m is None:
+            raise FetchError(f"Malformed PR API URL: {api_url!r}")
+        return m[1], m[2], int(m[3])
 
     # ── Commit 수집 ──
 
     def _fetch_commits(self, target_date: str) -> list[CommitRaw]:
         """커밋 검색 + enrich. GHES 미지원 시 빈 리스트 반환."""
+        return list(self._enrich_commits_concurrent(self._search_commits(target_date)))
+
+    def _search_commits(self, target_date: str) -> list[dict]:
+        """날짜 하나의 커밋 검색 결과. GHES 미지원 시 빈 리스트 반환."""
         query = f"author:{self._username} committer-date:{target_date}"
         try:
-            items = self._search_all_commit_pages(query)
+            items = list(self._search_all_commit_pages(query))
         except FetchError:
             logger.warning("Commit search not supported, skipping")
             return []
+        return self._dedup_commits(self._filter_commits_by_repos(items))
 
-        items = self._filter_commits_by_repos(items)
-        commits: list[CommitRaw] = []
-        for item in items:
-            try:
-                commits.append(self._enrich_commit(item))
-            except Exception:
-                logger.warning("Failed to enrich commit %s, skipping", item.get("sha", "unknown"))
-        return commits
-
-    def _search_all_commit_pages(self, query: str) -> list[dict]:
-        """Commit Search API 전체 페이지 수집."""
-        all_items: list[dict] = []
-        page = 1
-
-        while True:
-            result = self._client.search_commits(query, page=page, per_page=100)
-            items = result.get("items", [])
-            all_items.extend(items)
+    def _search_all_commit_pages(self, query: str) -> Iterator[dict]:
+        """Commit Search API 전체 페이지를 순서대로 yield."""
+        return self._iter_search_pages(self._client.search_commits, query)
 
-            if len(items) < 100:
-                break
-            page += 1
-
-        return all_items
-
-    def _enrich_commit(self, item: dict, client: GHESClient | None = None) -> CommitRaw:
+    def _enrich_commit(self, item: dict) -> CommitRaw:
         """검색 결과를 CommitRaw로 변환. get_commit으로 files 포함 상세 조회."""
-        c = client or self._client
         repo_full = item["repository"]["full_name"]
         sha = item["sha"]
         owner, repo = repo_full.split("/", 1)
 
-        detail = c.get_commit(owner, repo, sha)
+        detail = self._client.get_commit(owner, repo, sha)
 
         raw_files = detail.get("files", [])
         return CommitRaw(
@@ -748,59 +1004,36 @@ class FetcherService:
             author=item["author"]["login"] if item.get("author") else "",
             repo=repo_full,
             committed_at=detail["commit"]["committer"]["date"],
-            files=[
-                FileChange(
-                    filename=f["filename"],
-                    additions=f["additions"],
-                    deletions=f["deletions"],
-                    status=f["status"],
-                    patch=f.get("patch", ""),
-                )
-                for f in raw_files
-            ],
+            files=self._to_file_changes(raw_files),
         )
 
     # ── Issue 수집 ──
 
     def _fetch_issues(self, target_date: str) -> list[IssueRaw]:
         """Issue 2축 검색 + enrich. 실패 시 빈 리스트 반환."""
-        axes = [
-            f"type:issue author:{self._username} updated:{target_date}",
-            f"type:issue commenter:{self._username} updated:{target_date}",
-        ]
+        return list(self._enrich_issues_concurrent(self._search_issues(target_date)))
 
-        issue_map: dict[str, dict] = {}
-        for query in axes:
-            try:
-                items = self._search_all_pages(query)
-            except FetchError:
-                logger.warning("Issue search failed for query '%s', skipping", query)
-                continue
-
-            for item in items:
-                api_url = item["url"]
-                if api_url not in issue_map:
-                    issue_map[api_url] = item
+    def _search_issues(self, target_date: str) -> dict[str, dict]:
+        """날짜 하나의 Issue 2축 검색 + API URL 기준 dedup. 실패한 축은 건너뛴다."""
+        return self._search_issue_axes(target_date)
 
-        issue_map = self._filter_items_by_repos(issue_map)
-        issues: list[IssueRaw] = []
-        for api_url, item in issue_map.items():
-            try:
-                issues.append(self._enrich_issue(item))
-            except Exception:
-                logger.warning("Failed to enrich issue %s, skipping", api_url)
-        return issues
-
-    def _enrich_issue(self, item: dict, client: GHESClient | None = None) -> IssueRaw:
+    def _enrich_issue(self, item: dict) -> IssueRaw:
         """Issue 검색 결과를 IssueRaw로 변환."""
-        c = client or self._client
+        c = self._client
         api_url = item["url"]
         owner, repo, number = self._parse_issue_url(api_url)
 
-        detail = c.get_issue(owner, repo, number)
-        raw_comments = c.get_issue_comments(owner, repo, number)
-
-        filtered_comments = [c for c in raw_comments if not self._is_noise_comment(c)]
+        if self._graphql_enrich:
+            variables = {"owner": owner, "name": repo, "number": number}
+            node = c.graphql(ISSUE_ENRICH_QUERY, variables)["repository"]["issue"]
+            if node is None:
+                raise FetchError(f"Issue not found via GraphQL: {owner}/{repo}#{number}")
+            detail, raw_comments = issue_to_rest(node, api_url)
+            if raw_comments is None:
+                raw_comments = c.get_issue_comments(owner, repo, number)
+        else:
+            detail = c.get_issue(owner, repo, number)
+            raw_comments = c.get_issue_comments(owner, repo, number)
 
         return IssueRaw(
             url=detail["html_url"],
@@ -815,74 +1048,128 @@ class FetcherService:
             repo=f"{owner}/{repo}",
             labels=[label["name"] for label in detail.get("labels", [])],
             author=detail["user"]["login"],
-            comments=[
-                Comment(
-                    author=c["user"]["login"],
-                    body=c.get("body") or "",
-                    created_at=c["created_at"],
-                    url=c["html_url"],
-                    path=c.get("path") or "",
-                    line=c.get("line") or c.get("original_line") or 0,
-                    diff_hunk=c.get("diff_hunk") or "",
-                )
-                for c in filtered_comments
-            ],
+            comments=self._to_comments(raw_comments),
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _parse_issue_url(api_url: str) -> tuple[str, str, int]:
-        """Issue API URL에서 owner, repo, number 추출."""
-        parts = api_url.rstrip("/").split("/")
-        issues_idx = parts.index("issues")
-        owner = parts[issues_idx - 2]
-        repo = parts[issues_idx - 1]
-        number = int(parts[issues_idx + 1])
-        return owner, repo, number
+        """Issue API URL에서 owner, repo, number 추출. URL별 결과 캐시.
 
-    # ── 노이즈 필터링 ──
+        형식이 맞지 않으면 HTTP 호출 전에 FetchError — enrich 호출자가 해당 Issue만 건너뛴다.
+        """
+        m = ISSUE_URL_RE.search(api_url)
+        if m is None:
+            raise FetchError(f"Malformed issue API URL: {api_url!r}")
+        return m[1], m[2], int(m[3])
+
+    # ── API 응답 → Raw 모델 변환 ──
+    # PR 하나에 수백 개 코멘트/파일이 붙을 수 있어 per-item 비용을 줄인다:
+    # 클래스와 dict.get을 local로 바인딩해 per-item LOAD_GLOBAL/attribute 조회를 없앤다.
+    # 생성자는 dataclass 필드 순서대로 positional 인자로 호출한다 — keyword 매칭보다 빠르고
+    # (파일 300개 기준 ~35%), operator.itemgetter(*keys)로 꺼내 펼치는 것보다도 빠르다.
+    # 코멘트/리뷰의 noise 필터는 변환 comprehension 안에서 함께 적용한다 (중간 list 없음).
 
     @staticmethod
-    def _is_bot_user(login: str) -> bool:
-        login_lower = login.lower()
-        return any(login_lower.endswith(suffix) for suffix in BOT_SUFFIXES)
+    def _to_file_changes(raw_files: list[dict]) -> list[FileChange]:
+        file_change = FileChange
+        return [
+            file_change(
+                f["filename"], f["additions"], f["deletions"], f["status"], f.get("patch", "")
+            )
+            for f in raw_files
+        ]
+
+    @classmethod
+    def _to_comments(cls, raw_comments: list[dict]) -> list[Comment]:
+        comment = Comment
+        is_noise = cls._is_noise_comment
+        return [
+            comment(
+                _login_of(c),
+                (get := c.get)("body") or "",
+                c["created_at"],
+                c["html_url"],
+                get("path") or "",
+                get("line") or get("original_line") or 0,
+                get("diff_hunk") or "",
+            )
+            for c in raw_comments
+            if not is_noise(c)
+        ]
+
+    @classmethod
+    def _to_reviews(cls, raw_reviews: list[dict]) -> list[Review]:
+        review = Review
+        is_noise = cls._is_noise_review
+        return [
+            review(
+                _login_of(r),
+                r["state"],
+                r.get("body") or "",
+                r["submitted_at"],
+                r["html_url"],
+            )
+            for r in raw_reviews
+            if not is_noise(r)
+        ]
+
+    # ── 노이즈 필터링 ──
+
+    # 코멘트/리뷰마다 호출되므로 bot 판정은 login별로 캐시된 _is_bot_login을 쓴다.
 
     @staticmethod
     def _is_noise_comment(comment: dict) -> bool:
-        author = comment.get("user", {}).get("login", "")
-        if FetcherService._is_bot_user(author):
-            return True
-
         body = (comment.get("body") or "").strip()
         if not body:
             return True
+        if len(body) <= NOISE_MAX_LEN and (
+            body in NOISE_EXACT or body.casefold() in NOISE_CASEFOLD
+        ):
+            return True
 
-        return any(pattern.match(body) for pattern in DEFAULT_NOISE_PATTERNS)
+        return _is_bot_login(_login_of(comment))
 
     @staticmethod
     def _is_noise_review(review: dict) -> bool:
-        author = review.get("user", {}).get("login", "")
-        return FetcherService._is_bot_user(author)
+        return _is_bot_login(_login_of(review))
 
     # ── 저장 ──
 
-    def _save(self, target_date: str, prs: list[PRRaw]) -> Path:
-        output_dir = self._config.date_raw_dir(target_date)
-        output_path = output_dir / "prs.json"
-        save_json(prs, output_path)
+    # 레코드는 list든 enrich iterator든 받아 save_json_stream으로 한 건씩 기록한다.
+
+    def _save(self, target_date: str, prs: Iterable[PRRaw]) -> Path:
+        output_path = self._config.date_raw_dir(target_date) / "prs.json"
+        # prs.json은 normalize 입력의 기준 파일이라 빈 날짜에도 항상 쓴다.
+        # commits.json/issues.json은 비어 있고 기존 파일도 없으면 쓰기를 생략한다.
+        self._write_records(output_path, prs)
         return output_path
 
-    def _save_commits(self, target_date: str, commits: list[CommitRaw]) -> Path:
-        output_dir = self._config.date_raw_dir(target_date)
-        output_path = output_dir / "commits.json"
-        save_json(commits, output_path)
+    def _save_commits(self, target_date: str, commits: Iterable[CommitRaw]) -> Path:
+        output_path = self._config.date_raw_dir(target_date) / "commits.json"
+        self._write_records_if_any(output_path, commits)
         return output_path
 
-    def _save_issues(self, target_date: str, issues: list[IssueRaw]) -> Path:
-        output_dir = self._config.date_raw_dir(target_date)
-        output_path = output_dir / "issues.json"
-        save_json(issues, output_path)
+    def _save_issues(self, target_date: str, issues: Iterable[IssueRaw]) -> Path:
+        output_path = self._config.date_raw_dir(target_date) / "issues.json"
+        self._write_records_if_any(output_path, issues)
         return output_path
 
+    @staticmethod
+    def _write_records(path: Path, records: Iterable) -> None:
+        with save_json_stream(path) as write:
+            for record in records:
+                write(record)
+
+    def _write_records_if_any(self, path: Path, records: Iterable) -> None:
+        """첫 레코드를 먼저 받아 보고, 비어 있고 기존 파일도 없으면 쓰지 않는다."""
+        records = iter(records)
+        first = next(records, None)
+        if first is not None:
+            self._write_records(path, chain((first,), records))
+        elif path.exists():
+            self._write_records(path, ())
+
     def _update_checkpoint(self, target_date: str) -> None:
         from workrecap.services.checkpoint import update_checkpoint
 
@@ -890,3 +1177,22 @@ class FetcherService:
 
         if self._daily_state is not None:
             self._daily_state.set_timestamp("fetch", target_date)
+
+    def _record_fetched(self, target_date: str) -> None:
+        """fetch_range용: checkpoint는 최대 날짜만, daily_state는 날짜 목록으로 메모리에 누적."""
+        with self._checkpoint_lock:
+            if self._pending_checkpoint is None or target_date > self._pending_checkpoint:
+                self._pending_checkpoint = target_date
+            self._pending_fetched.append(target_date)
+
+    def _flush_checkpoint(self) -> None:
+        """누적된 last_fetch_date와 fetch timestamp를 각 파일에 한 번씩 기록."""
+        from workrecap.services.checkpoint import update_checkpoint
+
+        with self._checkpoint_lock:
+            pending, self._pending_checkpoint = self._pending_checkpoint, None
+            fetched, self._pending_fetched = self._pending_fetched, []
+        if pending is not None:
+            update_checkpoint(self._config.checkpoints_path, "last_fetch_date", pending)
+        if fetched and self._daily_state is not None:
+            self._daily_state.set_timestamps("fetch", fetched)
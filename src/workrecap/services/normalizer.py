@@ -4,8 +4,13 @@ from __future__ import annotations
 
 import json
 import logging
+import multiprocessing
+import os
+import re
+import threading
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -15,6 +20,11 @@ if TYPE_CHECKING:
 
 from jinja2 import Template
 
+try:
+    import orjson
+except ImportError:  # orjson은 선택적 가속 — 없으면 stdlib json 사용
+    orjson = None
+
 from workrecap.config import AppConfig
 from workrecap.exceptions import NormalizeError
 from workrecap.services.date_utils import date_range
@@ -23,12 +33,13 @@ from workrecap.models import (
     ActivityKind,
     CommitRaw,
     DailyStats,
+    FileChange,
     GitHubStats,
     IssueRaw,
     PRRaw,
     commit_raw_from_dict,
     issue_raw_from_dict,
-    load_json,
+    iter_json_items,
     pr_raw_from_dict,
     save_json,
     save_jsonl,
@@ -36,6 +47,12 @@ from workrecap.models import (
 
 logger = logging.getLogger(__name__)
 
+# Activity 정렬 키. lambda보다 호출 비용이 낮음
+_activity_ts = attrgetter("ts")
+
+# LLM이 json_mode에서도 ```json ... ``` 로 감싸 응답하는 경우의 code fence
+_FENCE_RE = re.compile(r"^\s*```[A-Za-z]*[ \t]*\n?(.*?)\n?```\s*$", re.S)
+
 
 class NormalizerService:
     def __init__(
@@ -46,13 +63,48 @@ class NormalizerService:
     ) -> None:
         self._config = config
         self._username = config.username
+        # 작성자 비교용 소문자 username — 코멘트/리뷰마다 .lower() 반복 방지
+        self._username_lc = config.username.lower()
         self._daily_state = daily_state
         self._llm = llm
+        # enrich.md → (system_prompt, 컴파일된 Template, SPLIT 여부).
+        # 날짜마다 파일 읽기/Jinja 파싱을 반복하지 않도록 첫 사용 시 한 번만 로드
+        self._enrich_template: tuple[str, Template, bool] | None = None
+        # 서비스 전체의 동시 enrich LLM 요청 수 상한. normalize_range 병렬 실행의 날짜별
+        # chunk 요청이 합쳐져도 max_workers개를 넘지 않는다
+        self._llm_slots = threading.BoundedSemaphore(max(1, config.max_workers))
+        # LLM 미사용 range 정규화용 spawn ProcessPool. 워커마다 패키지 import 비용이 커서
+        # run_range의 월별 normalize_range 호출들이 하나를 재사용한다 (close()로 종료)
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._process_pool_workers = 0
+        self._process_pool_lock = threading.Lock()
 
     @property
     def source_name(self) -> str:
         return "github"
 
+    def close(self) -> None:
+        """normalize_range가 띄운 ProcessPool 워커를 종료. 이후 호출 시 다시 생성된다."""
+        with self._process_pool_lock:
+            pool, self._process_pool = self._process_pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    def _get_process_pool(self, max_workers: int) -> ProcessPoolExecutor:
+        """max_workers 크기의 공유 ProcessPool 반환. 크기가 다르면 새로 만든다."""
+        with self._process_pool_lock:
+            pool = self._process_pool
+            if pool is not None and self._process_pool_workers == max_workers:
+                return pool
+            # spawn: API 서버 등 멀티스레드 부모에서 fork 시 lock 상속으로 인한 교착 방지.
+            # spawn 워커는 필요할 때만 늘어나므로 날짜가 적으면 max_workers개를 다 띄우지 않는다
+            ctx = multiprocessing.get_context("spawn")
+            self._process_pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx)
+            self._process_pool_workers = max_workers
+        if pool is not None:
+            pool.shutdown()
+        return self._process_pool
+
     def normalize(
         self, target_date: str, progress: Callable[[str], None] | None = None
     ) -> tuple[Path, Path, list[Activity], DailyStats]:
@@ -72,16 +124,20 @@ class NormalizerService:
         logger.info("Normalizing %s", target_date)
         if progress:
             progress(f"Normalizing {target_date}...")
+        result = self._write_normalized(target_date)
+        self._update_checkpoint(target_date)
+        return result
+
+    def _write_normalized(self, target_date: str) -> tuple[Path, Path, list[Activity], DailyStats]:
+        """raw 로드 → 변환 → enrichment → activities/stats 저장. checkpoint는 갱신하지 않음."""
         raw_path = self._config.date_raw_dir(target_date) / "prs.json"
         if not raw_path.exists():
             raise NormalizeError(f"Raw file not found: {raw_path}")
 
         try:
-            raw_data = load_json(raw_path)
+            prs = [pr_raw_from_dict(d) for d in iter_json_items(raw_path)]
         except Exception as e:
             raise NormalizeError(f"Failed to parse {raw_path}: {e}") from e
-
-        prs = [pr_raw_from_dict(d) for d in raw_data]
         logger.debug("Loaded %d PRs from %s", len(prs), raw_path)
 
         # Commit/Issue 로드 (optional — 없으면 빈 리스트, 하위 호환)
@@ -91,7 +147,7 @@ class NormalizerService:
         commits: list[CommitRaw] = []
         if commits_path.exists():
             try:
-                commits = [commit_raw_from_dict(d) for d in load_json(commits_path)]
+                commits = [commit_raw_from_dict(d) for d in iter_json_items(commits_path)]
             except Exception:
                 logger.warning("Failed to parse %s, skipping commits", commits_path)
 
@@ -99,7 +155,7 @@ class NormalizerService:
         issues: list[IssueRaw] = []
         if issues_path.exists():
             try:
-                issues = [issue_raw_from_dict(d) for d in load_json(issues_path)]
+                issues = [issue_raw_from_dict(d) for d in iter_json_items(issues_path)]
             except Exception:
                 logger.warning("Failed to parse %s, skipping issues", issues_path)
 
@@ -108,7 +164,7 @@ class NormalizerService:
         issue_activities = self._convert_issue_activities(issues, target_date)
 
         activities = pr_activities + commit_activities + issue_activities
-        activities.sort(key=lambda a: a.ts)
+        activities.sort(key=_activity_ts)
 
         self._enrich_activities(activities)
 
@@ -127,8 +183,6 @@ class NormalizerService:
             target_date,
             out_dir,
         )
-
-        self._update_checkpoint(target_date)
         return activities_path, stats_path, activities, stats
 
     def normalize_range(
@@ -158,23 +212,33 @@ class NormalizerService:
         if progress:
             progress(f"Normalizing {since}..{until} ({len(dates)} dates)")
 
+        # daily_state가 없으면 skip 판정을 날짜별 stat 2회 대신 디렉토리 scan 결과로 처리
+        # (호출별 local — 같은 인스턴스에서 normalize_range가 겹쳐도 서로 덮어쓰지 않는다)
+        normalized = None
+        if not force and self._daily_state is None:
+            normalized = self._scan_normalized_dates(dates)
+
         if batch and self._llm is not None:
-            return self._normalize_range_batch(dates, force, progress)
+            return self._normalize_range_batch(dates, force, progress, normalized)
 
         if max_workers <= 1:
-            return self._normalize_range_sequential(dates, force, progress)
-        return self._normalize_range_parallel(dates, force, progress, max_workers)
+            return self._normalize_range_sequential(dates, force, progress, normalized)
+        if self._llm is None and len(dates) > 1:
+            # LLM 호출이 없으면 JSON 파싱/변환 위주의 CPU 작업 → GIL을 피해 프로세스로 분산
+            return self._normalize_range_processes(dates, force, progress, max_workers, normalized)
+        return self._normalize_range_parallel(dates, force, progress, max_workers, normalized)
 
     def _normalize_range_sequential(
         self,
         dates: list[str],
         force: bool,
         progress: Callable[[str], None] | None,
+        normalized: set[str] | None = None,
     ) -> list[dict]:
         results: list[dict] = []
         for d in dates:
             try:
-                if not force and self._is_date_normalized(d):
+                if not force and self._is_date_normalized(d, normalized):
                     results.append({"date": d, "status": "skipped"})
                     continue
                 self.normalize(d, progress=progress)
@@ -190,12 +254,13 @@ class NormalizerService:
         force: bool,
         progress: Callable[[str], None] | None,
         max_workers: int,
+        normalized: set[str] | None = None,
     ) -> list[dict]:
         results_by_date: dict[str, dict] = {}
 
         def process_date(d: str) -> dict:
             try:
-                if not force and self._is_date_normalized(d):
+                if not force and self._is_date_normalized(d, normalized):
                     return {"date": d, "status": "skipped"}
                 self.normalize(d, progress=progress)
                 return {"date": d, "status": "success"}
@@ -212,11 +277,58 @@ class NormalizerService:
         # Return in original date order
         return [results_by_date[d] for d in dates]
 
+    def _normalize_range_processes(
+        self,
+        dates: list[str],
+        force: bool,
+        progress: Callable[[str], None] | None,
+        max_workers: int,
+        normalized: set[str] | None = None,
+    ) -> list[dict]:
+        """날짜별 정규화를 ProcessPool로 분산 (LLM 미사용 시).
+
+        skip 체크와 checkpoint/daily_state 기록은 부모 프로세스에서만 수행하고,
+        자식은 raw 파싱/변환/저장만 담당한다. 풀은 호출 간에 재사용한다 (_get_process_pool).
+        """
+        results_by_date: dict[str, dict] = {}
+        pending: list[str] = []
+        for d in dates:
+            try:
+                if not force and self._is_date_normalized(d, normalized):
+                    results_by_date[d] = {"date": d, "status": "skipped"}
+                    continue
+            except Exception as e:
+                logger.warning("Failed to normalize %s: %s", d, e)
+                results_by_date[d] = {"date": d, "status": "failed", "error": str(e)}
+                continue
+            pending.append(d)
+
+        if pending:
+            executor = self._get_process_pool(max_workers)
+            futures = {
+                executor.submit(_normalize_date_in_process, self._config, d): d for d in pending
+            }
+            # 제출 시점이 아니라 완료 시점에 진행 상황 보고 (대기 중인 날짜는 아직 실행 전)
+            for done, future in enumerate(as_completed(futures), 1):
+                d = futures[future]
+                try:
+                    future.result()
+                    self._update_checkpoint(d)
+                    results_by_date[d] = {"date": d, "status": "success"}
+                except Exception as e:
+                    logger.warning("Failed to normalize %s: %s", d, e)
+                    results_by_date[d] = {"date": d, "status": "failed", "error": str(e)}
+                if progress:
+                    progress(f"Normalized {d} ({done}/{len(pending)})")
+
+        return [results_by_date[d] for d in dates]
+
     def _normalize_range_batch(
         self,
         dates: list[str],
         force: bool,
         progress: Callable[[str], None] | None,
+        normalized: set[str] | None = None,
     ) -> list[dict]:
         """Batch mode: normalize all dates, then enrich via single batch API call."""
         # Phase 1: Normalize all dates without enrichment, collecting activities per date
@@ -225,7 +337,7 @@ class NormalizerService:
 
         for d in dates:
             try:
-                if not force and self._is_date_normalized(d):
+                if not force and self._is_date_normalized(d, normalized):
                     results.append({"date": d, "status": "skipped"})
                     continue
                 activities = self._normalize_without_enrich(d, progress)
@@ -260,15 +372,14 @@ class NormalizerService:
         if not raw_path.exists():
             raise NormalizeError(f"Raw file not found: {raw_path}")
 
-        raw_data = load_json(raw_path)
-        prs = [pr_raw_from_dict(d) for d in raw_data]
+        prs = [pr_raw_from_dict(d) for d in iter_json_items(raw_path)]
 
         raw_dir = self._config.date_raw_dir(target_date)
         commits: list[CommitRaw] = []
         commits_path = raw_dir / "commits.json"
         if commits_path.exists():
             try:
-                commits = [commit_raw_from_dict(d) for d in load_json(commits_path)]
+                commits = [commit_raw_from_dict(d) for d in iter_json_items(commits_path)]
             except Exception:
                 logger.warning("Failed to parse %s, skipping commits", commits_path)
 
@@ -276,7 +387,7 @@ class NormalizerService:
         issues_path = raw_dir / "issues.json"
         if issues_path.exists():
             try:
-                issues = [issue_raw_from_dict(d) for d in load_json(issues_path)]
+                issues = [issue_raw_from_dict(d) for d in iter_json_items(issues_path)]
             except Exception:
                 logger.warning("Failed to parse %s, skipping issues", issues_path)
 
@@ -285,7 +396,7 @@ class NormalizerService:
         issue_activities = self._convert_issue_activities(issues, target_date)
 
         activities = pr_activities + commit_activities + issue_activities
-        activities.sort(key=lambda a: a.ts)
+        activities.sort(key=_activity_ts)
 
         stats = self._compute_stats(activities, target_date)
 
@@ -347,14 +458,31 @@ class NormalizerService:
         except Exception as e:
             logger.warning("Batch enrichment failed, continuing without enrichment: %s", e)
 
-    def _prepare_enrich_prompt(self, activities: list[Activity]) -> tuple[str, str] | None:
-        """Prepare (system_prompt, user_content) for enrichment. Returns None if no template."""
+    def _load_enrich_template(self) -> tuple[str, Template, bool] | None:
+        """enrich.md를 (system_prompt, Template, SPLIT 여부)로 한 번만 읽어 캐시. 없으면 None."""
+        if self._enrich_template is not None:
+            return self._enrich_template
+
         template_path = self._config.prompts_dir / "enrich.md"
         if not template_path.exists():
             return None
 
         template_text = template_path.read_text(encoding="utf-8")
         marker = "<!-- SPLIT -->"
+        if marker in template_text:
+            static_part, dynamic_part = template_text.split(marker, 1)
+            self._enrich_template = (static_part.strip(), Template(dynamic_part), True)
+        else:
+            system_prompt = "You are a code change classifier."
+            self._enrich_template = (system_prompt, Template(template_text), False)
+        return self._enrich_template
+
+    def _prepare_enrich_prompt(self, activities: list[Activity]) -> tuple[str, str] | None:
+        """Prepare (system_prompt, user_content) for enrichment. Returns None if no template."""
+        loaded = self._load_enrich_template()
+        if loaded is None:
+            return None
+        system_prompt, template, is_split = loaded
 
         act_dicts = [
             {
@@ -370,21 +498,20 @@ class NormalizerService:
             for act in activities
         ]
 
-        if marker in template_text:
-            static_part, dynamic_part = template_text.split(marker, 1)
-            system_prompt = static_part.strip()
-            user_content = Template(dynamic_part).render(activities=act_dicts).strip()
-        else:
-            system_prompt = "You are a code change classifier."
-            user_content = Template(template_text).render(activities=act_dicts)
-
+        user_content = template.render(activities=act_dicts)
+        if is_split:
+            user_content = user_content.strip()
         return system_prompt, user_content
 
     @staticmethod
     def _apply_enrichment(activities: list[Activity], response_text: str) -> None:
         """Parse enrichment JSON and apply to activities."""
         try:
-            enrichments = json.loads(response_text)
+            fenced = _FENCE_RE.match(response_text)
+            if fenced:
+                response_text = fenced.group(1)
+            # orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스
+            enrichments = orjson.loads(response_text) if orjson else json.loads(response_text)
             for entry in enrichments:
                 idx = entry.get("index")
                 if idx is not None and 0 <= idx < len(activities):
@@ -393,13 +520,42 @@ class NormalizerService:
         except (json.JSONDecodeError, TypeError) as e:
             logger.warning("Failed to parse enrichment response: %s", e)
 
-    def _is_date_normalized(self, date_str: str) -> bool:
-        """daily_state 있으면 timestamp cascade 체크, 없으면 파일 존재 체크."""
+    def _is_date_normalized(self, date_str: str, normalized: set[str] | None = None) -> bool:
+        """daily_state 있으면 timestamp cascade 체크, 없으면 파일 존재 체크.
+
+        normalized는 normalize_range가 미리 scan한 날짜 집합 — 주어지면 stat 대신 사용.
+        """
         if self._daily_state is not None:
             return not self._daily_state.is_normalize_stale(date_str)
+        if normalized is not None:
+            return date_str in normalized
         norm_dir = self._config.date_normalized_dir(date_str)
         return (norm_dir / "activities.jsonl").exists() and (norm_dir / "stats.json").exists()
 
+    def _scan_normalized_dates(self, dates: list[str]) -> set[str]:
+        """dates 중 activities.jsonl + stats.json이 모두 있는 날짜 집합.
+
+        월 디렉토리마다 scandir 1회로 날짜 디렉토리를 찾고, 존재하는 날짜만 내부를 나열한다.
+        """
+        wanted = set(dates)
+        required = {"activities.jsonl", "stats.json"}
+        found: set[str] = set()
+        for month in sorted({d[:7] for d in dates}):
+            month_dir = self._config.normalized_dir / month[:4] / month[5:7]
+            try:
+                with os.scandir(month_dir) as it:
+                    day_entries = list(it)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            for day in day_entries:
+                date_str = f"{month}-{day.name}"
+                if date_str not in wanted or not day.is_dir():
+                    continue
+                with os.scandir(day.path) as it:
+                    if required <= {e.name for e in it}:
+                        found.add(date_str)
+        return found
+
     def _update_checkpoint(self, target_date: str) -> None:
         """last_normalize_date 키 업데이트. Thread-safe with date comparison guard."""
         from workrecap.services.checkpoint import update_checkpoint
@@ -421,6 +577,28 @@ class NormalizerService:
             return
 
         logger.info("Enriching %d activities with LLM", len(activities))
+        size = self._config.enrich_chunk_size
+        if size <= 0 or len(activities) <= size:
+            chunks = [activities]
+        else:
+            chunks = [activities[i : i + size] for i in range(0, len(activities), size)]
+
+        if len(chunks) == 1:
+            self._enrich_chunk(activities)
+            return
+
+        # chunk마다 index가 0부터 매겨지고 _apply_enrichment가 chunk의 Activity를 직접 갱신하므로
+        # 결과 재조립이 필요 없다. 실패한 chunk만 빈 필드로 남는다.
+        # 실제 LLM 동시 요청 수는 _enrich_chunk의 _llm_slots가 날짜를 가로질러 제한한다.
+        workers = min(len(chunks), max(1, self._config.max_workers))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(self._enrich_chunk, chunks))
+        logger.info(
+            "Enrichment complete for %d activities in %d chunks", len(activities), len(chunks)
+        )
+
+    def _enrich_chunk(self, activities: list[Activity]) -> None:
+        """activity 묶음 하나를 LLM 요청 1회로 enrichment. 실패 시 로그만 남김."""
         try:
             prompt = self._prepare_enrich_prompt(activities)
             if prompt is None:
@@ -428,13 +606,14 @@ class NormalizerService:
                 return
 
             system_prompt, user_content = prompt
-            response = self._llm.chat(
-                system_prompt,
-                user_content,
-                task="enrich",
-                json_mode=True,
-                cache_system_prompt=True,
-            )
+            with self._llm_slots:
+                response = self._llm.chat(
+                    system_prompt,
+                    user_content,
+                    task="enrich",
+                    json_mode=True,
+                    cache_system_prompt=True,
+                )
 
             self._apply_enrichment(activities, response)
             logger.info("Enrichment complete for %d activities", len(activities))
@@ -452,37 +631,57 @@ class NormalizerService:
           - reviews에 username → PR_REVIEWED (ts = submitted_at), self-review 제외
           - comments에 username → PR_COMMENTED (ts = earliest created_at)
           - 각 activity의 ts가 target_date에 해당하지 않으면 제외
+            (ISO 8601 타임스탬프의 날짜 부분 비교 `ts[:10] == target_date`, 변환 루프 전체 공통)
         """
         activities: list[Activity] = []
+        uname = self._username_lc
 
         for pr in prs:
-            is_author = pr.author.lower() == self._username.lower()
+            is_author = pr.author.lower() == uname
+
+            # 사용자 코멘트를 한 번에 분류: 리뷰 inline / 당일 코멘트 / 당일 inline context
+            reviewer_inline: list[dict] = []
+            user_comments = []
+            contexts: list[dict] = []
+            earliest_ts = ""
+            for c in pr.comments:
+                if c.author.lower() != uname:
+                    continue
+                ctx = (
+                    {"path": c.path, "line": c.line, "diff_hunk": c.diff_hunk, "body": c.body}
+                    if c.path
+                    else None
+                )
+                if ctx and not is_author:
+                    reviewer_inline.append(ctx)
+                if c.created_at[:10] == target_date:
+                    user_comments.append(c)
+                    if not earliest_ts or c.created_at < earliest_ts:
+                        earliest_ts = c.created_at
+                    if ctx:
+                        contexts.append(ctx)
+
+            # pr.files 집계는 PR당 최대 3개 activity가 공유 — 첫 activity 생성 시 한 번만 계산
+            file_stats: tuple[int, int, list[str], dict[str, str]] | None = None
 
             # PR_AUTHORED
-            if is_author and self._matches_date(pr.created_at, target_date):
-                activities.append(self._make_activity(pr, ActivityKind.PR_AUTHORED, pr.created_at))
+            if is_author and pr.created_at[:10] == target_date:
+                file_stats = self._file_stats(pr.files)
+                activities.append(
+                    self._make_activity(pr, ActivityKind.PR_AUTHORED, pr.created_at, file_stats)
+                )
 
             # PR_REVIEWED (self-review 제외)
             if not is_author:
                 for review in pr.reviews:
-                    if review.author.lower() == self._username.lower() and self._matches_date(
-                        review.submitted_at, target_date
-                    ):
-                        reviewer_inline = [
-                            {
-                                "path": c.path,
-                                "line": c.line,
-                                "diff_hunk": c.diff_hunk,
-                                "body": c.body,
-                            }
-                            for c in pr.comments
-                            if c.author.lower() == self._username.lower() and c.path
-                        ]
+                    if review.author.lower() == uname and review.submitted_at[:10] == target_date:
+                        file_stats = file_stats or self._file_stats(pr.files)
                         activities.append(
                             self._make_activity(
                                 pr,
                                 ActivityKind.PR_REVIEWED,
                                 review.submitted_at,
+                                file_stats,
                                 evidence_urls=[review.url],
                                 review_bodies=[review.body],
                                 comment_contexts=reviewer_inline,
@@ -491,36 +690,21 @@ class NormalizerService:
                         break  # PR당 1개 review activity
 
             # PR_COMMENTED
-            user_comments = [
-                c
-                for c in pr.comments
-                if c.author.lower() == self._username.lower()
-                and self._matches_date(c.created_at, target_date)
-            ]
             if user_comments:
-                earliest = min(user_comments, key=lambda c: c.created_at)
-                contexts = [
-                    {
-                        "path": c.path,
-                        "line": c.line,
-                        "diff_hunk": c.diff_hunk,
-                        "body": c.body,
-                    }
-                    for c in user_comments
-                    if c.path
-                ]
+                file_stats = file_stats or self._file_stats(pr.files)
                 activities.append(
                     self._make_activity(
                         pr,
                         ActivityKind.PR_COMMENTED,
-                        earliest.created_at,
+                        earliest_ts,
+                        file_stats,
                         evidence_urls=[c.url for c in user_comments],
                         comment_bodies=[c.body for c in user_comments],
                         comment_contexts=contexts,
                     )
                 )
 
-        activities.sort(key=lambda a: a.ts)
+        activities.sort(key=_activity_ts)
         return activities
 
     # ── Commit → Activity 변환 ──
@@ -531,16 +715,13 @@ class NormalizerService:
         """Commit 목록에서 COMMIT Activity를 생성."""
         activities: list[Activity] = []
         for commit in commits:
-            if not self._matches_date(commit.committed_at, target_date):
+            if commit.committed_at[:10] != target_date:
                 continue
 
             # 제목: commit message 첫 줄 (truncation 없음)
             title = commit.message.split("\n", 1)[0]
 
-            total_adds = sum(f.additions for f in commit.files)
-            total_dels = sum(f.deletions for f in commit.files)
-            file_names = [f.filename for f in commit.files]
-            file_patches = {f.filename: f.patch for f in commit.files if f.patch}
+            total_adds, total_dels, file_names, file_patches = self._file_stats(commit.files)
 
             activities.append(
                 Activity(
@@ -566,11 +747,10 @@ class NormalizerService:
     def _convert_issue_activities(self, issues: list[IssueRaw], target_date: str) -> list[Activity]:
         """Issue 목록에서 ISSUE_AUTHORED / ISSUE_COMMENTED Activity를 생성."""
         activities: list[Activity] = []
+        uname = self._username_lc
         for issue in issues:
             # ISSUE_AUTHORED
-            if issue.author.lower() == self._username.lower() and self._matches_date(
-                issue.created_at, target_date
-            ):
+            if issue.author.lower() == uname and issue.created_at[:10] == target_date:
                 activities.append(
                     Activity(
                         ts=issue.created_at,
@@ -586,17 +766,17 @@ class NormalizerService:
                 )
 
             # ISSUE_COMMENTED
-            user_comments = [
-                c
-                for c in issue.comments
-                if c.author.lower() == self._username.lower()
-                and self._matches_date(c.created_at, target_date)
-            ]
+            user_comments = []
+            earliest_ts = ""
+            for c in issue.comments:
+                if c.author.lower() == uname and c.created_at[:10] == target_date:
+                    user_comments.append(c)
+                    if not earliest_ts or c.created_at < earliest_ts:
+                        earliest_ts = c.created_at
             if user_comments:
-                earliest = min(user_comments, key=lambda c: c.created_at)
                 activities.append(
                     Activity(
-                        ts=earliest.created_at,
+                        ts=earliest_ts,
                         kind=ActivityKind.ISSUE_COMMENTED,
                         repo=issue.repo,
                         external_id=issue.number,
@@ -611,20 +791,32 @@ class NormalizerService:
                 )
         return activities
 
+    @staticmethod
+    def _file_stats(files: list[FileChange]) -> tuple[int, int, list[str], dict[str, str]]:
+        """PR/commit files 한 번 순회로 (additions, deletions, 파일명 목록, filename → patch)."""
+        total_adds = total_dels = 0
+        file_names: list[str] = []
+        file_patches: dict[str, str] = {}
+        for f in files:
+            total_adds += f.additions
+            total_dels += f.deletions
+            file_names.append(f.filename)
+            if f.patch:
+                file_patches[f.filename] = f.patch
+        return total_adds, total_dels, file_names, file_patches
+
     def _make_activity(
         self,
         pr: PRRaw,
         kind: ActivityKind,
         ts: str,
+        file_stats: tuple[int, int, list[str], dict[str, str]] | None = None,
         evidence_urls: list[str] | None = None,
         review_bodies: list[str] | None = None,
         comment_bodies: list[str] | None = None,
         comment_contexts: list[dict] | None = None,
     ) -> Activity:
-        total_adds = sum(f.additions for f in pr.files)
-        total_dels = sum(f.deletions for f in pr.files)
-        file_names = [f.filename for f in pr.files]
-        file_patches = {f.filename: f.patch for f in pr.files if f.patch}
+        total_adds, total_dels, file_names, file_patches = file_stats or self._file_stats(pr.files)
 
         return Activity(
             ts=ts,
@@ -668,49 +860,56 @@ class NormalizerService:
 
         return f"{kind.value}: [{dir_hint}] {len(pr.files)}개 파일 변경 ({pr.repo}) +{adds}/-{dels}"
 
-    # ── 날짜 필터링 ──
-
-    @staticmethod
-    def _matches_date(iso_timestamp: str, target_date: str) -> bool:
-        """ISO 8601 타임스탬프의 날짜 부분이 target_date와 일치하는지 확인."""
-        return iso_timestamp[:10] == target_date
-
     # ── DailyStats 계산 ──
 
     @staticmethod
     def _compute_stats(activities: list[Activity], target_date: str) -> DailyStats:
-        authored = [a for a in activities if a.kind == ActivityKind.PR_AUTHORED]
-        reviewed = [a for a in activities if a.kind == ActivityKind.PR_REVIEWED]
-        commented = [a for a in activities if a.kind == ActivityKind.PR_COMMENTED]
-        commits = [a for a in activities if a.kind == ActivityKind.COMMIT]
-        issue_authored = [a for a in activities if a.kind == ActivityKind.ISSUE_AUTHORED]
-        issue_commented = [a for a in activities if a.kind == ActivityKind.ISSUE_COMMENTED]
-
-        # additions/deletions: authored PR + commit 합산
-        total_adds = sum(a.additions for a in authored) + sum(a.additions for a in commits)
-        total_dels = sum(a.deletions for a in authored) + sum(a.deletions for a in commits)
-
-        repos = sorted(set(a.repo for a in activities))
+        # 한 번의 순회로 kind별 개수 + stats payload + repo 수집 + additions/deletions 합산
+        counts = dict.fromkeys(ActivityKind, 0)
+        payloads: dict[ActivityKind, list[dict]] = {
+            ActivityKind.PR_AUTHORED: [],
+            ActivityKind.PR_REVIEWED: [],
+            ActivityKind.COMMIT: [],
+            ActivityKind.ISSUE_AUTHORED: [],
+        }
+        repo_set: set[str] = set()
+        total_adds = total_dels = 0
+        for a in activities:
+            kind = a.kind
+            counts[kind] += 1
+            repo_set.add(a.repo)
+            payload = payloads.get(kind)
+            if payload is None:
+                continue
+            entry = {"url": a.url, "title": a.title, "repo": a.repo}
+            payload.append(entry)
+            if kind == ActivityKind.COMMIT:
+                entry["sha"] = a.sha
+            # additions/deletions: authored PR + commit 합산
+            if kind == ActivityKind.COMMIT or kind == ActivityKind.PR_AUTHORED:
+                total_adds += a.additions
+                total_dels += a.deletions
 
         return DailyStats(
             date=target_date,
             github=GitHubStats(
-                authored_count=len(authored),
-                reviewed_count=len(reviewed),
-                commented_count=len(commented),
+                authored_count=counts[ActivityKind.PR_AUTHORED],
+                reviewed_count=counts[ActivityKind.PR_REVIEWED],
+                commented_count=counts[ActivityKind.PR_COMMENTED],
                 total_additions=total_adds,
                 total_deletions=total_dels,
-                repos_touched=repos,
-                authored_prs=[{"url": a.url, "title": a.title, "repo": a.repo} for a in authored],
-                reviewed_prs=[{"url": a.url, "title": a.title, "repo": a.repo} for a in reviewed],
-                commit_count=len(commits),
-                issue_authored_count=len(issue_authored),
-                issue_commented_count=len(issue_commented),
-                commits=[
-                    {"url": a.url, "title": a.title, "repo": a.repo, "sha": a.sha} for a in commits
-                ],
-                authored_issues=[
-                    {"url": a.url, "title": a.title, "repo": a.repo} for a in issue_authored
-                ],
+                repos_touched=sorted(repo_set),
+                authored_prs=payloads[ActivityKind.PR_AUTHORED],
+                reviewed_prs=payloads[ActivityKind.PR_REVIEWED],
+                commit_count=counts[ActivityKind.COMMIT],
+                issue_authored_count=counts[ActivityKind.ISSUE_AUTHORED],
+                issue_commented_count=counts[ActivityKind.ISSUE_COMMENTED],
+                commits=payloads[ActivityKind.COMMIT],
+                authored_issues=payloads[ActivityKind.ISSUE_AUTHORED],
             ),
         )
+
+
+def _normalize_date_in_process(config: AppConfig, target_date: str) -> None:
+    """ProcessPool 워커: LLM 없이 한 날짜를 정규화해 저장. checkpoint는 부모가 기록."""
+    NormalizerService(config)._write_normalized(target_date)
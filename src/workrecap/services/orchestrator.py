@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
 from datetime import date
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -15,6 +17,7 @@ from workrecap.exceptions import (
     StepFailedError,
     SummarizeError,
 )
+from workrecap.services.date_utils import monthly_chunks
 from workrecap.services.fetcher import FetcherService
 from workrecap.services.normalizer import NormalizerService
 from workrecap.services.summarizer import SummarizerService
@@ -154,6 +157,9 @@ class OrchestratorService:
     ) -> list[dict]:
         """
         기간 범위 backfill using bulk operations.
+
+        월 단위 chunk로 fetch하고, 완료된 chunk의 normalize/summarize는 다음 chunk fetch와
+        병행한다 (batch 모드는 기간 전체 한 번).
         """
         logger.info(
             "Pipeline range: %s..%s (force=%s, types=%s, workers=%d, batch=%s)",
@@ -169,16 +175,82 @@ class OrchestratorService:
         if start > end:
             return []
 
-        if progress:
-            progress(f"Phase 1/3: Fetching {since}..{until}")
-        fetch_results = self._fetcher.fetch_range(
-            since, until, types=types, force=force, progress=progress
+        # 월 단위 chunk로 나눠 chunk k의 normalize/summarize를 chunk k+1 fetch(I/O)와 겹친다.
+        # batch 모드는 기간 전체를 한 번의 batch 호출로 묶어야 하므로 분할하지 않음.
+        chunks = [(since, until)] if batch else monthly_chunks(since, until)
+        fetch_results: list[dict] = []
+        downstream_futures: list[Future] = []
+        # downstream worker 1개 → chunk 순서대로 normalize/summarize.
+        # 끝나면 월별 normalize_range가 재사용한 ProcessPool도 정리 (closing)
+        with closing(self._normalizer), ThreadPoolExecutor(max_workers=1) as downstream:
+            for chunk_since, chunk_until in chunks:
+                # 앞 chunk의 normalize/summarize가 이미 실패했으면 남은 월은 fetch하지 않음
+                self._raise_if_failed(downstream_futures)
+                if progress:
+                    progress(f"Phase 1/3: Fetching {chunk_since}..{chunk_until}")
+                fetch_results.extend(
+                    self._fetcher.fetch_range(
+                        chunk_since, chunk_until, types=types, force=force, progress=progress
+                    )
+                )
+                logger.info("Phase complete: fetch → normalize (%s..%s)", chunk_since, chunk_until)
+                downstream_futures.append(
+                    downstream.submit(
+                        self._normalize_and_summarize,
+                        chunk_since,
+                        chunk_until,
+                        force=force,
+                        progress=progress,
+                        max_workers=max_workers,
+                        batch=batch,
+                        detailed=detailed,
+                        repos=repos,
+                    )
+                )
+
+            normalize_results: list[dict] = []
+            summarize_results: list[dict] = []
+            for future in downstream_futures:
+                chunk_normalized, chunk_summarized = future.result()
+                normalize_results.extend(chunk_normalized)
+                summarize_results.extend(chunk_summarized)
+
+        results = self._merge_results(fetch_results, normalize_results, summarize_results)
+
+        succeeded = sum(1 for r in results if r["status"] == "success")
+        logger.info(
+            "Range complete: %d/%d succeeded (%s ~ %s)",
+            succeeded,
+            len(results),
+            since,
+            until,
         )
+        return results
 
-        logger.info("Phase complete: fetch → normalize (%s..%s)", since, until)
+    @staticmethod
+    def _raise_if_failed(futures: list[Future]) -> None:
+        """완료된 future 중 예외로 끝난 것이 있으면 대기 중인 future를 취소하고 그 예외를 raise."""
+        for future in futures:
+            if future.done() and not future.cancelled() and future.exception() is not None:
+                for pending in futures:
+                    pending.cancel()
+                raise future.exception()
+
+    def _normalize_and_summarize(
+        self,
+        since: str,
+        until: str,
+        *,
+        force: bool,
+        progress: Callable[[str], None] | None,
+        max_workers: int,
+        batch: bool,
+        detailed: bool,
+        repos: list[str] | None,
+    ) -> tuple[list[dict], list[dict]]:
+        """fetch가 끝난 구간의 normalize_range → daily_range. (normalize, summarize) 결과 반환."""
         if progress:
             progress(f"Phase 2/3: Normalizing {since}..{until}")
-
         normalize_results = self._normalizer.normalize_range(
             since, until, force=force, progress=progress, max_workers=max_workers, batch=batch
         )
@@ -196,18 +268,7 @@ class OrchestratorService:
             detailed=detailed,
             repos=repos,
         )
-
-        results = self._merge_results(fetch_results, normalize_results, summarize_results)
-
-        succeeded = sum(1 for r in results if r["status"] == "success")
-        logger.info(
-            "Range complete: %d/%d succeeded (%s ~ %s)",
-            succeeded,
-            len(results),
-            since,
-            until,
-        )
-        return results
+        return normalize_results, summarize_results
 
     def run_weekly(self, year: int, week: int, force: bool = False) -> Path:
         """Weekly summary 생성."""
@@ -233,35 +294,23 @@ class OrchestratorService:
         norm_by_date = {r["date"]: r for r in normalize_results}
         summ_by_date = {r["date"]: r for r in summarize_results}
 
-        # Collect all dates, preserving order from fetch_results
-        all_dates: list[str] = []
-        seen: set[str] = set()
-        for results_list in (fetch_results, normalize_results, summarize_results):
-            for r in results_list:
-                if r["date"] not in seen:
-                    all_dates.append(r["date"])
-                    seen.add(r["date"])
-
         merged: list[dict] = []
-        phases = [
-            ("fetch", fetch_by_date),
-            ("normalize", norm_by_date),
-            ("summarize", summ_by_date),
-        ]
+        phase_names = ("fetch", "normalize", "summarize")
 
-        for d in sorted(all_dates):
+        for d in sorted(fetch_by_date.keys() | norm_by_date.keys() | summ_by_date.keys()):
             failed_step = None
             failed_error = None
             all_skipped = True
 
-            for step_name, by_date in phases:
-                entry = by_date.get(d, {})
-                if entry.get("status") == "failed":
+            entries = (fetch_by_date.get(d), norm_by_date.get(d), summ_by_date.get(d))
+            for step_name, entry in zip(phase_names, entries):
+                status = entry.get("status") if entry else None
+                if status == "failed":
                     failed_step = step_name
                     failed_error = entry.get("error", "unknown error")
                     all_skipped = False
                     break
-                if entry.get("status") != "skipped":
+                if status != "skipped":
                     all_skipped = False
 
             if failed_step:
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import logging
+import os
+import threading
+from collections import OrderedDict
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, timedelta
@@ -25,6 +28,19 @@ logger = logging.getLogger(__name__)
 
 TELEGRAM_MAX_LENGTH = 4096
 
+# 하위 summary 본문 캐시 크기 (daily 기준 10년치 이상)
+SUMMARY_CACHE_SIZE = 4096
+
+# _format_activities 필드별 상한 (문자 수 / 개수)
+MAX_FILES = 10
+BODY_LIMIT = 1000
+REVIEW_LIMIT = 500
+MAX_PATCHES = 8
+PATCH_LIMIT = 1000
+PATCH_BUDGET = 8000
+MAX_COMMENT_CONTEXTS = 10
+CONTEXT_LIMIT = 300
+
 
 class SummarizerService:
     def __init__(
@@ -36,6 +52,13 @@ class SummarizerService:
         self._config = config
         self._llm = llm_client
         self._daily_state = daily_state
+        # template_name → (mtime_ns, SPLIT 앞 system 부분 또는 None, 컴파일된 Template).
+        # 파일이 수정되면 mtime이 바뀌어 다시 읽는다.
+        self._template_cache: dict[str, tuple[int, str | None, Template]] = {}
+        self._checkpoint_lock = threading.Lock()
+        # path → (mtime_ns, 본문). weekly→monthly→yearly가 같은 파일을 반복해서 읽는 것을 줄인다.
+        self._summary_cache: OrderedDict[Path, tuple[int, str]] = OrderedDict()
+        self._summary_cache_lock = threading.Lock()
 
     # ── Public API ──
 
@@ -47,6 +70,17 @@ class SummarizerService:
         repos: list[str] | None = None,
     ) -> Path:
         """Daily summary 생성."""
+        return self._daily(target_date, progress, detailed, repos)
+
+    def _daily(
+        self,
+        target_date: str,
+        progress: Callable[[str], None] | None,
+        detailed: bool,
+        repos: list[str] | None,
+        pending: list[str] | None = None,
+    ) -> Path:
+        """daily() 본체. pending이 주어지면 checkpoint 기록을 그 list에 미룬다."""
         logger.info("Summarizing daily: %s", target_date)
         if progress:
             progress(f"Summarizing {target_date}...")
@@ -77,7 +111,7 @@ class SummarizerService:
             )
             self._save_markdown(output_path, marker)
             if not repo_key:
-                self._update_checkpoint(target_date)
+                self._update_checkpoint(target_date, pending)
             return output_path
 
         template_name = "daily_detailed.md" if detailed else "daily.md"
@@ -99,7 +133,7 @@ class SummarizerService:
         logger.info("Generated daily summary: %s", output_path)
 
         if not repo_key:
-            self._update_checkpoint(target_date)
+            self._update_checkpoint(target_date, pending)
         return output_path
 
     def daily_range(
@@ -115,6 +149,10 @@ class SummarizerService:
     ) -> list[dict]:
         """날짜 범위 순회하며 daily summary 생성. skip/force/resilience 지원.
 
+        checkpoint와 daily_state는 날짜마다 read-modify-write 하지 않고 메모리에 누적했다가
+        범위가 끝날 때 _flush_checkpoints()로 한 번씩 기록한다 (예외로 중단돼도 finally에서 flush).
+        누적 list는 호출마다 따로 두므로 같은 인스턴스에서 daily_range가 겹쳐도 덮어쓰지 않는다.
+
         Args:
             batch: If True, use batch API for LLM calls (all dates in one batch).
             detailed: If True, use daily_detailed.md template.
@@ -133,12 +171,25 @@ class SummarizerService:
         if progress:
             progress(f"Summarizing {since}..{until} ({len(dates)} dates)")
 
-        if batch:
-            return self._daily_range_batch(dates, force, progress, detailed, repos)
-
-        if max_workers <= 1:
-            return self._daily_range_sequential(dates, force, progress, detailed, repos)
-        return self._daily_range_parallel(dates, force, progress, max_workers, detailed, repos)
+        pending: list[str] = []
+        # daily_state가 없으면 skip 판정을 날짜별 stat 대신 디렉토리 scan 결과로 처리
+        summarized = None
+        if not force and self._daily_state is None:
+            summarized = self._scan_summarized_dates(dates)
+        try:
+            if batch:
+                return self._daily_range_batch(
+                    dates, force, progress, detailed, repos, pending, summarized
+                )
+            if max_workers <= 1:
+                return self._daily_range_sequential(
+                    dates, force, progress, detailed, repos, pending, summarized
+                )
+            return self._daily_range_parallel(
+                dates, force, progress, max_workers, detailed, repos, pending, summarized
+            )
+        finally:
+            self._flush_checkpoints(pending)
 
     def _daily_range_sequential(
         self,
@@ -147,14 +198,16 @@ class SummarizerService:
         progress: Callable[[str], None] | None,
         detailed: bool = False,
         repos: list[str] | None = None,
+        pending: list[str] | None = None,
+        summarized: set[str] | None = None,
     ) -> list[dict]:
         results: list[dict] = []
         for d in dates:
             try:
-                if not force and self._is_date_summarized(d):
+                if not force and self._is_date_summarized(d, summarized):
                     results.append({"date": d, "status": "skipped"})
                     continue
-                self.daily(d, progress=progress, detailed=detailed, repos=repos)
+                self._daily(d, progress, detailed, repos, pending)
                 results.append({"date": d, "status": "success"})
             except Exception as e:
                 logger.warning("Failed to summarize %s: %s", d, e)
@@ -169,14 +222,16 @@ class SummarizerService:
         max_workers: int,
         detailed: bool = False,
         repos: list[str] | None = None,
+        pending: list[str] | None = None,
+        summarized: set[str] | None = None,
     ) -> list[dict]:
         results_by_date: dict[str, dict] = {}
 
         def process_date(d: str) -> dict:
             try:
-                if not force and self._is_date_summarized(d):
+                if not force and self._is_date_summarized(d, summarized):
                     return {"date": d, "status": "skipped"}
-                self.daily(d, progress=progress, detailed=detailed, repos=repos)
+                self._daily(d, progress, detailed, repos, pending)
                 return {"date": d, "status": "success"}
             except Exception as e:
                 logger.warning("Failed to summarize %s: %s", d, e)
@@ -197,6 +252,8 @@ class SummarizerService:
         progress: Callable[[str], None] | None,
         detailed: bool = False,
         repos: list[str] | None = None,
+        pending: list[str] | None = None,
+        summarized: set[str] | None = None,
     ) -> list[dict]:
         """Batch mode: prepare all daily prompts, submit as one batch."""
         results: list[dict] = []
@@ -206,7 +263,7 @@ class SummarizerService:
         marker_dates: set[str] = set()
 
         for d in dates:
-            if not force and self._is_date_summarized(d):
+            if not force and self._is_date_summarized(d, summarized):
                 results.append({"date": d, "status": "skipped"})
                 continue
 
@@ -236,7 +293,7 @@ class SummarizerService:
                 )
                 self._save_markdown(output_path, marker)
                 if not repo_key:
-                    self._update_checkpoint(d)
+                    self._update_checkpoint(d, pending)
                 marker_dates.add(d)
                 results.append({"date": d, "status": "success"})
                 continue
@@ -284,7 +341,7 @@ class SummarizerService:
                 output_path = self._config.daily_summary_path(d, repo=repo_key)
                 self._save_markdown(output_path, br.content)
                 if not repo_key:
-                    self._update_checkpoint(d)
+                    self._update_checkpoint(d, pending)
                 results.append({"date": d, "status": "success"})
 
         except Exception as e:
@@ -353,12 +410,7 @@ class SummarizerService:
             logger.info("Yearly summary already exists, skipping: %s", output_path)
             return output_path
 
-        monthly_contents = []
-        for m in range(1, 13):
-            path = self._config.monthly_summary_path(year, m)
-            if path.exists():
-                monthly_contents.append(path.read_text(encoding="utf-8"))
-
+        monthly_contents = [self._read_summary(p) for p in self._monthly_paths_for_year(year)]
         if not monthly_contents:
             raise SummarizeError(f"No monthly summaries found for {year}")
 
@@ -451,21 +503,49 @@ class SummarizerService:
     @staticmethod
     def _is_stale(output_path: Path, input_paths: list[Path]) -> bool:
         """output이 없거나 input 중 하나라도 output보다 새로우면 stale."""
-        if not output_path.exists():
+        try:
+            output_mtime = output_path.stat().st_mtime
+        except FileNotFoundError:
             return True
-        output_mtime = output_path.stat().st_mtime
-        return any(p.exists() and p.stat().st_mtime > output_mtime for p in input_paths)
+        for p in input_paths:
+            try:
+                if p.stat().st_mtime > output_mtime:
+                    return True
+            except FileNotFoundError:
+                continue
+        return False
+
+    @staticmethod
+    def _existing(paths: list[Path]) -> list[Path]:
+        """paths 중 존재하는 것만 순서대로 반환.
+
+        경로마다 exists()를 호출하는 대신 부모 디렉토리당 os.scandir 한 번으로
+        파일 이름 목록을 얻는다. 주가 연도 경계에 걸치면 부모가 둘이 될 수 있다.
+        """
+        listings: dict[Path, set[str]] = {}
+        result = []
+        for p in paths:
+            names = listings.get(p.parent)
+            if names is None:
+                try:
+                    with os.scandir(p.parent) as it:
+                        names = {e.name for e in it}
+                except FileNotFoundError:
+                    names = set()
+                listings[p.parent] = names
+            if p.name in names:
+                result.append(p)
+        return result
 
     def _daily_paths_for_week(self, year: int, week: int) -> list[Path]:
         """ISO week의 daily summary 경로 (존재하는 것만)."""
         monday = date.fromisocalendar(year, week, 1)
-        paths = []
-        for i in range(7):
-            d = monday + timedelta(days=i)
-            p = self._config.daily_summary_path(d.isoformat())
-            if p.exists():
-                paths.append(p)
-        return paths
+        return self._existing(
+            [
+                self._config.daily_summary_path((monday + timedelta(days=i)).isoformat())
+                for i in range(7)
+            ]
+        )
 
     def _weekly_paths_for_month(self, year: int, month: int) -> list[Path]:
         """해당 월에 걸치는 weekly summary 경로 (존재하는 것만)."""
@@ -482,64 +562,28 @@ class SummarizerService:
             iso_y, iso_w, _ = d.isocalendar()
             if (iso_y, iso_w) not in seen_weeks:
                 seen_weeks.add((iso_y, iso_w))
-                p = self._config.weekly_summary_path(iso_y, iso_w)
-                if p.exists():
-                    paths.append(p)
+                paths.append(self._config.weekly_summary_path(iso_y, iso_w))
             d += timedelta(days=7)
-        return paths
+        return self._existing(paths)
 
     def _monthly_paths_for_year(self, year: int) -> list[Path]:
         """1~12월 monthly summary 경로 (존재하는 것만)."""
-        paths = []
-        for m in range(1, 13):
-            p = self._config.monthly_summary_path(year, m)
-            if p.exists():
-                paths.append(p)
-        return paths
+        return self._existing([self._config.monthly_summary_path(year, m) for m in range(1, 13)])
 
     # ── 파일 수집 ──
 
     def _collect_daily_for_week(self, year: int, week: int) -> list[str]:
         """ISO week 기준으로 해당 주의 daily.md 파일 내용 수집."""
-        monday = date.fromisocalendar(year, week, 1)
-        contents = []
-
-        for i in range(7):
-            d = monday + timedelta(days=i)
-            date_str = d.isoformat()
-            path = self._config.daily_summary_path(date_str)
-            if path.exists():
-                contents.append(path.read_text(encoding="utf-8"))
-
-        return contents
+        return [self._read_summary(p) for p in self._daily_paths_for_week(year, week)]
 
     def _collect_weekly_for_month(self, year: int, month: int) -> list[str]:
         """해당 월에 걸치는 주의 weekly.md 수집."""
-        first_day = date(year, month, 1)
-        if month == 12:
-            last_day = date(year + 1, 1, 1) - timedelta(days=1)
-        else:
-            last_day = date(year, month + 1, 1) - timedelta(days=1)
-
-        contents = []
-        seen_weeks: set[tuple[int, int]] = set()
-        d = first_day
-
-        while d <= last_day:
-            iso_y, iso_w, _ = d.isocalendar()
-            if (iso_y, iso_w) not in seen_weeks:
-                seen_weeks.add((iso_y, iso_w))
-                path = self._config.weekly_summary_path(iso_y, iso_w)
-                if path.exists():
-                    contents.append(path.read_text(encoding="utf-8"))
-            d += timedelta(days=7)
-
-        return contents
+        return [self._read_summary(p) for p in self._weekly_paths_for_month(year, month)]
 
     def _collect_recent_context(self, months_back: int) -> str:
         """최근 N개월 monthly summary 수집."""
         today = date.today()
-        contents = []
+        paths = []
 
         for i in range(months_back):
             target_month = today.month - i
@@ -548,29 +592,83 @@ class SummarizerService:
                 target_month += 12
                 target_year -= 1
 
-            path = self._config.monthly_summary_path(target_year, target_month)
-            if path.exists():
-                contents.append(path.read_text(encoding="utf-8"))
+            paths.append(self._config.monthly_summary_path(target_year, target_month))
 
+        contents = [self._read_summary(p) for p in self._existing(paths)]
         return "\n\n---\n\n".join(contents)
 
+    def _read_summary(self, path: Path) -> str:
+        """summary markdown 읽기. mtime이 같으면 메모리의 본문을 재사용 (LRU)."""
+        mtime = path.stat().st_mtime_ns
+        with self._summary_cache_lock:
+            cached = self._summary_cache.get(path)
+            if cached is not None and cached[0] == mtime:
+                self._summary_cache.move_to_end(path)
+                return cached[1]
+        text = path.read_text(encoding="utf-8")
+        with self._summary_cache_lock:
+            self._summary_cache[path] = (mtime, text)
+            self._summary_cache.move_to_end(path)
+            if len(self._summary_cache) > SUMMARY_CACHE_SIZE:
+                self._summary_cache.popitem(last=False)
+        return text
+
     # ── Checkpoint / Skip ──
 
-    def _is_date_summarized(self, date_str: str) -> bool:
-        """daily_state 있으면 timestamp cascade 체크, 없으면 파일 존재 체크."""
+    def _is_date_summarized(self, date_str: str, summarized: set[str] | None = None) -> bool:
+        """daily_state 있으면 timestamp cascade 체크, 없으면 파일 존재 체크.
+
+        summarized는 daily_range가 미리 scan한 날짜 집합 — 주어지면 stat 대신 사용.
+        """
         if self._daily_state is not None:
             return not self._daily_state.is_summarize_stale(date_str)
+        if summarized is not None:
+            return date_str in summarized
         return self._config.daily_summary_path(date_str).exists()
 
-    def _update_checkpoint(self, target_date: str) -> None:
-        """last_summarize_date 키 업데이트. Thread-safe with date comparison guard."""
+    def _scan_summarized_dates(self, dates: list[str]) -> set[str]:
+        """dates 중 daily summary 파일이 있는 날짜 집합. 연도별 daily 디렉토리를 scandir 1회."""
+        wanted = set(dates)
+        found: set[str] = set()
+        for year in sorted({d[:4] for d in dates}):
+            try:
+                with os.scandir(self._config.summaries_dir / year / "daily") as it:
+                    names = [e.name for e in it]
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            for name in names:
+                date_str = f"{year}-{name.removesuffix('.md')}"
+                if name.endswith(".md") and date_str in wanted:
+                    found.add(date_str)
+        return found
+
+    def _update_checkpoint(self, target_date: str, pending: list[str] | None = None) -> None:
+        """last_summarize_date 키 업데이트. Thread-safe with date comparison guard.
+
+        pending(daily_range 호출별 list)이 주어지면 바로 쓰지 않고 _flush_checkpoints()로 미룬다.
+        """
         from workrecap.services.checkpoint import update_checkpoint
 
+        if pending is not None:
+            with self._checkpoint_lock:
+                pending.append(target_date)
+            return
+
         update_checkpoint(self._config.checkpoints_path, "last_summarize_date", target_date)
 
         if self._daily_state is not None:
             self._daily_state.set_timestamp("summarize", target_date)
 
+    def _flush_checkpoints(self, pending: list[str]) -> None:
+        """daily_range가 누적한 last_summarize_date와 summarize timestamp를 한 번씩 기록."""
+        from workrecap.services.checkpoint import update_checkpoint
+
+        if not pending:
+            return
+        update_checkpoint(self._config.checkpoints_path, "last_summarize_date", max(pending))
+        if self._daily_state is not None:
+            self._daily_state.set_timestamps("summarize", pending)
+
     # ── 유틸리티 ──
 
     def _render_prompt(self, template_name: str, **kwargs) -> str:
@@ -586,22 +684,36 @@ class SummarizerService:
         Returns:
             (system_instructions, dynamic_data) — dynamic_data is "" if no marker.
         """
+        system, template = self._load_template(template_name)
+        if system is not None:
+            return system, template.render(**kwargs).strip()
+        return template.render(**kwargs), ""
+
+    def _load_template(self, template_name: str) -> tuple[str | None, Template]:
+        """템플릿을 (SPLIT 앞 system 부분 또는 None, 컴파일된 Template)으로 로드.
+
+        파일 mtime이 같으면 캐시된 Template을 재사용해 읽기/Jinja 컴파일을 반복하지 않는다.
+        """
         template_path = self._config.prompts_dir / template_name
-        if not template_path.exists():
-            raise SummarizeError(f"Prompt template not found: {template_path}")
+        try:
+            mtime = template_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise SummarizeError(f"Prompt template not found: {template_path}") from None
+
+        cached = self._template_cache.get(template_name)
+        if cached is not None and cached[0] == mtime:
+            return cached[1], cached[2]
 
         template_text = template_path.read_text(encoding="utf-8")
         marker = "<!-- SPLIT -->"
 
         if marker in template_text:
             static_part, dynamic_part = template_text.split(marker, 1)
-            system = static_part.strip()
-            dynamic_template = Template(dynamic_part)
-            dynamic = dynamic_template.render(**kwargs).strip()
-            return system, dynamic
-
-        template = Template(template_text)
-        return template.render(**kwargs), ""
+            entry = (mtime, static_part.strip(), Template(dynamic_part))
+        else:
+            entry = (mtime, None, Template(template_text))
+        self._template_cache[template_name] = entry
+        return entry[1], entry[2]
 
     # 500K chars ≈ 150K tokens — leaves room for system prompt within 200K limit
     _FORMAT_BUDGET = 500_000
@@ -611,6 +723,73 @@ class SummarizerService:
         """Merge commit 여부 판별. 개별 commit과 중복되므로 요약에서 제외."""
         return act.get("kind") == "commit" and (act.get("title") or "").startswith("Merge ")
 
+    @staticmethod
+    def _truncate(text: str, limit: int) -> str:
+        """limit자를 넘으면 잘라서 "..."을 붙인다."""
+        return text if len(text) <= limit else text[:limit] + "..."
+
+    @classmethod
+    def _format_one(cls, act: dict) -> str:
+        """activity 하나를 텍스트 블록으로 변환. 조각을 list에 모아 마지막에 한 번만 join."""
+        get = act.get
+        truncate = cls._truncate
+        parts = [
+            f"- [{act['kind']}] {act['title']} ({act['repo']}) "
+            f"+{get('additions', 0)}/-{get('deletions', 0)} "
+            f"URL: {act['url']}"
+        ]
+        append = parts.append
+        intent = get("intent")
+        if intent:
+            append(f"  Intent: {intent}")
+        change_summary = get("change_summary")
+        if change_summary:
+            append(f"  Change Summary: {change_summary}")
+        files = get("files")
+        if files:
+            more = f" 외 {len(files) - MAX_FILES}개" if len(files) > MAX_FILES else ""
+            append(f"  Files: {', '.join(files[:MAX_FILES])}{more}")
+        body = get("body")
+        if body:
+            append(f"  Body: {truncate(body, BODY_LIMIT)}")
+        review_bodies = get("review_bodies")
+        if review_bodies:
+            append(f"  Reviews: {' | '.join(truncate(rb, REVIEW_LIMIT) for rb in review_bodies)}")
+        comment_bodies = get("comment_bodies")
+        if comment_bodies:
+            append(f"  Comments: {' | '.join(truncate(cb, REVIEW_LIMIT) for cb in comment_bodies)}")
+        # Patches section
+        file_patches = get("file_patches")
+        if file_patches:
+            patch_lines = []
+            budget = PATCH_BUDGET
+            for fname, patch in file_patches.items():
+                if len(patch_lines) >= MAX_PATCHES:
+                    break
+                entry = f"    --- {fname} ---\n    {truncate(patch, PATCH_LIMIT)}"
+                budget -= len(entry)
+                if budget < 0:
+                    break
+                patch_lines.append(entry)
+            if patch_lines:
+                append("  Patches:")
+                parts.extend(patch_lines)
+        # Inline comments section
+        comment_contexts = get("comment_contexts")
+        if comment_contexts:
+            ctx_lines = []
+            for ctx in comment_contexts[:MAX_COMMENT_CONTEXTS]:
+                ctx_get = ctx.get
+                ctx_lines.append(
+                    f"    at {ctx_get('path', '')}:{ctx_get('line', 0)}\n"
+                    f"    hunk: {ctx_get('diff_hunk', '')[-CONTEXT_LIMIT:]}\n"
+                    f"    comment: {(ctx_get('body') or '')[:CONTEXT_LIMIT]}"
+                )
+            if ctx_lines:
+                append("  Inline comments:")
+                parts.extend(ctx_lines)
+        return "\n".join(parts)
+
     @classmethod
     def _format_activities(cls, activities: list[dict]) -> str:
         """activities dict 목록을 읽기 좋은 텍스트로 변환."""
@@ -629,68 +808,7 @@ class SummarizerService:
         lines = []
         total_chars = 0
         for act in filtered:
-            line = (
-                f"- [{act['kind']}] {act['title']} ({act['repo']}) "
-                f"+{act.get('additions', 0)}/-{act.get('deletions', 0)} "
-                f"URL: {act['url']}"
-            )
-            if act.get("intent"):
-                line += f"\n  Intent: {act['intent']}"
-            if act.get("change_summary"):
-                line += f"\n  Change Summary: {act['change_summary']}"
-            if act.get("files"):
-                file_list = ", ".join(act["files"][:10])
-                line += f"\n  Files: {file_list}"
-                if len(act["files"]) > 10:
-                    line += f" 외 {len(act['files']) - 10}개"
-            if act.get("body"):
-                body = act["body"][:1000]
-                if len(act["body"]) > 1000:
-                    body += "..."
-                line += f"\n  Body: {body}"
-            if act.get("review_bodies"):
-                parts = [rb[:500] + ("..." if len(rb) > 500 else "") for rb in act["review_bodies"]]
-                line += f"\n  Reviews: {' | '.join(parts)}"
-            if act.get("comment_bodies"):
-                parts = [
-                    cb[:500] + ("..." if len(cb) > 500 else "") for cb in act["comment_bodies"]
-                ]
-                line += f"\n  Comments: {' | '.join(parts)}"
-            # Patches section
-            if act.get("file_patches"):
-                patch_lines = []
-                budget = 8000
-                count = 0
-                for fname, patch in act["file_patches"].items():
-                    if count >= 8:
-                        break
-                    truncated = patch[:1000]
-                    if len(patch) > 1000:
-                        truncated += "..."
-                    entry = f"    --- {fname} ---\n    {truncated}"
-                    if budget - len(entry) < 0:
-                        break
-                    budget -= len(entry)
-                    patch_lines.append(entry)
-                    count += 1
-                if patch_lines:
-                    line += "\n  Patches:\n" + "\n".join(patch_lines)
-            # Inline comments section
-            if act.get("comment_contexts"):
-                ctx_lines = []
-                for ctx in act["comment_contexts"][:10]:
-                    hunk = ctx.get("diff_hunk", "")
-                    if len(hunk) > 300:
-                        hunk = hunk[-300:]
-                    comment_body = (ctx.get("body") or "")[:300]
-                    ctx_lines.append(
-                        f"    at {ctx.get('path', '')}:{ctx.get('line', 0)}\n"
-                        f"    hunk: {hunk}\n"
-                        f"    comment: {comment_body}"
-                    )
-                if ctx_lines:
-                    line += "\n  Inline comments:\n" + "\n".join(ctx_lines)
-
+            line = cls._format_one(act)
             total_chars += len(line)
             if total_chars > cls._FORMAT_BUDGET:
                 remaining = len(filtered) - len(lines)
@@ -31,10 +31,12 @@ class TestIntegrationPipeline:
 
         raw_dir = real_config.date_raw_dir(test_date)
 
-        # 3개 파일 모두 존재
+        # prs.json은 항상 존재, commits/issues는 결과가 있을 때만 생성
+        assert (raw_dir / "prs.json").exists(), "prs.json not created"
         for name in ("prs.json", "commits.json", "issues.json"):
             path = raw_dir / name
-            assert path.exists(), f"{name} not created"
+            if not path.exists():
+                continue
 
             data = json.loads(path.read_text(encoding="utf-8"))
             assert isinstance(data, list), f"{name} should contain a JSON array"
@@ -85,8 +87,6 @@ class TestIntegrationPipeline:
         # 모든 중간 산출물 존재 확인
         raw_dir = real_config.date_raw_dir(pipeline_date)
         assert (raw_dir / "prs.json").exists()
-        assert (raw_dir / "commits.json").exists()
-        assert (raw_dir / "issues.json").exists()
 
         norm_dir = real_config.date_normalized_dir(pipeline_date)
         assert (norm_dir / "activities.jsonl").exists()
@@ -52,7 +52,6 @@ PIPELINE_MOCKS = [
     "workrecap.api.routes.pipeline.DailyStateStore",
     "workrecap.api.routes.pipeline.get_llm_router",
     "workrecap.api.routes.pipeline.GHESClient",
-    "workrecap.api.routes.pipeline.GHESClientPool",
 ]
 
 FETCH_MOCKS = [
@@ -60,7 +59,6 @@ FETCH_MOCKS = [
     "workrecap.api.routes.fetch.FetchProgressStore",
     "workrecap.api.routes.fetch.DailyStateStore",
     "workrecap.api.routes.fetch.GHESClient",
-    "workrecap.api.routes.fetch.GHESClientPool",
 ]
 
 NORMALIZE_MOCKS = [
@@ -472,7 +470,6 @@ class TestPipelineRunRange:
         norm_kwargs = mock_norm.call_args
         assert norm_kwargs.kwargs.get("llm") is None
 
-    @patch("workrecap.api.routes.pipeline.GHESClientPool")
     @patch("workrecap.api.routes.pipeline.OrchestratorService")
     @patch("workrecap.api.routes.pipeline.SummarizerService")
     @patch("workrecap.api.routes.pipeline.NormalizerService")
@@ -481,7 +478,7 @@ class TestPipelineRunRange:
     @patch("workrecap.api.routes.pipeline.DailyStateStore")
     @patch("workrecap.api.routes.pipeline.get_llm_router")
     @patch("workrecap.api.routes.pipeline.GHESClient")
-    def test_run_range_pool_cleanup(
+    def test_run_range_workers_share_client(
         self,
         mock_ghes,
         mock_llm,
@@ -491,10 +488,9 @@ class TestPipelineRunRange:
         mock_norm,
         mock_summ,
         mock_orch,
-        mock_pool,
         client,
     ):
-        """GHESClientPool.close() called when workers > 1."""
+        """workers > 1 → one shared GHESClient, closed in finally."""
         mock_orch.return_value.run_range.return_value = [
             {"date": "2025-02-15", "status": "success"},
         ]
@@ -502,9 +498,11 @@ class TestPipelineRunRange:
             "/api/pipeline/run/range",
             json={"since": "2025-02-15", "until": "2025-02-15", "max_workers": 3},
         )
-        # Pool should be created and closed
-        mock_pool.assert_called_once()
-        mock_pool.return_value.close.assert_called_once()
+        mock_ghes.assert_called_once()
+        mock_ghes.return_value.close.assert_called_once()
+        fetch_kwargs = mock_fetch.call_args.kwargs
+        assert fetch_kwargs["max_workers"] == 3
+        assert "client_pool" not in fetch_kwargs
 
     @patch("workrecap.api.routes.pipeline._run_hierarchical")
     @patch("workrecap.api.routes.pipeline.OrchestratorService")
@@ -925,7 +923,6 @@ class TestFetchEndpoints:
         assert call_kwargs.kwargs["force"] is True
         assert call_kwargs.kwargs["types"] == {"commits"}
 
-    @patch("workrecap.api.routes.fetch.GHESClientPool")
     @patch("workrecap.api.routes.fetch.FetcherService")
     @patch("workrecap.api.routes.fetch.FetchProgressStore")
     @patch("workrecap.api.routes.fetch.DailyStateStore")
@@ -936,10 +933,9 @@ class TestFetchEndpoints:
         mock_ds,
         mock_ps,
         mock_fetcher,
-        mock_pool,
         client,
     ):
-        """workers > 1 creates GHESClientPool, cleans up in finally."""
+        """workers > 1 → one shared GHESClient, closed in finally."""
         mock_fetcher.return_value.fetch_range.return_value = [
             {"date": "2025-02-15", "status": "success"},
         ]
@@ -947,8 +943,11 @@ class TestFetchEndpoints:
             "/api/pipeline/fetch/range",
             json={"since": "2025-02-15", "until": "2025-02-15", "max_workers": 4},
         )
-        mock_pool.assert_called_once()
-        mock_pool.return_value.close.assert_called_once()
+        mock_ghes.assert_called_once()
+        mock_ghes.return_value.close.assert_called_once()
+        fetch_kwargs = mock_fetcher.call_args.kwargs
+        assert fetch_kwargs["max_workers"] == 4
+        assert "client_pool" not in fetch_kwargs
 
     @patch("workrecap.api.routes.fetch.FetcherService")
     @patch("workrecap.api.routes.fetch.FetchProgressStore")
@@ -3,6 +3,8 @@
 import json
 import threading
 
+import pytest
+
 from workrecap.services.checkpoint import update_checkpoint
 
 
@@ -38,6 +40,25 @@ class TestUpdateCheckpoint:
             data = json.load(f)
         assert data["last_fetch_date"] == "2025-02-16"
 
+    def test_write_is_atomic(self, tmp_path, monkeypatch):
+        """A failed write leaves the previous checkpoint intact and no temp file."""
+        from workrecap.services import checkpoint
+
+        cp_path = tmp_path / "checkpoints.json"
+        update_checkpoint(cp_path, "last_fetch_date", "2025-02-15")
+
+        def failing_save(data, path):
+            path.write_text('{"last_fetch')
+            raise OSError("disk full")
+
+        monkeypatch.setattr(checkpoint, "save_json", failing_save)
+        with pytest.raises(OSError):
+            update_checkpoint(cp_path, "last_fetch_date", "2025-02-16")
+
+        with open(cp_path) as f:
+            assert json.load(f) == {"last_fetch_date": "2025-02-15"}
+        assert [p.name for p in tmp_path.iterdir()] == ["checkpoints.json"]
+
     def test_creates_parent_dirs(self, tmp_path):
         cp_path = tmp_path / "sub" / "dir" / "checkpoints.json"
         update_checkpoint(cp_path, "last_fetch_date", "2025-02-16")
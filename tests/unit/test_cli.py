@@ -1611,10 +1611,9 @@ class TestWorkersOption:
         call_kwargs = mock_cls.call_args
         assert call_kwargs.kwargs.get("max_workers", 1) == 1
 
-    @patch("workrecap.infra.client_pool.GHESClientPool")
     @patch("workrecap.cli.main.FetcherService")
-    def test_fetch_workers_creates_pool(self, mock_fetcher_cls, mock_pool_cls):
-        """--workers 3 creates pool and passes it to FetcherService."""
+    def test_fetch_workers_passes_max_workers(self, mock_fetcher_cls):
+        """--workers 3 → FetcherService(max_workers=3), enrich는 공유 client 사용."""
         mock_fetcher_cls.return_value.fetch_range.return_value = [
             {"date": "2025-02-16", "status": "success"},
         ]
@@ -1622,10 +1621,9 @@ class TestWorkersOption:
             app, ["fetch", "--since", "2025-02-16", "--until", "2025-02-16", "--workers", "3"]
         )
         assert result.exit_code == 0
-        mock_pool_cls.assert_called_once()
         call_kwargs = mock_fetcher_cls.call_args
         assert call_kwargs.kwargs.get("max_workers") == 3
-        assert call_kwargs.kwargs.get("client_pool") is not None
+        assert "client_pool" not in call_kwargs.kwargs
 
     @patch("workrecap.cli.main.NormalizerService")
     def test_normalize_workers(self, mock_cls):
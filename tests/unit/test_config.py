@@ -35,6 +35,7 @@ class TestAppConfig:
         assert config.summaries_dir == Path("/tmp/data/summaries")
         assert config.state_dir == Path("/tmp/data/state")
         assert config.checkpoints_path == Path("/tmp/data/state/checkpoints.json")
+        assert config.http_cache_dir == Path("/tmp/data/state/http_cache")
         assert config.jobs_dir == Path("/tmp/data/state/jobs")
         assert config.date_raw_dir("2025-02-16") == Path("/tmp/data/raw/2025/02/16")
         assert config.date_normalized_dir("2025-02-16") == Path("/tmp/data/normalized/2025/02/16")
@@ -74,6 +75,20 @@ class TestAppConfig:
         config = AppConfig(ghes_url="u", ghes_token="t", username="u", max_workers=10)
         assert config.max_workers == 10
 
+    def test_enrich_concurrency_default(self):
+        """enrich_concurrency 기본값은 8."""
+        config = AppConfig(ghes_url="u", ghes_token="t", username="u")
+        assert config.enrich_concurrency == 8
+
+    def test_graphql_enrich_default_off(self):
+        """graphql_enrich 기본값은 False (REST enrich)."""
+        config = AppConfig(ghes_url="u", ghes_token="t", username="u")
+        assert config.graphql_enrich is False
+        assert config.graphql_batch_node_budget == 2500
+        assert config.graphql_search is False
+        assert config.search_or_axes is False
+        assert config.enrich_chunk_size == 20
+
     def test_max_fetch_retries_default(self):
         """max_fetch_retries defaults to 5 — enough for transient issues without infinite loops."""
         config = AppConfig(ghes_url="u", ghes_token="t", username="u")
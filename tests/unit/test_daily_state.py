@@ -55,6 +55,21 @@ class TestGetSet:
         store.set_timestamp("fetch", "2025-02-16", ts2)
         assert store.get_timestamp("fetch", "2025-02-16") == ts2
 
+    def test_set_timestamps_many(self, store):
+        ts = datetime(2025, 2, 20, 10, 0, 0, tzinfo=timezone.utc)
+        store.set_timestamp("normalize", "2025-02-16", ts)
+        store.set_timestamps("fetch", ["2025-02-16", "2025-02-17"], ts)
+        assert store.get_timestamp("fetch", "2025-02-16") == ts
+        assert store.get_timestamp("fetch", "2025-02-17") == ts
+        assert store.get_timestamp("normalize", "2025-02-16") == ts
+
+    def test_set_timestamps_saves_once(self, store, monkeypatch):
+        saves = []
+        monkeypatch.setattr(store, "_save", lambda: saves.append(1))
+        store.set_timestamps("fetch", ["2025-02-16", "2025-02-17", "2025-02-18"])
+        store.set_timestamps("fetch", [])
+        assert len(saves) == 1
+
 
 # ── Persistence ──
 
@@ -0,0 +1,106 @@
+"""Tests for ETagCache — on-disk ETag/body store for conditional requests."""
+
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from workrecap.config import AppConfig
+from workrecap.infra.etag_cache import ETagCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ETagCache(tmp_path / "http_cache")
+
+
+class TestETagCache:
+    def test_get_missing_returns_none(self, cache):
+        assert cache.get("/repos/org/repo/pulls/1?") is None
+
+    def test_put_and_get_round_trip(self, cache):
+        body = {"number": 1, "title": "Add feature"}
+        cache.put("/repos/org/repo/pulls/1?", 'W/"abc"', body)
+        assert cache.get("/repos/org/repo/pulls/1?") == ('W/"abc"', body)
+
+    def test_put_overwrites_entry(self, cache):
+        cache.put("key", '"v1"', [{"a": 1}])
+        cache.put("key", '"v2"', [{"a": 2}])
+        assert cache.get("key") == ('"v2"', [{"a": 2}])
+
+    def test_keys_are_isolated(self, cache):
+        cache.put("/pulls/1/files?page=1&per_page=100", '"p1"', [{"filename": "a.py"}])
+        cache.put("/pulls/1/files?page=2&per_page=100", '"p2"', [{"filename": "b.py"}])
+        assert cache.get("/pulls/1/files?page=1&per_page=100")[0] == '"p1"'
+        assert cache.get("/pulls/1/files?page=2&per_page=100")[0] == '"p2"'
+
+    def test_no_temp_files_left(self, cache, tmp_path):
+        cache.put("key", '"v1"', {})
+        assert not list((tmp_path / "http_cache").rglob("*.tmp"))
+
+    def test_corrupt_entry_treated_as_miss(self, cache):
+        cache.put("key", '"v1"', {})
+        cache._key_to_path("key").write_text("{not json", encoding="utf-8")
+        assert cache.get("key") is None
+
+    def test_put_disk_error_is_logged_not_raised(self, cache, caplog):
+        with patch("workrecap.infra.etag_cache.save_json", side_effect=OSError("disk full")):
+            cache.put("key", '"v1"', {})
+        assert cache.get("key") is None
+        assert "Failed to write ETag cache entry" in caplog.text
+
+
+class TestETagCacheExpiry:
+    @staticmethod
+    def _age(cache, key, days):
+        path = cache._key_to_path(key)
+        old = time.time() - days * 24 * 60 * 60
+        os.utime(path, (old, old))
+
+    def test_expired_entry_is_miss_and_deleted(self, cache):
+        cache.put("key", '"v1"', {})
+        self._age(cache, "key", 31)
+        assert cache.get("key") is None
+        assert not cache._key_to_path("key").exists()
+
+    def test_zero_max_age_never_expires(self, tmp_path):
+        cache = ETagCache(tmp_path / "http_cache", max_age_days=0)
+        cache.put("key", '"v1"', {})
+        self._age(cache, "key", 3650)
+        assert cache.get("key") == ('"v1"', {})
+
+    def test_prune_removes_only_expired(self, cache):
+        cache.put("old", '"v1"', {})
+        cache.put("new", '"v2"', {})
+        self._age(cache, "old", 31)
+        assert cache.prune() == 1
+        assert not cache._key_to_path("old").exists()
+        assert cache._key_to_path("new").exists()
+
+    def test_prune_missing_dir(self, tmp_path):
+        assert ETagCache(tmp_path / "nope").prune() == 0
+
+
+class TestFromConfig:
+    @staticmethod
+    def _config(test_config, **overrides):
+        return AppConfig(
+            ghes_url=test_config.ghes_url,
+            ghes_token=test_config.ghes_token,
+            username=test_config.username,
+            data_dir=test_config.data_dir,
+            prompts_dir=test_config.prompts_dir,
+            **overrides,
+        )
+
+    def test_disabled_returns_none(self, test_config):
+        assert ETagCache.from_config(self._config(test_config, http_cache_enabled=False)) is None
+
+    def test_prunes_at_most_once_per_interval(self, test_config):
+        config = self._config(test_config, http_cache_max_age_days=7)
+        with patch.object(ETagCache, "prune", return_value=0) as prune:
+            cache = ETagCache.from_config(config)
+            ETagCache.from_config(config)
+        assert isinstance(cache, ETagCache)
+        prune.assert_called_once()
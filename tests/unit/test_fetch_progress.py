@@ -1,7 +1,10 @@
 """Tests for FetchProgressStore — chunk search result caching for resumable fetching."""
 
+import json
+
 import pytest
 
+from workrecap.services import fetch_progress
 from workrecap.services.fetch_progress import FetchProgressStore
 
 
@@ -63,3 +66,17 @@ class TestFetchProgressStore:
         store.save_chunk_search("2025-02/01__2025-02/28", {"data": "value"})
         loaded = store.load_chunk_search("2025-02/01__2025-02/28")
         assert loaded is not None
+
+    def test_written_as_compact_json(self, store, tmp_path):
+        """Entries are stored without indentation or spacing."""
+        store.save_chunk_search("chunk1", {"2025-02-16": {"commits": [{"sha": "abc"}]}})
+        raw = (tmp_path / "fetch_progress" / "chunk1.json").read_bytes()
+        assert b" " not in raw and b"\n" not in raw
+        assert json.loads(raw) == {"2025-02-16": {"commits": [{"sha": "abc"}]}}
+
+    def test_round_trip_without_orjson(self, store, monkeypatch):
+        """Falls back to stdlib json when orjson is not installed."""
+        monkeypatch.setattr(fetch_progress, "orjson", None)
+        buckets = {"2025-02-16": {"prs": {"url1": {"title": "한글 PR"}}}}
+        store.save_chunk_search("chunk1", buckets)
+        assert store.load_chunk_search("chunk1") == buckets
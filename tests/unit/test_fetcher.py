@@ -3,6 +3,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from workrecap.config import AppConfig
 from workrecap.exceptions import FetchError
 from workrecap.infra.ghes_client import GHESClient
 from workrecap.models import load_json
@@ -112,6 +113,34 @@ class TestParsePrUrl:
         )
         assert (owner, repo, num) == ("org", "repo", 10)
 
+    def test_result_cached_per_url(self):
+        url = "https://ghes/api/v3/repos/org/cached/pulls/99"
+        FetcherService._parse_pr_url(url)
+        hits = FetcherService._parse_pr_url.cache_info().hits
+        assert FetcherService._parse_pr_url(url) == ("org", "cached", 99)
+        assert FetcherService._parse_pr_url.cache_info().hits == hits + 1
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "",
+            "https://ghes/api/v3/repos/org/repo/issues/1",
+            "https://ghes/pulls/abc",
+            "https://ghes/api/v3/repos/org/repo/pulls/1/files",
+        ],
+    )
+    def test_malformed_url_raises_fetch_error(self, url):
+        with pytest.raises(FetchError, match="Malformed PR API URL"):
+            FetcherService._parse_pr_url(url)
+
+    def test_enrich_rejects_missing_pr_url_without_http(self, fetcher, mock_client):
+        item = _make_search_item("")
+        del item["pull_request"]
+        with pytest.raises(FetchError):
+            fetcher._enrich(item)
+        mock_client.get_pr.assert_not_called()
+        mock_client.get_pr_files.assert_not_called()
+
 
 class TestSearchPrs:
     def test_three_axis_search(self, fetcher, mock_client):
@@ -124,6 +153,22 @@ class TestSearchPrs:
         assert any("reviewed-by:testuser" in c for c in calls)
         assert any("commenter:testuser" in c for c in calls)
 
+    def test_axes_run_concurrently_first_axis_wins(self, fetcher, mock_client):
+        """날짜 하나의 축 검색도 동시에 실행하고, 겹치는 PR은 앞선 축의 item을 남긴다."""
+        api_url = "https://ghes/api/v3/repos/org/repo/pulls/1"
+
+        def search(query, page=1, per_page=100):
+            title = "author" if "author:" in query else "other"
+            return {"total_count": 1, "items": [_make_search_item(api_url, 1, title)]}
+
+        mock_client.search_issues.side_effect = search
+        with patch.object(
+            fetcher, "_search_axes_concurrent", wraps=fetcher._search_axes_concurrent
+        ) as concurrent:
+            result = fetcher._search_prs("2025-02-16")
+        concurrent.assert_called_once()
+        assert result[api_url]["title"] == "author"
+
     def test_dedup_by_api_url(self, fetcher, mock_client):
         """동일 PR이 여러 축에서 나오면 1개로 dedup."""
         api_url = "https://ghes/api/v3/repos/org/repo/pulls/1"
@@ -206,6 +251,102 @@ class TestSearchPrs:
         assert len(result) == 120
 
 
+class TestIterSearchPages:
+    @staticmethod
+    def _page(page: int, size: int = 100) -> list[dict]:
+        return [{"n": (page - 1) * 100 + i} for i in range(size)]
+
+    def test_stops_at_total_count_without_extra_request(self):
+        """total_count로 마지막 페이지를 알면 빈 페이지를 추가 요청하지 않는다."""
+        requested: list[int] = []
+
+        def search(query, page=1, per_page=100):
+            requested.append(page)
+            return {"total_count": 300, "items": self._page(page)}
+
+        items = list(FetcherService._iter_search_pages(search, "q"))
+        assert len(items) == 300
+        assert sorted(requested) == [1, 2, 3]
+
+    def test_preserves_page_order(self):
+        import time
+
+        def search(query, page=1, per_page=100):
+            if page == 2:
+                time.sleep(0.05)  # 2페이지가 3페이지보다 늦게 도착
+            size = 100 if page < 3 else 5
+            return {"total_count": 205, "items": self._page(page, size)}
+
+        items = list(FetcherService._iter_search_pages(search, "q"))
+        assert [i["n"] for i in items] == list(range(205))
+
+    def test_prefetches_pages_concurrently(self):
+        import threading
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def search(query, page=1, per_page=100):
+            if page in (2, 3):
+                barrier.wait()  # 2, 3페이지가 동시에 in-flight여야 통과
+            return {"total_count": 300, "items": self._page(page)}
+
+        assert len(list(FetcherService._iter_search_pages(search, "q"))) == 300
+
+    def test_falls_back_to_serial_when_total_count_understated(self):
+        def search(query, page=1, per_page=100):
+            size = 100 if page < 4 else 0
+            return {"total_count": 0, "items": self._page(page, size)}
+
+        assert len(list(FetcherService._iter_search_pages(search, "q"))) == 300
+
+    def test_single_full_page_matching_total(self):
+        requested: list[int] = []
+
+        def search(query, page=1, per_page=100):
+            requested.append(page)
+            return {"total_count": 100, "items": self._page(page)}
+
+        assert len(list(FetcherService._iter_search_pages(search, "q"))) == 100
+        assert requested == [1]
+
+    def test_never_requests_beyond_result_limit(self):
+        requested: list[int] = []
+
+        def search(query, page=1, per_page=100):
+            requested.append(page)
+            return {"total_count": 5000, "items": self._page(page)}
+
+        items = list(FetcherService._iter_search_pages(search, "q"))
+        assert len(items) == 1000
+        assert max(requested) == 10
+
+    def test_yields_first_page_before_requesting_more(self):
+        """첫 페이지는 다음 페이지 요청 전에 소비자에게 넘어간다."""
+        requested: list[int] = []
+
+        def search(query, page=1, per_page=100):
+            requested.append(page)
+            return {"total_count": 300, "items": self._page(page)}
+
+        it = FetcherService._iter_search_pages(search, "q")
+        first = [next(it) for _ in range(100)]
+        assert [i["n"] for i in first] == list(range(100))
+        assert requested == [1]
+        assert len(list(it)) == 200
+
+    def test_page_error_raised_during_iteration(self):
+        def search(query, page=1, per_page=100):
+            if page == 2:
+                raise FetchError("boom")
+            return {"total_count": 300, "items": self._page(page)}
+
+        seen: list[dict] = []
+        with pytest.raises(FetchError):
+            for item in FetcherService._iter_search_pages(search, "q"):
+                seen.append(item)
+        assert len(seen) == 100
+
+
 class TestEnrich:
     def test_creates_pr_raw_from_api(self, fetcher, mock_client):
         api_url = "https://ghes/api/v3/repos/org/repo/pulls/1"
@@ -250,6 +391,60 @@ class TestEnrich:
         assert result.merged_at is None
         assert result.is_merged is False
 
+    def test_null_user_comment_and_review(self, fetcher, mock_client):
+        """삭제된 계정 등으로 user가 null이어도 enrich가 실패하지 않는다."""
+        mock_client.get_pr_comments.return_value = [
+            {
+                "user": None,
+                "body": "Orphaned comment",
+                "created_at": "2025-02-16T11:00:00Z",
+                "html_url": "https://ghes/org/repo/pull/1#comment-2",
+            },
+        ]
+        mock_client.get_pr_reviews.return_value = [
+            {
+                "user": None,
+                "state": "COMMENTED",
+                "body": "Orphaned review",
+                "submitted_at": "2025-02-16T12:00:00Z",
+                "html_url": "https://ghes/org/repo/pull/1#review-2",
+            },
+        ]
+
+        api_url = "https://ghes/api/v3/repos/org/repo/pulls/1"
+        result = fetcher._enrich(_make_search_item(api_url))
+        assert [c.author for c in result.comments] == [""]
+        assert [r.author for r in result.reviews] == [""]
+
+    def test_detail_calls_run_concurrently(self, fetcher, mock_client):
+        """get_pr/files/comments/reviews 4개 호출이 동시에 진행된다."""
+        import threading
+
+        barrier = threading.Barrier(4, timeout=5)
+
+        def waiting(value):
+            def call(*args):
+                barrier.wait()
+                return value
+
+            return call
+
+        mock_client.get_pr.side_effect = waiting(_make_pr_detail())
+        mock_client.get_pr_files.side_effect = waiting([])
+        mock_client.get_pr_comments.side_effect = waiting([])
+        mock_client.get_pr_reviews.side_effect = waiting([])
+
+        api_url = "https://ghes/api/v3/repos/org/repo/pulls/1"
+        result = fetcher._enrich(_make_search_item(api_url))
+        assert result.number == 1
+
+    def test_detail_failure_propagates(self, fetcher, mock_client):
+        mock_client.get_pr_files.side_effect = FetchError("boom")
+
+        api_url = "https://ghes/api/v3/repos/org/repo/pulls/1"
+        with pytest.raises(FetchError):
+            fetcher._enrich(_make_search_item(api_url))
+
 
 class TestNoiseFiltering:
     def test_bot_comment_filtered(self):
@@ -272,6 +467,23 @@ class TestNoiseFiltering:
         comment = {"user": {"login": "human"}, "body": "lgtm"}
         assert FetcherService._is_noise_comment(comment) is True
 
+    def test_ship_it_filtered(self):
+        for body in ("Ship it", "ship it!", ":shipit:"):
+            comment = {"user": {"login": "human"}, "body": body}
+            assert FetcherService._is_noise_comment(comment) is True
+
+    def test_ship_it_mixed_case_with_whitespace_filtered(self):
+        comment = {"user": {"login": "human"}, "body": "  sHiP iT!\n"}
+        assert FetcherService._is_noise_comment(comment) is True
+
+    def test_shipit_emoji_case_sensitive(self):
+        comment = {"user": {"login": "human"}, "body": ":SHIPIT:"}
+        assert FetcherService._is_noise_comment(comment) is False
+
+    def test_bot_suffix_case_insensitive(self):
+        comment = {"user": {"login": "Renovate[BOT]"}, "body": "Update deps"}
+        assert FetcherService._is_noise_comment(comment) is True
+
     def test_plus_one_comment_filtered(self):
         comment = {"user": {"login": "human"}, "body": "+1"}
         assert FetcherService._is_noise_comment(comment) is True
@@ -288,6 +500,22 @@ class TestNoiseFiltering:
         comment = {"user": {"login": "human"}, "body": "Good approach, but consider..."}
         assert FetcherService._is_noise_comment(comment) is False
 
+    def test_long_body_skips_phrase_lookup(self):
+        """noise 문구보다 긴 본문은 casefold 없이 bot 판정만 한다."""
+        casefolded = []
+
+        class Body(str):
+            def strip(self):
+                return self
+
+            def casefold(self):
+                casefolded.append(self)
+                return super().casefold()
+
+        comment = {"user": {"login": "human"}, "body": Body("LGTM " * 100)}
+        assert FetcherService._is_noise_comment(comment) is False
+        assert casefolded == []
+
     def test_lgtm_in_longer_text_kept(self):
         comment = {"user": {"login": "human"}, "body": "LGTM, but one minor thing"}
         assert FetcherService._is_noise_comment(comment) is False
@@ -300,6 +528,20 @@ class TestNoiseFiltering:
         review = {"user": {"login": "human"}, "state": "APPROVED"}
         assert FetcherService._is_noise_review(review) is False
 
+    @pytest.mark.parametrize("entry", [{}, {"user": None}, {"user": {}}])
+    def test_missing_or_null_user_not_bot(self, entry):
+        assert FetcherService._is_noise_review(entry) is False
+        assert FetcherService._is_noise_comment({**entry, "body": "Looks good"}) is False
+
+    def test_bot_login_result_cached(self):
+        from workrecap.services.fetcher import _is_bot_login
+
+        review = {"user": {"login": "cached-login-bot"}, "state": "COMMENTED"}
+        FetcherService._is_noise_review(review)
+        hits = _is_bot_login.cache_info().hits
+        assert FetcherService._is_noise_review(review) is True
+        assert _is_bot_login.cache_info().hits == hits + 1
+
 
 class TestFetch:
     def test_full_pipeline(self, fetcher, mock_client, test_config):
@@ -348,6 +590,23 @@ class TestFetch:
         result = fetcher.fetch("2025-02-16")
         assert set(result.keys()) == {"prs", "commits", "issues"}
 
+    def test_save_commits_from_empty_iterator(self, fetcher, test_config):
+        """빈 iterator: 기존 파일이 없으면 쓰지 않고, 있으면 []로 덮어쓴다."""
+        path = fetcher._save_commits("2025-02-16", iter([]))
+        assert not path.exists()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text('[{"sha": "stale"}]')
+        fetcher._save_commits("2025-02-16", iter([]))
+        assert load_json(path) == []
+
+    def test_save_streams_generator(self, fetcher, mock_client, test_config):
+        """enrich generator를 list로 모으지 않고 그대로 기록한다."""
+        api_url = "https://ghes/api/v3/repos/org/repo/pulls/1"
+        pr = fetcher._enrich(_make_search_item(api_url, 1))
+        path = fetcher._save("2025-02-16", (p for p in [pr, pr]))
+        assert [d["number"] for d in load_json(path)] == [1, 1]
+
 
 class TestCheckpoint:
     def test_creates_checkpoint_file(self, fetcher, mock_client, test_config):
@@ -419,6 +678,23 @@ class TestFetchCommits:
         assert len(result[0].files) == 1
         assert result[0].files[0].patch == "@@ -5,3 +5,6 @@\n+commit change"
 
+    def test_duplicate_commits_fetched_once(self, fetcher, mock_client):
+        """같은 (repo, sha)가 검색에 여러 번 나와도 get_commit은 한 번."""
+        mock_client.search_commits.return_value = {
+            "total_count": 3,
+            "items": [
+                _make_commit_search_item(),
+                _make_commit_search_item(),
+                _make_commit_search_item(repo_full="org/fork"),
+            ],
+        }
+        mock_client.get_commit.return_value = _make_commit_detail()
+
+        result = fetcher._fetch_commits("2025-02-16")
+
+        assert sorted(c.repo for c in result) == ["org/fork", "org/repo"]
+        assert mock_client.get_commit.call_count == 2
+
     def test_fetch_commits_search_failure_returns_empty(self, fetcher, mock_client):
         """Commit search 미지원 시 빈 리스트 반환."""
         mock_client.search_commits.side_effect = FetchError("422 not supported")
@@ -587,10 +863,22 @@ class TestParseIssueUrl:
         )
         assert (owner, repo, num) == ("my-org", "my-repo", 7)
 
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://ghes/api/v3/repos/org/repo/pulls/1",
+            "https://ghes/api/v3/repos/org/repo/issues/abc",
+            "https://ghes/api/v3/repos/org/repo/issues/1/comments",
+        ],
+    )
+    def test_malformed_url_raises_fetch_error(self, url):
+        with pytest.raises(FetchError, match="Malformed issue API URL"):
+            FetcherService._parse_issue_url(url)
+
 
 class TestFetchIntegration:
-    def test_fetch_creates_all_files(self, fetcher, mock_client, test_config):
-        """fetch()가 prs.json + commits.json + issues.json 모두 생성."""
+    def test_fetch_empty_date_writes_only_prs(self, fetcher, mock_client, test_config):
+        """빈 날짜는 prs.json만 생성, 빈 commits.json/issues.json은 쓰지 않음."""
         mock_client.search_issues.return_value = {"total_count": 0, "items": []}
         mock_client.search_commits.return_value = {"total_count": 0, "items": []}
 
@@ -598,8 +886,22 @@ class TestFetchIntegration:
 
         raw_dir = test_config.date_raw_dir("2025-02-16")
         assert (raw_dir / "prs.json").exists()
-        assert (raw_dir / "commits.json").exists()
-        assert (raw_dir / "issues.json").exists()
+        assert not (raw_dir / "commits.json").exists()
+        assert not (raw_dir / "issues.json").exists()
+
+    def test_fetch_empty_overwrites_existing_files(self, fetcher, mock_client, test_config):
+        """기존 파일이 있으면 빈 결과라도 덮어써서 stale 데이터를 남기지 않음."""
+        raw_dir = test_config.date_raw_dir("2025-02-16")
+        raw_dir.mkdir(parents=True, exist_ok=True)
+        (raw_dir / "commits.json").write_text('[{"sha": "old"}]')
+        (raw_dir / "issues.json").write_text('[{"number": 1}]')
+        mock_client.search_issues.return_value = {"total_count": 0, "items": []}
+        mock_client.search_commits.return_value = {"total_count": 0, "items": []}
+
+        fetcher.fetch("2025-02-16")
+
+        assert load_json(raw_dir / "commits.json") == []
+        assert load_json(raw_dir / "issues.json") == []
 
     def test_fetch_with_commits_and_issues(self, fetcher, mock_client, test_config):
         """fetch()가 PR + commit + issue를 모두 수집."""
@@ -677,6 +979,48 @@ class TestSearchPrsRange:
         result = fetcher._search_prs_range("2025-02-14", "2025-02-16")
         assert len(result) == 0
 
+    def test_skips_hits_without_pr_url(self, fetcher, mock_client):
+        """pull_request가 없는 hit은 enrich할 수 없으므로 map에 넣지 않는다."""
+        api_url = "https://ghes/api/v3/repos/org/repo/pulls/1"
+        bad = _make_search_item("", 2)
+        del bad["pull_request"]
+        mock_client.search_issues.return_value = {
+            "total_count": 2,
+            "items": [_make_search_item(api_url, 1), bad],
+        }
+        result = fetcher._search_prs_range("2025-02-14", "2025-02-16")
+        assert list(result) == [api_url]
+
+    def test_axes_run_concurrently(self, fetcher, mock_client):
+        """3축 검색이 동시에 in-flight."""
+        import threading
+
+        barrier = threading.Barrier(3, timeout=5)
+
+        def side_effect(query, **kwargs):
+            barrier.wait()
+            return {"total_count": 0, "items": []}
+
+        mock_client.search_issues.side_effect = side_effect
+        assert fetcher._search_prs_range("2025-02-14", "2025-02-16") == {}
+
+    def test_dedup_keeps_earliest_axis_item(self, fetcher, mock_client):
+        """author 축이 늦게 끝나도 dedup은 author 축 item을 남긴다."""
+        import time
+
+        api_url = "https://ghes/api/v3/repos/org/repo/pulls/1"
+
+        def side_effect(query, **kwargs):
+            item = _make_search_item(api_url, 1)
+            item["axis"] = query.split()[1].split(":")[0]
+            if item["axis"] == "author":
+                time.sleep(0.05)
+            return {"total_count": 1, "items": [item]}
+
+        mock_client.search_issues.side_effect = side_effect
+        result = fetcher._search_prs_range("2025-02-14", "2025-02-16")
+        assert result[api_url]["axis"] == "author"
+
     def test_warns_on_1000_results(self, fetcher, mock_client, caplog):
         """수집 결과 >= 1000 시 warning."""
         # 10 pages of 100 items = 1000 items total
@@ -854,15 +1198,21 @@ class TestIsDateFetched:
         (raw_dir / "issues.json").write_text("[]")
         assert fetcher._is_date_fetched("2025-02-16") is True
 
-    def test_missing_one_file(self, fetcher, test_config):
-        """파일 1개 누락 → False."""
+    def test_missing_prs_file(self, fetcher, test_config):
+        """prs.json 누락 → False."""
         raw_dir = test_config.date_raw_dir("2025-02-16")
         raw_dir.mkdir(parents=True, exist_ok=True)
-        (raw_dir / "prs.json").write_text("[]")
         (raw_dir / "commits.json").write_text("[]")
-        # issues.json 없음
+        (raw_dir / "issues.json").write_text("[]")
         assert fetcher._is_date_fetched("2025-02-16") is False
 
+    def test_only_prs_file(self, fetcher, test_config):
+        """빈 날짜처럼 prs.json만 있어도 → True."""
+        raw_dir = test_config.date_raw_dir("2025-02-16")
+        raw_dir.mkdir(parents=True, exist_ok=True)
+        (raw_dir / "prs.json").write_text("[]")
+        assert fetcher._is_date_fetched("2025-02-16") is True
+
     def test_dir_not_exist(self, fetcher, test_config):
         """디렉토리 자체가 없음 → False."""
         assert fetcher._is_date_fetched("2099-01-01") is False
@@ -944,18 +1294,18 @@ class TestFetchRange:
         mock_client.search_commits.return_value = {"total_count": 0, "items": []}
 
     def test_basic_range(self, fetcher, mock_client, test_config):
-        """기본 범위 fetch — 날짜별 빈 파일 생성."""
+        """기본 범위 fetch — 날짜별 빈 prs.json 생성."""
         self._setup_empty_search(mock_client)
         results = fetcher.fetch_range("2025-02-14", "2025-02-16")
         assert len(results) == 3
         for r in results:
             assert r["status"] == "success"
-        # 3개 날짜 모두 파일 존재
+        # 3개 날짜 모두 prs.json 존재, 빈 commits/issues는 생략
         for d in ["2025-02-14", "2025-02-15", "2025-02-16"]:
             raw_dir = test_config.date_raw_dir(d)
             assert (raw_dir / "prs.json").exists()
-            assert (raw_dir / "commits.json").exists()
-            assert (raw_dir / "issues.json").exists()
+            assert not (raw_dir / "commits.json").exists()
+            assert not (raw_dir / "issues.json").exists()
 
     def test_skip_existing(self, fetcher, mock_client, test_config):
         """이미 fetch한 날짜는 skip."""
@@ -1004,6 +1354,31 @@ class TestFetchRange:
         data = load_json(test_config.checkpoints_path)
         assert data["last_fetch_date"] == "2025-02-16"
 
+    def test_checkpoint_written_once_per_range(self, fetcher, mock_client, test_config):
+        """checkpoint 파일은 날짜마다가 아니라 range 끝에서 한 번만 기록."""
+        self._setup_empty_search(mock_client)
+        with patch("workrecap.services.checkpoint.update_checkpoint") as mock_update:
+            fetcher.fetch_range("2025-02-14", "2025-02-16")
+        mock_update.assert_called_once_with(
+            test_config.checkpoints_path, "last_fetch_date", "2025-02-16"
+        )
+
+    def test_checkpoint_flushed_on_interrupt(self, fetcher, mock_client, test_config):
+        """range 도중 예외가 전파돼도 이미 처리된 날짜까지 checkpoint 기록."""
+        self._setup_empty_search(mock_client)
+        original = fetcher._save_date_from_bucket
+
+        def interrupt_on_16(d, bucket, active):
+            if d == "2025-02-16":
+                raise KeyboardInterrupt
+            return original(d, bucket, active)
+
+        with patch.object(fetcher, "_save_date_from_bucket", side_effect=interrupt_on_16):
+            with pytest.raises(KeyboardInterrupt):
+                fetcher.fetch_range("2025-02-14", "2025-02-16")
+        data = load_json(test_config.checkpoints_path)
+        assert data["last_fetch_date"] == "2025-02-15"
+
     def test_types_filter(self, fetcher, mock_client, test_config):
         """types 필터 전달 시 해당 타입만 검색/저장."""
         mock_client.search_issues.return_value = {"total_count": 0, "items": []}
@@ -1147,78 +1522,29 @@ class TestFetcherDailyStateIntegration:
         assert len(results) == 3
         assert all(r["status"] == "skipped" for r in results)
 
+    def test_fetch_range_writes_daily_state_once_per_chunk(self, test_config, mock_client):
+        """fetch_range는 날짜별 set_timestamp 대신 chunk마다 set_timestamps 한 번."""
+        from unittest.mock import MagicMock
 
-class TestParallelEnrichment:
-    def test_enrich_with_explicit_client(self, test_config, mock_client):
-        """_enrich with explicit client uses that client, not self._client."""
-        other_client = Mock(spec=GHESClient)
-        other_client.get_pr.return_value = _make_pr_detail()
-        other_client.get_pr_files.return_value = []
-        other_client.get_pr_comments.return_value = []
-        other_client.get_pr_reviews.return_value = []
-
-        fetcher = FetcherService(test_config, mock_client)
-        pr_basic = _make_search_item("https://ghes/api/v3/repos/org/repo/pulls/1")
-        result = fetcher._enrich(pr_basic, client=other_client)
-
-        assert result.number == 1
-        other_client.get_pr.assert_called_once()
-        mock_client.get_pr.assert_not_called()
+        mock_ds = MagicMock()
+        mock_ds.stale_dates.side_effect = lambda phase, dates: list(dates)
+        fetcher = FetcherService(test_config, mock_client, daily_state=mock_ds)
 
-    def test_enrich_commit_with_explicit_client(self, test_config, mock_client):
-        """_enrich_commit with explicit client uses that client."""
-        other_client = Mock(spec=GHESClient)
-        other_client.get_commit.return_value = {
-            "sha": "abc123",
-            "html_url": "https://ghes/org/repo/commit/abc123",
-            "url": "https://ghes/api/v3/repos/org/repo/commits/abc123",
-            "commit": {
-                "message": "test",
-                "committer": {"date": "2025-02-16T10:00:00Z"},
-            },
-            "files": [],
-        }
+        mock_client.search_issues.return_value = {"total_count": 0, "items": []}
+        mock_client.search_commits.return_value = {"total_count": 0, "items": []}
 
-        fetcher = FetcherService(test_config, mock_client)
-        item = {
-            "sha": "abc123",
-            "repository": {"full_name": "org/repo"},
-            "author": {"login": "testuser"},
-        }
-        result = fetcher._enrich_commit(item, client=other_client)
-
-        assert result.sha == "abc123"
-        other_client.get_commit.assert_called_once()
-        mock_client.get_commit.assert_not_called()
-
-    def test_enrich_issue_with_explicit_client(self, test_config, mock_client):
-        """_enrich_issue with explicit client uses that client."""
-        other_client = Mock(spec=GHESClient)
-        other_client.get_issue.return_value = {
-            "url": "https://ghes/api/v3/repos/org/repo/issues/10",
-            "html_url": "https://ghes/org/repo/issues/10",
-            "number": 10,
-            "title": "Bug",
-            "body": "desc",
-            "state": "open",
-            "created_at": "2025-02-16T09:00:00Z",
-            "updated_at": "2025-02-16T15:00:00Z",
-            "closed_at": None,
-            "user": {"login": "testuser"},
-            "labels": [],
-        }
-        other_client.get_issue_comments.return_value = []
+        fetcher.fetch_range("2025-01-30", "2025-02-02")
 
-        fetcher = FetcherService(test_config, mock_client)
-        item = {"url": "https://ghes/api/v3/repos/org/repo/issues/10"}
-        result = fetcher._enrich_issue(item, client=other_client)
+        mock_ds.set_timestamp.assert_not_called()
+        assert mock_ds.set_timestamps.call_args_list == [
+            (("fetch", ["2025-01-30", "2025-01-31"]),),
+            (("fetch", ["2025-02-01", "2025-02-02"]),),
+        ]
 
-        assert result.number == 10
-        other_client.get_issue.assert_called_once()
-        mock_client.get_issue.assert_not_called()
 
-    def test_default_client_when_none_passed(self, test_config, mock_client):
-        """_enrich with client=None falls back to self._client."""
+class TestParallelEnrichment:
+    def test_enrich_uses_service_client(self, test_config, mock_client):
+        """_enrich는 서비스의 공유 client로 조회한다."""
         fetcher = FetcherService(test_config, mock_client)
         pr_basic = _make_search_item("https://ghes/api/v3/repos/org/repo/pulls/1")
         result = fetcher._enrich(pr_basic)
@@ -1227,19 +1553,10 @@ class TestParallelEnrichment:
         mock_client.get_pr.assert_called_once()
 
     def test_parallel_enrichment_with_max_workers(self, test_config, mock_client):
-        """FetcherService with max_workers > 1 uses ThreadPoolExecutor."""
-        from unittest.mock import MagicMock
-
-        mock_pool = MagicMock()
-        mock_pool_client = Mock(spec=GHESClient)
-        mock_pool_client.get_pr.return_value = _make_pr_detail()
-        mock_pool_client.get_pr_files.return_value = []
-        mock_pool_client.get_pr_comments.return_value = []
-        mock_pool_client.get_pr_reviews.return_value = []
-        mock_pool.acquire.return_value = mock_pool_client
-        mock_pool.release = Mock()
+        """max_workers > 1이어도 enrich는 공유 client 하나로 수행."""
+        mock_client.get_pr.side_effect = lambda owner, repo, number: _make_pr_detail(number=number)
 
-        fetcher = FetcherService(test_config, mock_client, max_workers=3, client_pool=mock_pool)
+        fetcher = FetcherService(test_config, mock_client, max_workers=3)
 
         bucket = {
             "prs": {
@@ -1253,9 +1570,9 @@ class TestParallelEnrichment:
         }
         fetcher._save_date_from_bucket("2025-02-16", bucket, {"prs"})
 
-        # Pool should have been used
-        assert mock_pool.acquire.call_count == 3
-        assert mock_pool.release.call_count == 3
+        assert mock_client.get_pr.call_count == 3
+        prs = load_json(test_config.date_raw_dir("2025-02-16") / "prs.json")
+        assert sorted(pr["number"] for pr in prs) == [1, 2, 3]
 
     def test_failure_isolation_in_parallel(self, test_config, mock_client):
         """One PR enrichment failure doesn't prevent others from succeeding."""
@@ -1284,22 +1601,124 @@ class TestParallelEnrichment:
         # Should not raise - failures are logged and skipped
         fetcher._save_date_from_bucket("2025-02-16", bucket, {"prs"})
 
+    def test_concurrent_enrichment_without_pool(self, test_config, mock_client):
+        """공유 client 하나로 enrich_concurrency 스레드에서 enrich."""
+        import threading
+
+        thread_names: set[str] = set()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def get_pr(owner, repo, number):
+            thread_names.add(threading.current_thread().name)
+            barrier.wait()
+            return _make_pr_detail(number=number)
+
+        mock_client.get_pr.side_effect = get_pr
+        fetcher = FetcherService(test_config, mock_client)
+
+        pr_map = {
+            f"https://ghes/api/v3/repos/org/repo/pulls/{i}": _make_search_item(
+                f"https://ghes/api/v3/repos/org/repo/pulls/{i}", i
+            )
+            for i in range(1, 4)
+        }
+        prs = fetcher._enrich_prs_concurrent(pr_map)
+
+        assert sorted(pr.number for pr in prs) == [1, 2, 3]
+        assert len(thread_names) == 3
+
+    def test_bucket_kinds_share_one_executor(self, test_config, mock_client):
+        """PR/commit/issue enrich가 순차 실행되지 않고 한 executor에서 겹쳐 실행."""
+        import threading
+
+        barrier = threading.Barrier(3, timeout=5)
+
+        def get_pr(owner, repo, number):
+            barrier.wait()
+            return _make_pr_detail(number=number)
+
+        def get_commit(owner, repo, sha):
+            barrier.wait()
+            return _make_commit_detail(sha=sha)
+
+        def get_issue(owner, repo, number):
+            barrier.wait()
+            return _make_issue_detail(number=number)
+
+        mock_client.get_pr.side_effect = get_pr
+        mock_client.get_commit.side_effect = get_commit
+        mock_client.get_issue.side_effect = get_issue
+        fetcher = FetcherService(test_config, mock_client)
+
+        pr_url = "https://ghes/api/v3/repos/org/repo/pulls/1"
+        issue_item = _make_issue_search_item()
+        bucket = {
+            "prs": {pr_url: _make_search_item(pr_url, 1)},
+            "commits": [_make_commit_search_item()],
+            "issues": {issue_item["url"]: issue_item},
+        }
+        fetcher._save_date_from_bucket("2025-02-16", bucket, {"prs", "commits", "issues"})
+
+        raw_dir = test_config.date_raw_dir("2025-02-16")
+        assert len(load_json(raw_dir / "prs.json")) == 1
+        assert len(load_json(raw_dir / "commits.json")) == 1
+        assert len(load_json(raw_dir / "issues.json")) == 1
+
+    def test_concurrent_enrichment_skips_failures(self, test_config, mock_client):
+        """실패한 commit/issue는 건너뛰고 나머지는 반환."""
+
+        def get_issue(owner, repo, number):
+            if number == 2:
+                raise FetchError("boom")
+            return {
+                "url": f"https://ghes/api/v3/repos/org/repo/issues/{number}",
+                "html_url": f"https://ghes/org/repo/issues/{number}",
+                "number": number,
+                "title": "Bug",
+                "body": "",
+                "state": "open",
+                "created_at": "2025-02-16T09:00:00Z",
+                "updated_at": "2025-02-16T15:00:00Z",
+                "closed_at": None,
+                "user": {"login": "testuser"},
+                "labels": [],
+            }
+
+        mock_client.get_issue.side_effect = get_issue
+        fetcher = FetcherService(test_config, mock_client)
+
+        issue_map = {
+            f"https://ghes/api/v3/repos/org/repo/issues/{i}": {
+                "url": f"https://ghes/api/v3/repos/org/repo/issues/{i}"
+            }
+            for i in range(1, 4)
+        }
+        issues = fetcher._enrich_issues_concurrent(issue_map)
+
+        assert sorted(i.number for i in issues) == [1, 3]
+
+    def test_empty_bucket_writes_files_without_executor(self, test_config, mock_client):
+        """빈 날짜는 enrich pool 없이 빈 파일만 기록하고, 이전 run의 파일도 비운다."""
+        from workrecap.services.fetcher import _EMPTY_BUCKET
+
+        raw_dir = test_config.date_raw_dir("2025-02-16")
+        raw_dir.mkdir(parents=True)
+        (raw_dir / "commits.json").write_text('[{"sha": "stale"}]')
+
+        fetcher = FetcherService(test_config, mock_client)
+        with patch("workrecap.services.fetcher.ThreadPoolExecutor") as executor_cls:
+            fetcher._save_date_from_bucket("2025-02-16", _EMPTY_BUCKET, {"prs", "commits"})
+
+        executor_cls.assert_not_called()
+        assert load_json(raw_dir / "prs.json") == []
+        assert load_json(raw_dir / "commits.json") == []
+        assert _EMPTY_BUCKET == {"prs": {}, "commits": [], "issues": {}}
+
 
 class TestFetchRangeParallel:
     def test_fetch_range_max_workers_passed(self, test_config, mock_client):
         """fetch_range with max_workers>1 uses parallel date processing."""
-        from unittest.mock import MagicMock
-
-        mock_pool = MagicMock()
-        pool_client = Mock(spec=GHESClient)
-        pool_client.get_pr.return_value = _make_pr_detail()
-        pool_client.get_pr_files.return_value = []
-        pool_client.get_pr_comments.return_value = []
-        pool_client.get_pr_reviews.return_value = []
-        mock_pool.acquire.return_value = pool_client
-        mock_pool.release = Mock()
-
-        fetcher = FetcherService(test_config, mock_client, max_workers=3, client_pool=mock_pool)
+        fetcher = FetcherService(test_config, mock_client, max_workers=3)
 
         # Mock search to return 1 PR per axis
         api_url = "https://ghes/api/v3/repos/org/repo/pulls/1"
@@ -1312,6 +1731,23 @@ class TestFetchRangeParallel:
         assert len(results) == 1
         assert results[0]["status"] == "success"
 
+    def test_process_dates_parallel_keeps_date_order(self, test_config, mock_client):
+        """완료 순서와 무관하게 결과는 입력 날짜 순서."""
+        import time
+
+        fetcher = FetcherService(test_config, mock_client, max_workers=3)
+        dates = ["2025-02-14", "2025-02-15", "2025-02-16"]
+
+        def save(d, bucket, active):
+            if d == "2025-02-14":
+                time.sleep(0.05)  # 첫 날짜가 가장 늦게 끝남
+
+        with patch.object(fetcher, "_save_date_from_bucket", side_effect=save):
+            results = fetcher._process_dates_parallel(dates, {}, {"prs"})
+
+        assert [r["date"] for r in results] == dates
+        assert all(r["status"] == "success" for r in results)
+
     def test_fetch_range_sequential_fallback(self, test_config, mock_client):
         """fetch_range with max_workers=1 uses sequential path."""
         fetcher = FetcherService(test_config, mock_client, max_workers=1)
@@ -1344,6 +1780,27 @@ class TestFetchRangeParallel:
         statuses = [r["status"] for r in results]
         assert "success" in statuses
 
+    def test_idle_days_bypass_parallel_path(self, test_config, mock_client):
+        """활동 있는 날짜만 병렬 처리, 빈 날짜는 순차로 빈 파일만 기록."""
+        fetcher = FetcherService(test_config, mock_client, max_workers=3)
+        items = []
+        for i, day in enumerate(("14", "16"), start=1):
+            item = _make_search_item(f"https://ghes/api/v3/repos/org/repo/pulls/{i}", i)
+            item["updated_at"] = f"2025-02-{day}T15:00:00Z"
+            items.append(item)
+        mock_client.search_issues.return_value = {"total_count": 2, "items": items}
+        mock_client.search_commits.return_value = {"total_count": 0, "items": []}
+
+        with patch.object(
+            fetcher, "_process_dates_parallel", wraps=fetcher._process_dates_parallel
+        ) as spy:
+            results = fetcher.fetch_range("2025-02-14", "2025-02-16", force=True)
+
+        assert spy.call_args.args[0] == ["2025-02-14", "2025-02-16"]
+        assert sorted(r["date"] for r in results) == ["2025-02-14", "2025-02-15", "2025-02-16"]
+        assert all(r["status"] == "success" for r in results)
+        assert load_json(test_config.date_raw_dir("2025-02-15") / "prs.json") == []
+
 
 class TestFetchRangeResume:
     def test_resume_skips_search_for_cached_chunk(self, test_config, mock_client):
@@ -1470,6 +1927,39 @@ class TestFetchRangeFailedDates:
         # 2025-02-15 should be retried (not skipped) because it has a failure record
         assert statuses["2025-02-15"] == "success"
 
+    def test_chunk_dates_sliced_from_range(self, test_config, mock_client):
+        """월 경계를 넘는 range에서 날짜 목록은 한 번만 생성하고 chunk별로 slice."""
+        from workrecap.services import fetcher as fetcher_module
+
+        self._setup_empty_search(mock_client)
+        fetcher = FetcherService(test_config, mock_client)
+
+        with patch.object(fetcher_module, "date_range", wraps=fetcher_module.date_range) as spy:
+            results = fetcher.fetch_range("2025-01-30", "2025-03-02")
+
+        spy.assert_called_once()
+        assert sorted(r["date"] for r in results) == fetcher_module.date_range(
+            "2025-01-30", "2025-03-02"
+        )
+
+    def test_retryable_dates_queried_once_per_range(self, test_config, mock_client):
+        """retryable_dates는 날짜마다가 아니라 range 전체로 한 번만 조회."""
+        from workrecap.services.failed_dates import FailedDateStore
+
+        failed_store = FailedDateStore(
+            test_config.data_dir / "state" / "failed_dates.json", max_retries=3
+        )
+        self._setup_empty_search(mock_client)
+        fetcher = FetcherService(test_config, mock_client, failed_date_store=failed_store)
+
+        with patch.object(
+            failed_store, "retryable_dates", wraps=failed_store.retryable_dates
+        ) as spy:
+            results = fetcher.fetch_range("2025-01-20", "2025-02-10")
+
+        assert len(results) == 22
+        spy.assert_called_once()
+
     def test_success_clears_failure_record(self, test_config, mock_client):
         """Successful fetch clears the failure tracking entry."""
         from workrecap.services.failed_dates import FailedDateStore
@@ -1674,3 +2164,380 @@ class TestRepoFilter:
         assert len(filtered) == 2
         assert "url1" in filtered
         assert "url2" in filtered
+
+
+class TestGraphQLEnrich:
+    @pytest.fixture
+    def gql_fetcher(self, test_config, mock_client):
+        config = AppConfig(
+            ghes_url=test_config.ghes_url,
+            ghes_token=test_config.ghes_token,
+            username=test_config.username,
+            data_dir=test_config.data_dir,
+            graphql_enrich=True,
+        )
+        return FetcherService(config, mock_client)
+
+    @staticmethod
+    def _pr_node(comments_truncated=False):
+        author = {"__typename": "User", "login": "reviewer1"}
+        return {
+            "number": 1,
+            "title": "Test PR",
+            "body": "PR body",
+            "url": "https://ghes/org/repo/pull/1",
+            "state": "MERGED",
+            "merged": True,
+            "createdAt": "2025-02-16T09:00:00Z",
+            "updatedAt": "2025-02-16T15:00:00Z",
+            "mergedAt": "2025-02-16T14:00:00Z",
+            "author": {"__typename": "User", "login": "testuser"},
+            "labels": {"nodes": [{"name": "feature"}]},
+            "comments": {
+                "pageInfo": {"hasNextPage": comments_truncated},
+                "nodes": [
+                    {
+                        "author": {"__typename": "Bot", "login": "ci"},
+                        "body": "Build passed",
+                        "createdAt": "2025-02-16T10:00:00Z",
+                        "url": "https://ghes/org/repo/pull/1#issuecomment-1",
+                    }
+                ],
+            },
+            "reviews": {
+                "pageInfo": {"hasNextPage": False},
+                "nodes": [
+                    {
+                        "author": author,
+                        "state": "APPROVED",
+                        "body": "",
+                        "submittedAt": "2025-02-16T12:00:00Z",
+                        "url": "https://ghes/org/repo/pull/1#review-1",
+                        "comments": {
+                            "pageInfo": {"hasNextPage": False},
+                            "nodes": [
+                                {
+                                    "author": author,
+                                    "body": "Good approach",
+                                    "createdAt": "2025-02-16T11:00:00Z",
+                                    "url": "https://ghes/org/repo/pull/1#comment-1",
+                                    "path": "src/main.py",
+                                    "line": 5,
+                                    "originalLine": 5,
+                                    "diffHunk": "@@ -1,3 +1,5 @@\n+new line",
+                                }
+                            ],
+                        },
+                    }
+                ],
+            },
+        }
+
+    def test_pr_uses_graphql_and_rest_files(self, gql_fetcher, mock_client):
+        """detail/comments/reviews는 GraphQL 1회, files만 REST."""
+        mock_client.graphql.return_value = {"repository": {"pullRequest": self._pr_node()}}
+        api_url = "https://ghes/api/v3/repos/org/repo/pulls/1"
+
+        result = gql_fetcher._enrich(_make_search_item(api_url, 1))
+
+        mock_client.graphql.assert_called_once()
+        mock_client.get_pr.assert_not_called()
+        mock_client.get_pr_comments.assert_not_called()
+        mock_client.get_pr_reviews.assert_not_called()
+        mock_client.get_pr_files.assert_called_once_with("org", "repo", 1)
+        assert result.api_url == api_url
+        assert result.state == "closed"
+        assert result.is_merged is True
+        assert result.labels == ["feature"]
+        assert result.files[0].patch == "@@ -1,3 +1,5 @@\n+new line"
+        # bot 코멘트(ci[bot])는 REST와 동일하게 noise로 제거
+        assert [c.body for c in result.comments] == ["Good approach"]
+        assert result.comments[0].line == 5
+        assert [r.state for r in result.reviews] == ["APPROVED"]
+
+    def test_truncated_comments_fall_back_to_rest(self, gql_fetcher, mock_client):
+        node = self._pr_node(comments_truncated=True)
+        mock_client.graphql.return_value = {"repository": {"pullRequest": node}}
+        api_url = "https://ghes/api/v3/repos/org/repo/pulls/1"
+
+        result = gql_fetcher._enrich(_make_search_item(api_url, 1))
+
+        mock_client.get_pr.assert_not_called()
+        mock_client.get_pr_comments.assert_called_once_with("org", "repo", 1)
+        mock_client.get_pr_reviews.assert_called_once_with("org", "repo", 1)
+        assert result.title == "Test PR"
+        assert len(result.reviews) == 1
+
+    def test_missing_pr_raises_fetch_error(self, gql_fetcher, mock_client):
+        mock_client.graphql.return_value = {"repository": {"pullRequest": None}}
+        api_url = "https://ghes/api/v3/repos/org/repo/pulls/1"
+        with pytest.raises(FetchError):
+            gql_fetcher._enrich(_make_search_item(api_url, 1))
+
+    def test_issue_uses_single_graphql_query(self, gql_fetcher, mock_client):
+        mock_client.graphql.return_value = {
+            "repository": {
+                "issue": {
+                    "number": 10,
+                    "title": "Bug report",
+                    "body": None,
+                    "url": "https://ghes/org/repo/issues/10",
+                    "state": "OPEN",
+                    "createdAt": "2025-02-16T09:00:00Z",
+                    "updatedAt": "2025-02-16T15:00:00Z",
+                    "closedAt": None,
+                    "author": {"__typename": "User", "login": "testuser"},
+                    "labels": {"nodes": []},
+                    "comments": {"pageInfo": {"hasNextPage": False}, "nodes": []},
+                }
+            }
+        }
+        item = _make_issue_search_item()
+
+        result = gql_fetcher._enrich_issue(item)
+
+        mock_client.get_issue.assert_not_called()
+        mock_client.get_issue_comments.assert_not_called()
+        assert result.api_url == item["url"]
+        assert result.state == "open"
+        assert result.body == ""
+
+    def _batch_side_effect(self, fail_aliases=()):
+        """alias별 PR node를 돌려주는 graphql_partial 대역. fail_aliases는 error 처리."""
+
+        def graphql_partial(query, variables):
+            data, errors = {}, []
+            i = 0
+            while f"n{i}" in variables:
+                alias = f"pr{i}"
+                if alias in fail_aliases:
+                    data[alias] = None
+                    errors.append({"path": [alias], "message": "Could not resolve"})
+                else:
+                    node = self._pr_node()
+                    node["number"] = variables[f"n{i}"]
+                    data[alias] = {"pullRequest": node}
+                i += 1
+            return data, errors
+
+        return graphql_partial
+
+    @staticmethod
+    def _pr_basics(count):
+        return [
+            _make_search_item(f"https://ghes/api/v3/repos/org/repo/pulls/{i}", i)
+            for i in range(1, count + 1)
+        ]
+
+    def test_batch_enrich_uses_one_query(self, gql_fetcher, mock_client):
+        mock_client.graphql_partial.side_effect = self._batch_side_effect()
+
+        prs = gql_fetcher._enrich_pr_batch(self._pr_basics(3))
+
+        assert mock_client.graphql_partial.call_count == 1
+        mock_client.graphql.assert_not_called()
+        mock_client.get_pr.assert_not_called()
+        assert mock_client.get_pr_files.call_count == 3
+        assert sorted(pr.number for pr in prs) == [1, 2, 3]
+        assert all(pr.api_url.endswith(f"/pulls/{pr.number}") for pr in prs)
+
+    def test_batch_failed_alias_falls_back_per_pr(self, gql_fetcher, mock_client):
+        """에러가 난 alias만 단건 GraphQL 쿼리로 다시 조회."""
+        mock_client.graphql_partial.side_effect = self._batch_side_effect(fail_aliases={"pr1"})
+        node = self._pr_node()
+        node["number"] = 2
+        mock_client.graphql.return_value = {"repository": {"pullRequest": node}}
+
+        prs = gql_fetcher._enrich_pr_batch(self._pr_basics(3))
+
+        mock_client.graphql.assert_called_once()
+        assert mock_client.graphql.call_args[0][1]["number"] == 2
+        assert sorted(pr.number for pr in prs) == [1, 2, 3]
+
+    def test_batch_query_failure_falls_back_for_all(self, gql_fetcher, mock_client):
+        mock_client.graphql_partial.side_effect = FetchError("Server error")
+        mock_client.graphql.side_effect = FetchError("Server error")
+
+        prs = gql_fetcher._enrich_pr_batch(self._pr_basics(2))
+
+        assert mock_client.graphql.call_count == 2
+        assert prs == []
+
+    def test_save_date_batches_prs(self, gql_fetcher, mock_client, test_config):
+        """PR_BATCH_SIZE(25) 단위로 묶여 30개 PR → 쿼리 2회."""
+        mock_client.graphql_partial.side_effect = self._batch_side_effect()
+        pr_basics = self._pr_basics(30)
+        bucket = {
+            "prs": {b["pull_request"]["url"]: b for b in pr_basics},
+            "commits": [],
+            "issues": {},
+        }
+
+        gql_fetcher._save_date_from_bucket("2025-02-16", bucket, {"prs"})
+
+        assert mock_client.graphql_partial.call_count == 2
+        saved = load_json(test_config.date_raw_dir("2025-02-16") / "prs.json")
+        assert sorted(pr["number"] for pr in saved) == list(range(1, 31))
+
+    def test_save_date_splits_comment_heavy_prs(self, gql_fetcher, mock_client):
+        """코멘트가 많은 PR은 node budget을 넘지 않도록 더 작은 batch로 분리."""
+        mock_client.graphql_partial.side_effect = self._batch_side_effect()
+        pr_basics = self._pr_basics(4)
+        for basic in pr_basics:
+            basic["comments"] = 400  # 50 + 3*400 = 1250 nodes → batch당 2개
+
+        bucket = {
+            "prs": {b["pull_request"]["url"]: b for b in pr_basics},
+            "commits": [],
+            "issues": {},
+        }
+        gql_fetcher._save_date_from_bucket("2025-02-16", bucket, {"prs"})
+
+        assert mock_client.graphql_partial.call_count == 2
+
+
+class TestGraphQLSearch:
+    @pytest.fixture
+    def gql_fetcher(self, test_config, mock_client):
+        config = AppConfig(
+            ghes_url=test_config.ghes_url,
+            ghes_token=test_config.ghes_token,
+            username=test_config.username,
+            data_dir=test_config.data_dir,
+            graphql_search=True,
+        )
+        mock_client.api_base = "https://ghes/api/v3"
+        return FetcherService(config, mock_client)
+
+    @staticmethod
+    def _node(number: int) -> dict:
+        return {
+            "number": number,
+            "title": f"PR {number}",
+            "url": f"https://ghes/org/repo/pull/{number}",
+            "createdAt": "2025-02-16T09:00:00Z",
+            "updatedAt": "2025-02-16T15:00:00Z",
+            "repository": {"nameWithOwner": "org/repo"},
+            "comments": {"totalCount": 0},
+        }
+
+    @staticmethod
+    def _conn(nodes, cursor=None):
+        page_info = {"hasNextPage": cursor is not None, "endCursor": cursor}
+        return {"pageInfo": page_info, "nodes": nodes}
+
+    def test_three_axes_in_one_request(self, gql_fetcher, mock_client):
+        """3축이 한 요청으로 나가고, 다음 페이지는 남은 축만 이어서 조회."""
+        calls: list[dict] = []
+
+        def graphql_partial(query, variables):
+            calls.append(variables)
+            if len(calls) == 1:
+                return {
+                    "author": self._conn([self._node(1), {}], cursor="next"),
+                    "reviewed": self._conn([self._node(1)]),
+                    "commenter": self._conn([self._node(2)]),
+                }, []
+            return {"author": self._conn([self._node(3)])}, []
+
+        mock_client.graphql_partial.side_effect = graphql_partial
+
+        result = gql_fetcher._search_prs_range("2025-02-14", "2025-02-16")
+
+        assert sorted(result) == [
+            f"https://ghes/api/v3/repos/org/repo/pulls/{n}" for n in (1, 2, 3)
+        ]
+        assert len(calls) == 2
+        assert "q_reviewed" in calls[0]
+        assert calls[1] == {
+            "q_author": "type:pr author:testuser updated:2025-02-14..2025-02-16",
+            "c_author": "next",
+        }
+        mock_client.search_issues.assert_not_called()
+
+    def test_reviewed_by_error_skipped(self, gql_fetcher, mock_client):
+        mock_client.graphql_partial.return_value = (
+            {"author": self._conn([self._node(1)]), "reviewed": None, "commenter": self._conn([])},
+            [{"path": ["reviewed"], "message": "unsupported qualifier"}],
+        )
+        result = gql_fetcher._search_prs_range("2025-02-14", "2025-02-16")
+        assert list(result) == ["https://ghes/api/v3/repos/org/repo/pulls/1"]
+        mock_client.search_issues.assert_not_called()
+
+    def test_falls_back_to_rest_on_failure(self, gql_fetcher, mock_client):
+        mock_client.graphql_partial.side_effect = FetchError("GraphQL unavailable")
+        api_url = "https://ghes/api/v3/repos/org/repo/pulls/1"
+        mock_client.search_issues.return_value = {
+            "total_count": 1,
+            "items": [_make_search_item(api_url, 1)],
+        }
+        result = gql_fetcher._search_prs_range("2025-02-14", "2025-02-16")
+        assert list(result) == [api_url]
+        assert mock_client.search_issues.call_count == 3
+
+
+class TestSearchOrAxes:
+    @pytest.fixture
+    def or_fetcher(self, test_config, mock_client):
+        config = AppConfig(
+            ghes_url=test_config.ghes_url,
+            ghes_token=test_config.ghes_token,
+            username=test_config.username,
+            data_dir=test_config.data_dir,
+            search_or_axes=True,
+        )
+        return FetcherService(config, mock_client)
+
+    def test_default_uses_per_axis_queries(self, fetcher, mock_client):
+        mock_client.search_issues.return_value = {"total_count": 0, "items": []}
+        fetcher._search_prs("2025-02-16")
+        queries = [c.args[0] for c in mock_client.search_issues.call_args_list]
+        assert len(queries) == 3
+        assert not any(" OR " in q for q in queries)
+
+    def test_prs_single_combined_query(self, or_fetcher, mock_client):
+        api_url = "https://ghes/api/v3/repos/org/repo/pulls/1"
+        mock_client.search_issues.return_value = {
+            "total_count": 1,
+            "items": [_make_search_item(api_url, 1)],
+        }
+        result = or_fetcher._search_prs_range("2025-02-14", "2025-02-16")
+        assert list(result) == [api_url]
+        mock_client.search_issues.assert_called_once()
+        assert mock_client.search_issues.call_args.args[0] == (
+            "type:pr (author:testuser OR reviewed-by:testuser OR commenter:testuser) "
+            "updated:2025-02-14..2025-02-16"
+        )
+
+    def test_issues_single_combined_query(self, or_fetcher, mock_client):
+        item = _make_issue_search_item(10)
+        mock_client.search_issues.return_value = {"total_count": 1, "items": [item]}
+        result = or_fetcher._search_issues_range("2025-02-14", "2025-02-16")
+        assert list(result) == [item["url"]]
+        assert mock_client.search_issues.call_args.args[0] == (
+            "type:issue (author:testuser OR commenter:testuser) updated:2025-02-14..2025-02-16"
+        )
+
+    def test_rejected_query_falls_back_to_axes(self, or_fetcher, mock_client):
+        def search(query, page=1, per_page=100):
+            if " OR " in query:
+                raise FetchError("Client error 422")
+            return {"total_count": 0, "items": []}
+
+        mock_client.search_issues.side_effect = search
+        or_fetcher._search_prs("2025-02-16")
+        assert mock_client.search_issues.call_count == 4
+
+    def test_capped_result_falls_back_to_axes(self, or_fetcher, mock_client):
+        """1000건 cap에 닿은 결합 쿼리는 누락 가능성이 있어 축별 쿼리로 다시 검색."""
+
+        def search(query, page=1, per_page=100):
+            if " OR " in query:
+                items = [_make_issue_search_item((page - 1) * 100 + j) for j in range(100)]
+                return {"total_count": 1500, "items": items}
+            return {"total_count": 0, "items": []}
+
+        mock_client.search_issues.side_effect = search
+        or_fetcher._search_issues_range("2025-02-14", "2025-02-16")
+        queries = [c.args[0] for c in mock_client.search_issues.call_args_list]
+        assert sum(" OR " not in q for q in queries) == 2
@@ -1,8 +1,11 @@
+import json
+
 import httpx
 import pytest
 import respx
 
 from workrecap.exceptions import FetchError
+from workrecap.infra.etag_cache import ETagCache
 from workrecap.infra.ghes_client import GHESClient, RATE_LIMIT_MAX_RETRIES
 
 BASE_URL = "https://github.example.com"
@@ -26,6 +29,10 @@ class TestGHESClientInit:
         with GHESClient(f"{BASE_URL}/", "t") as c:
             assert c._api_base == API_BASE
 
+    def test_api_base_property(self):
+        with GHESClient(BASE_URL, "t") as c:
+            assert c.api_base == API_BASE
+
 
 class TestContextManager:
     def test_closes_client(self):
@@ -214,6 +221,16 @@ class TestPREndpoints:
         result = client.get_pr("org", "repo", 42)
         assert result["number"] == 42
 
+    @respx.mock
+    def test_get_pr_without_orjson(self, client, monkeypatch):
+        """Without orjson, httpx (stdlib json) decodes the same payload."""
+        monkeypatch.setattr("workrecap.infra.ghes_client.orjson", None)
+        body = {"number": 42, "title": "한글 제목", "labels": [{"name": "bug"}]}
+        respx.get(f"{API_BASE}/repos/org/repo/pulls/42").mock(
+            return_value=httpx.Response(200, json=body)
+        )
+        assert client.get_pr("org", "repo", 42) == body
+
     @respx.mock
     def test_get_pr_files(self, client):
         respx.get(f"{API_BASE}/repos/org/repo/pulls/1/files").mock(
@@ -396,6 +413,116 @@ class TestExtraHeaders:
         assert "v3+json" in request.headers.get("Accept", "")
 
 
+class TestConditionalRequests:
+    @pytest.fixture
+    def cached_client(self, tmp_path):
+        c = GHESClient(BASE_URL, "test-token", etag_cache=ETagCache(tmp_path / "http_cache"))
+        yield c
+        c.close()
+
+    @respx.mock
+    def test_304_returns_cached_body(self, cached_client):
+        """두 번째 요청은 If-None-Match를 보내고 304면 캐시된 본문 반환."""
+        route = respx.get(f"{API_BASE}/repos/org/repo/pulls/42").mock(
+            side_effect=[
+                httpx.Response(200, json={"number": 42}, headers={"ETag": 'W/"v1"'}),
+                httpx.Response(304),
+            ]
+        )
+        assert cached_client.get_pr("org", "repo", 42) == {"number": 42}
+        assert cached_client.get_pr("org", "repo", 42) == {"number": 42}
+
+        assert "If-None-Match" not in route.calls[0].request.headers
+        assert route.calls[1].request.headers["If-None-Match"] == 'W/"v1"'
+
+    @respx.mock
+    def test_changed_resource_refreshes_cache(self, cached_client):
+        respx.get(f"{API_BASE}/repos/org/repo/issues/7").mock(
+            side_effect=[
+                httpx.Response(200, json={"state": "open"}, headers={"ETag": '"v1"'}),
+                httpx.Response(200, json={"state": "closed"}, headers={"ETag": '"v2"'}),
+                httpx.Response(304),
+            ]
+        )
+        assert cached_client.get_issue("org", "repo", 7)["state"] == "open"
+        assert cached_client.get_issue("org", "repo", 7)["state"] == "closed"
+        assert cached_client.get_issue("org", "repo", 7)["state"] == "closed"
+
+    @respx.mock
+    def test_paginated_pages_cached_separately(self, cached_client):
+        route = respx.get(f"{API_BASE}/repos/org/repo/pulls/1/files").mock(
+            side_effect=[
+                httpx.Response(200, json=[{"filename": "a.py"}], headers={"ETag": '"p1"'}),
+                httpx.Response(304),
+            ]
+        )
+        assert cached_client.get_pr_files("org", "repo", 1) == [{"filename": "a.py"}]
+        assert cached_client.get_pr_files("org", "repo", 1) == [{"filename": "a.py"}]
+        assert route.calls[1].request.headers["If-None-Match"] == '"p1"'
+
+    @respx.mock
+    def test_search_is_not_conditional(self, cached_client):
+        route = respx.get(f"{API_BASE}/search/issues").mock(
+            return_value=httpx.Response(
+                200, json={"total_count": 0, "items": []}, headers={"ETag": '"s1"'}
+            )
+        )
+        cached_client._search_interval = 0
+        cached_client.search_issues("test")
+        cached_client.search_issues("test")
+        assert "If-None-Match" not in route.calls[1].request.headers
+
+    @respx.mock
+    def test_no_cache_sends_no_conditional_header(self, client):
+        route = respx.get(f"{API_BASE}/repos/org/repo/pulls/42").mock(
+            return_value=httpx.Response(200, json={"number": 42}, headers={"ETag": '"v1"'})
+        )
+        client.get_pr("org", "repo", 42)
+        client.get_pr("org", "repo", 42)
+        assert "If-None-Match" not in route.calls[1].request.headers
+
+
+class TestGraphQL:
+    @respx.mock
+    def test_posts_query_to_graphql_endpoint(self, client):
+        route = respx.post(f"{BASE_URL}/api/graphql").mock(
+            return_value=httpx.Response(200, json={"data": {"repository": {"issue": None}}})
+        )
+        data = client.graphql("query { viewer { login } }", {"owner": "org"})
+        assert data == {"repository": {"issue": None}}
+        body = json.loads(route.calls[0].request.content)
+        assert body == {"query": "query { viewer { login } }", "variables": {"owner": "org"}}
+
+    @respx.mock
+    def test_errors_raise_fetch_error(self, client):
+        respx.post(f"{BASE_URL}/api/graphql").mock(
+            return_value=httpx.Response(
+                200, json={"data": None, "errors": [{"message": "Could not resolve"}]}
+            )
+        )
+        with pytest.raises(FetchError, match="Could not resolve"):
+            client.graphql("query { x }", {})
+
+    @respx.mock
+    def test_partial_returns_data_and_errors(self, client):
+        respx.post(f"{BASE_URL}/api/graphql").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "data": {"pr0": {"pullRequest": {"number": 1}}, "pr1": None},
+                    "errors": [{"path": ["pr1"], "message": "Could not resolve"}],
+                },
+            )
+        )
+        data, errors = client.graphql_partial("query { x }", {})
+        assert data["pr0"] == {"pullRequest": {"number": 1}}
+        assert errors[0]["path"] == ["pr1"]
+
+    def test_github_com_graphql_url(self):
+        with GHESClient("https://api.github.com", "t") as c:
+            assert c._graphql_url == "https://api.github.com/graphql"
+
+
 class TestRateLimitRetry403:
     @respx.mock
     def test_retries_on_403_rate_limit(self, client, monkeypatch):
@@ -619,7 +746,7 @@ class TestRateLimitJitter:
     def test_jitter_varies_sleep_times_across_retries(self, client, monkeypatch):
         """With real random, consecutive rate limit waits are not identical.
 
-        This is crucial for parallel workers (GHESClientPool) to avoid
+        This is crucial for parallel enrich workers to avoid
         thundering herd: all workers waking up at the exact same time.
         """
         sleep_values = []
@@ -642,6 +769,109 @@ class TestRateLimitJitter:
             assert 7.5 <= v <= 12.5, f"Wait {v} outside jitter range [7.5, 12.5]"
 
 
+class TestSharedRateLimitPause:
+    """A rate-limit wait seen by one thread holds back every request on the client."""
+
+    @respx.mock
+    def test_rate_limit_sets_shared_pause(self, client, monkeypatch):
+        monkeypatch.setattr("workrecap.infra.ghes_client.time.monotonic", lambda: 1000.0)
+        monkeypatch.setattr("workrecap.infra.ghes_client.time.sleep", lambda _: None)
+        monkeypatch.setattr("workrecap.infra.ghes_client.random.uniform", lambda a, b: 1.0)
+        respx.get(f"{API_BASE}/search/issues").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "10"}),
+                httpx.Response(200, json={"total_count": 0, "items": []}),
+            ]
+        )
+        client.search_issues("test")
+        assert client._pause_until == 1010.0
+
+    @respx.mock
+    def test_request_waits_for_pending_pause(self, monkeypatch):
+        """Another thread's pause delays the next request until it elapses."""
+        clock = [1000.0]
+        sleep_values = []
+
+        def fake_sleep(v):
+            sleep_values.append(v)
+            clock[0] += v
+
+        monkeypatch.setattr("workrecap.infra.ghes_client.time.monotonic", lambda: clock[0])
+        monkeypatch.setattr("workrecap.infra.ghes_client.time.sleep", fake_sleep)
+
+        c = GHESClient(BASE_URL, "test-token", search_interval=0)
+        respx.get(f"{API_BASE}/repos/org/repo/pulls/1").mock(
+            return_value=httpx.Response(200, json={"number": 1})
+        )
+        c._pause_all(30.0)
+        c.get_pr("org", "repo", 1)
+        c.get_pr("org", "repo", 1)
+        c.close()
+
+        # Only the first request waits; the pause has elapsed by the second
+        assert sleep_values == [30.0]
+
+    @respx.mock
+    def test_retry_waits_for_pause_set_during_backoff(self, monkeypatch):
+        """A pause set by another thread while backing off from a 5xx delays the retry."""
+        clock = [1000.0]
+        sleep_values = []
+
+        def fake_sleep(v):
+            if not sleep_values:
+                c._pause_all(30.0)  # another thread hits the rate limit meanwhile
+            sleep_values.append(v)
+            clock[0] += v
+
+        monkeypatch.setattr("workrecap.infra.ghes_client.time.monotonic", lambda: clock[0])
+        monkeypatch.setattr("workrecap.infra.ghes_client.time.sleep", fake_sleep)
+
+        c = GHESClient(BASE_URL, "test-token", search_interval=0)
+        respx.get(f"{API_BASE}/repos/org/repo/pulls/1").mock(
+            side_effect=[httpx.Response(500), httpx.Response(200, json={"number": 1})]
+        )
+        c.get_pr("org", "repo", 1)
+        c.close()
+
+        # 1s server-error backoff, then the rest of the shared pause before the retry
+        assert sleep_values == [1, 29.0]
+
+    @respx.mock
+    def test_rate_limit_retry_waits_only_for_extended_pause(self, monkeypatch):
+        """After its own rate-limit sleep a retry only waits for a pause extended by others."""
+        clock = [1000.0]
+        sleep_values = []
+
+        def fake_sleep(v):
+            if not sleep_values:
+                c._pause_all(30.0)  # another thread hits a longer limit meanwhile
+            sleep_values.append(v)
+            clock[0] += v
+
+        monkeypatch.setattr("workrecap.infra.ghes_client.time.monotonic", lambda: clock[0])
+        monkeypatch.setattr("workrecap.infra.ghes_client.time.sleep", fake_sleep)
+        monkeypatch.setattr("workrecap.infra.ghes_client.random.uniform", lambda a, b: 1.0)
+
+        c = GHESClient(BASE_URL, "test-token", search_interval=0)
+        respx.get(f"{API_BASE}/repos/org/repo/pulls/1").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "10"}),
+                httpx.Response(200, json={"number": 1}),
+            ]
+        )
+        c.get_pr("org", "repo", 1)
+        c.close()
+
+        # Own 10s wait, then the 20s the other thread's pause extends past it
+        assert sleep_values == [10.0, 20.0]
+
+    def test_pause_keeps_latest_deadline(self, client, monkeypatch):
+        monkeypatch.setattr("workrecap.infra.ghes_client.time.monotonic", lambda: 1000.0)
+        client._pause_all(60.0)
+        client._pause_all(5.0)
+        assert client._pause_until == 1060.0
+
+
 class TestSearchThrottle:
     @respx.mock
     def test_search_throttle_delays_between_calls(self, monkeypatch):
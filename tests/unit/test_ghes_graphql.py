@@ -0,0 +1,244 @@
+"""Tests for GraphQL node → REST payload converters."""
+
+from workrecap.infra.ghes_graphql import (
+    PR_BATCH_SIZE,
+    build_pr_batch_query,
+    build_pr_search_query,
+    estimate_pr_nodes,
+    issue_to_rest,
+    pack_pr_batches,
+    pr_search_item,
+    pr_to_rest,
+)
+
+API_URL = "https://ghes/api/v3/repos/org/repo/pulls/1"
+
+
+def _conn(nodes, has_next=False):
+    return {"pageInfo": {"hasNextPage": has_next}, "nodes": nodes}
+
+
+def _pr_node(**overrides):
+    node = {
+        "number": 1,
+        "title": "Add feature",
+        "body": None,
+        "url": "https://ghes/org/repo/pull/1",
+        "state": "MERGED",
+        "merged": True,
+        "createdAt": "2025-02-16T09:00:00Z",
+        "updatedAt": "2025-02-16T15:00:00Z",
+        "mergedAt": "2025-02-16T14:00:00Z",
+        "author": {"__typename": "User", "login": "testuser"},
+        "labels": {"nodes": [{"name": "feature"}]},
+        "comments": _conn(
+            [
+                {
+                    "author": {"__typename": "User", "login": "reviewer1"},
+                    "body": "Thanks",
+                    "createdAt": "2025-02-16T13:00:00Z",
+                    "url": "https://ghes/org/repo/pull/1#issuecomment-2",
+                }
+            ]
+        ),
+        "reviews": _conn(
+            [
+                {
+                    "author": {"__typename": "User", "login": "reviewer1"},
+                    "state": "APPROVED",
+                    "body": "",
+                    "submittedAt": "2025-02-16T12:00:00Z",
+                    "url": "https://ghes/org/repo/pull/1#review-1",
+                    "comments": _conn(
+                        [
+                            {
+                                "author": {"__typename": "User", "login": "reviewer1"},
+                                "body": "Nit",
+                                "createdAt": "2025-02-16T11:00:00Z",
+                                "url": "https://ghes/org/repo/pull/1#discussion_r1",
+                                "path": "src/main.py",
+                                "line": 5,
+                                "originalLine": 5,
+                                "diffHunk": "@@ -1,3 +1,5 @@",
+                            }
+                        ]
+                    ),
+                }
+            ]
+        ),
+    }
+    node.update(overrides)
+    return node
+
+
+class TestPrToRest:
+    def test_detail_matches_rest_shape(self):
+        detail, _, _ = pr_to_rest(_pr_node(), API_URL)
+        assert detail["url"] == API_URL
+        assert detail["html_url"] == "https://ghes/org/repo/pull/1"
+        assert detail["state"] == "closed"
+        assert detail["merged"] is True
+        assert detail["body"] == ""
+        assert detail["labels"] == [{"name": "feature"}]
+        assert detail["user"]["login"] == "testuser"
+
+    def test_open_state(self):
+        detail, _, _ = pr_to_rest(_pr_node(state="OPEN", merged=False), API_URL)
+        assert detail["state"] == "open"
+
+    def test_review_comments_then_issue_comments(self):
+        _, comments, reviews = pr_to_rest(_pr_node(), API_URL)
+        assert [c["body"] for c in comments] == ["Nit", "Thanks"]
+        assert comments[0]["path"] == "src/main.py"
+        assert comments[0]["diff_hunk"] == "@@ -1,3 +1,5 @@"
+        assert reviews == [
+            {
+                "user": {"login": "reviewer1"},
+                "state": "APPROVED",
+                "body": "",
+                "submitted_at": "2025-02-16T12:00:00Z",
+                "html_url": "https://ghes/org/repo/pull/1#review-1",
+            }
+        ]
+
+    def test_bot_and_ghost_logins_match_rest(self):
+        """Bot은 REST처럼 [bot] 접미사, 삭제된 계정은 ghost."""
+        node = _pr_node(author=None)
+        node["comments"]["nodes"][0]["author"] = {"__typename": "Bot", "login": "dependabot"}
+        detail, comments, _ = pr_to_rest(node, API_URL)
+        assert detail["user"]["login"] == "ghost"
+        assert comments[-1]["user"]["login"] == "dependabot[bot]"
+
+    def test_truncated_comments_returns_none(self):
+        node = _pr_node()
+        node["comments"]["pageInfo"]["hasNextPage"] = True
+        detail, comments, reviews = pr_to_rest(node, API_URL)
+        assert detail["number"] == 1
+        assert comments is None
+        assert reviews is None
+
+    def test_truncated_review_comments_returns_none(self):
+        node = _pr_node()
+        node["reviews"]["nodes"][0]["comments"]["pageInfo"]["hasNextPage"] = True
+        _, comments, reviews = pr_to_rest(node, API_URL)
+        assert comments is None
+        assert reviews is None
+
+
+class TestIssueToRest:
+    def _node(self, has_next=False):
+        return {
+            "number": 10,
+            "title": "Bug report",
+            "body": "Steps",
+            "url": "https://ghes/org/repo/issues/10",
+            "state": "CLOSED",
+            "createdAt": "2025-02-16T09:00:00Z",
+            "updatedAt": "2025-02-16T15:00:00Z",
+            "closedAt": "2025-02-16T15:00:00Z",
+            "author": {"__typename": "User", "login": "testuser"},
+            "labels": {"nodes": [{"name": "bug"}]},
+            "comments": _conn(
+                [
+                    {
+                        "author": {"__typename": "User", "login": "other"},
+                        "body": "Confirmed",
+                        "createdAt": "2025-02-16T10:00:00Z",
+                        "url": "https://ghes/org/repo/issues/10#issuecomment-1",
+                    }
+                ],
+                has_next,
+            ),
+        }
+
+    def test_converts_detail_and_comments(self):
+        api_url = "https://ghes/api/v3/repos/org/repo/issues/10"
+        detail, comments = issue_to_rest(self._node(), api_url)
+        assert detail["url"] == api_url
+        assert detail["state"] == "closed"
+        assert detail["closed_at"] == "2025-02-16T15:00:00Z"
+        assert [c["body"] for c in comments] == ["Confirmed"]
+
+    def test_truncated_comments_returns_none(self):
+        _, comments = issue_to_rest(self._node(has_next=True), "u")
+        assert comments is None
+
+
+class TestBuildPrBatchQuery:
+    def test_aliases_and_variables(self):
+        query, variables = build_pr_batch_query([("org", "repo", 1), ("org", "other", 7)])
+        assert "pr0: repository(owner: $o0, name: $r0)" in query
+        assert "pr1: repository(owner: $o1, name: $r1)" in query
+        assert query.count("fragment PRFields on PullRequest") == 1
+        assert variables == {
+            "o0": "org",
+            "r0": "repo",
+            "n0": 1,
+            "o1": "org",
+            "r1": "other",
+            "n1": 7,
+        }
+
+    def test_requests_rate_limit_cost(self):
+        query, _ = build_pr_batch_query([("org", "repo", 1)])
+        assert "rateLimit { cost remaining }" in query
+
+
+class TestPackPrBatches:
+    @staticmethod
+    def _items(*comment_counts):
+        return [(f"url{i}", {"comments": n}) for i, n in enumerate(comment_counts)]
+
+    def test_estimate_scales_with_comments(self):
+        assert estimate_pr_nodes({}) == 50
+        assert estimate_pr_nodes({"comments": 10}) == 80
+
+    def test_packs_under_budget(self):
+        # 50 + 3*50 = 200 nodes each → 2 per batch under 450
+        batches = pack_pr_batches(self._items(50, 50, 50, 50, 50), budget=450)
+        assert [len(b) for b in batches] == [2, 2, 1]
+
+    def test_oversized_pr_gets_own_batch(self):
+        batches = pack_pr_batches(self._items(0, 1000, 0), budget=500)
+        assert [[key for key, _ in b] for b in batches] == [["url0"], ["url1"], ["url2"]]
+
+    def test_caps_batch_size(self):
+        batches = pack_pr_batches(self._items(*([0] * 60)), budget=10**6)
+        assert [len(b) for b in batches] == [PR_BATCH_SIZE, PR_BATCH_SIZE, 10]
+
+    def test_empty(self):
+        assert pack_pr_batches([]) == []
+
+
+class TestPrSearch:
+    def test_query_aliases_and_cursors(self):
+        query, variables = build_pr_search_query(
+            [("author", "type:pr author:u", None), ("commenter", "type:pr commenter:u", "abc")]
+        )
+        assert "author: search(query: $q_author, type: ISSUE" in query
+        assert "commenter: search(" in query
+        assert "rateLimit" in query
+        assert variables == {
+            "q_author": "type:pr author:u",
+            "c_author": None,
+            "q_commenter": "type:pr commenter:u",
+            "c_commenter": "abc",
+        }
+
+    def test_item_matches_rest_search_shape(self):
+        node = {
+            "number": 7,
+            "title": "Fix",
+            "url": "https://ghes/org/repo/pull/7",
+            "createdAt": "2025-02-16T09:00:00Z",
+            "updatedAt": "2025-02-16T15:00:00Z",
+            "repository": {"nameWithOwner": "org/repo"},
+            "comments": {"totalCount": 3},
+        }
+        item = pr_search_item(node, "https://ghes/api/v3")
+        assert item["url"] == "https://ghes/api/v3/repos/org/repo/issues/7"
+        assert item["pull_request"]["url"] == "https://ghes/api/v3/repos/org/repo/pulls/7"
+        assert item["repository_url"] == "https://ghes/api/v3/repos/org/repo"
+        assert item["html_url"] == "https://ghes/org/repo/pull/7"
+        assert item["updated_at"] == "2025-02-16T15:00:00Z"
+        assert item["comments"] == 3
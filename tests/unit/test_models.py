@@ -1,3 +1,5 @@
+import pytest
+
 from workrecap.models import (
     Activity,
     ActivityKind,
@@ -20,11 +22,13 @@ from workrecap.models import (
     daily_stats_from_dict,
     github_stats_from_dict,
     issue_raw_from_dict,
+    iter_json_items,
     jira_stats_from_dict,
     load_json,
     load_jsonl,
     pr_raw_from_dict,
     save_json,
+    save_json_stream,
     save_jsonl,
 )
 
@@ -183,6 +187,12 @@ class TestPRRaw:
         assert restored.reviews[0].state == "APPROVED"
         assert restored.labels == ["feature", "auth"]
 
+    def test_raw_models_use_slots(self):
+        """대량 생성되는 raw 모델은 인스턴스 __dict__가 없다."""
+        pr = _make_sample_pr_raw()
+        for obj in (pr, pr.files[0], pr.comments[0], pr.reviews[0]):
+            assert not hasattr(obj, "__dict__")
+
 
 class TestActivityKind:
     def test_enum_values(self):
@@ -336,6 +346,13 @@ class TestActivity:
         assert act.file_patches == {}
         assert act.comment_contexts == []
 
+    def test_activity_uses_slots_and_stays_mutable(self):
+        """Activity도 __dict__ 없이 생성되고, enrichment 필드는 갱신 가능."""
+        act = _make_sample_activity()
+        assert not hasattr(act, "__dict__")
+        act.change_summary = "요약"
+        assert act.change_summary == "요약"
+
 
 class TestDailyStats:
     def test_creation_defaults(self):
@@ -437,6 +454,94 @@ class TestSerializationUtils:
         assert len(loaded) == 1
         assert loaded[0]["title"] == "Add user authentication"
 
+    def test_save_json_plain_dict(self, tmp_path):
+        """dataclass가 아닌 dict도 그대로 저장."""
+        path = tmp_path / "plain.json"
+        save_json({"last_fetch_date": "2025-02-16"}, path)
+        assert load_json(path) == {"last_fetch_date": "2025-02-16"}
+
+    def test_stdlib_fallback_matches_fast_path(self, tmp_path, monkeypatch):
+        """orjson이 없어도 동일한 내용/포맷으로 저장·로드."""
+        import workrecap.models as models
+
+        prs = [_make_sample_pr_raw()]
+        fast_path = tmp_path / "fast.json"
+        save_json(prs, fast_path)
+
+        monkeypatch.setattr(models, "orjson", None)
+        slow_path = tmp_path / "slow.json"
+        save_json(prs, slow_path)
+
+        assert load_json(slow_path) == load_json(fast_path)
+        assert slow_path.read_text(encoding="utf-8") == fast_path.read_text(encoding="utf-8")
+
+    def test_jsonl_stdlib_fallback_matches_fast_path(self, tmp_path, monkeypatch):
+        """orjson 유무와 관계없이 JSONL 라인 내용이 같다."""
+        import workrecap.models as models
+
+        activities = [_make_sample_activity(), _make_sample_activity()]
+        fast_path = tmp_path / "fast.jsonl"
+        save_jsonl(activities, fast_path)
+
+        monkeypatch.setattr(models, "orjson", None)
+        slow_path = tmp_path / "slow.jsonl"
+        save_jsonl(activities, slow_path)
+
+        assert load_jsonl(slow_path) == load_jsonl(fast_path)
+        assert len(fast_path.read_bytes().splitlines()) == 2
+
+    def test_iter_json_items_yields_array_elements(self, tmp_path):
+        """JSON 배열 원소를 순서대로 하나씩 yield."""
+        path = tmp_path / "prs.json"
+        save_json([_make_sample_pr_raw(), _make_sample_pr_raw()], path)
+        items = iter_json_items(path)
+        first = next(items)
+        assert first["title"] == "Add user authentication"
+        assert len([first, *items]) == 2
+
+    def test_iter_json_items_empty_array(self, tmp_path):
+        path = tmp_path / "empty.json"
+        save_json([], path)
+        assert list(iter_json_items(path)) == []
+
+    def test_save_json_stream_matches_save_json(self, tmp_path):
+        """원소 단위로 기록해도 save_json(list)와 같은 파일."""
+        prs = [_make_sample_pr_raw(), _make_sample_pr_raw()]
+        expected = tmp_path / "expected.json"
+        save_json(prs, expected)
+
+        path = tmp_path / "raw" / "prs.json"
+        with save_json_stream(path) as write:
+            for pr in prs:
+                write(pr)
+
+        assert path.read_bytes() == expected.read_bytes()
+        assert not (tmp_path / "raw" / "prs.json.tmp").exists()
+
+    def test_save_json_stream_empty(self, tmp_path):
+        path = tmp_path / "empty.json"
+        with save_json_stream(path):
+            pass
+        assert path.read_text(encoding="utf-8") == "[]"
+
+    def test_save_json_stream_keeps_existing_on_error(self, tmp_path):
+        """중간에 실패하면 기존 파일 유지, 임시 파일은 정리."""
+        path = tmp_path / "prs.json"
+        save_json([{"old": True}], path)
+
+        with pytest.raises(RuntimeError):
+            with save_json_stream(path) as write:
+                write(_make_sample_pr_raw())
+                raise RuntimeError("boom")
+
+        assert load_json(path) == [{"old": True}]
+        assert not (tmp_path / "prs.json.tmp").exists()
+
+    def test_enum_serialized_as_value(self, tmp_path):
+        path = tmp_path / "job.json"
+        save_json(Job(job_id="j1", status=JobStatus.RUNNING, created_at="t", updated_at="t"), path)
+        assert load_json(path)["status"] == "running"
+
 
 # ── CommitRaw 테스트 ──
 
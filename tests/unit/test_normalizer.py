@@ -1,9 +1,13 @@
 import json
 import logging
-from unittest.mock import MagicMock
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from workrecap.config import AppConfig
 from workrecap.exceptions import NormalizeError
 from workrecap.models import (
     Activity,
@@ -103,17 +107,6 @@ def _save_raw(test_config, prs: list[PRRaw], date: str = DATE):
 # ── Tests ──
 
 
-class TestMatchesDate:
-    def test_matching(self):
-        assert NormalizerService._matches_date("2025-02-16T09:00:00Z", "2025-02-16") is True
-
-    def test_not_matching(self):
-        assert NormalizerService._matches_date("2025-02-15T23:59:59Z", "2025-02-16") is False
-
-    def test_exact_boundary(self):
-        assert NormalizerService._matches_date("2025-02-16T00:00:00Z", "2025-02-16") is True
-
-
 class TestAutoSummary:
     def test_with_body(self):
         pr = _make_pr(body="Has description")
@@ -279,6 +272,28 @@ class TestConvertActivities:
         assert len(result) == 1
         assert result[0].kind == ActivityKind.PR_AUTHORED
 
+    def test_mixed_case_config_username(self, test_config):
+        """설정 username이 대소문자 섞여도 리뷰/코멘트 매칭."""
+        config = AppConfig(
+            ghes_url=test_config.ghes_url,
+            ghes_token=test_config.ghes_token,
+            username="TestUser",
+            data_dir=test_config.data_dir,
+        )
+        normalizer = NormalizerService(config)
+        prs = [
+            _make_pr(
+                author="other",
+                reviews=[_review(author="testuser")],
+                comments=[_comment(author="TESTUSER", path="src/a.py")],
+            )
+        ]
+        result = normalizer._convert_activities(prs, DATE)
+        kinds = {a.kind for a in result}
+        assert kinds == {ActivityKind.PR_REVIEWED, ActivityKind.PR_COMMENTED}
+        reviewed = next(a for a in result if a.kind == ActivityKind.PR_REVIEWED)
+        assert [c["path"] for c in reviewed.comment_contexts] == ["src/a.py"]
+
     def test_author_commenting_own_pr(self, normalizer):
         """author가 자기 PR에 댓글도 PR_COMMENTED 생성."""
         prs = [
@@ -292,6 +307,34 @@ class TestConvertActivities:
         assert ActivityKind.PR_AUTHORED in kinds
         assert ActivityKind.PR_COMMENTED in kinds
 
+    def test_file_stats_computed_once_per_pr(self, normalizer, monkeypatch):
+        """같은 PR의 여러 activity는 pr.files 집계를 한 번만 계산해 공유."""
+        calls = []
+        original = NormalizerService._file_stats
+
+        def spy(files):
+            calls.append([f.filename for f in files])
+            return original(files)
+
+        monkeypatch.setattr(normalizer, "_file_stats", spy)
+        prs = [
+            _make_pr(
+                author="testuser",
+                files=[
+                    FileChange("a.py", 5, 1, "modified", patch="@@ a"),
+                    FileChange("b.py", 2, 0, "added"),
+                ],
+                comments=[_comment(author="testuser")],
+            )
+        ]
+        result = normalizer._convert_activities(prs, DATE)
+        assert {a.kind for a in result} == {ActivityKind.PR_AUTHORED, ActivityKind.PR_COMMENTED}
+        assert calls == [["a.py", "b.py"]]
+        for act in result:
+            assert (act.additions, act.deletions) == (7, 1)
+            assert act.files == ["a.py", "b.py"]
+            assert act.file_patches == {"a.py": "@@ a"}
+
     def test_commented_pr_comment_bodies(self, normalizer):
         """PR_COMMENTED에 comment_bodies가 user의 코멘트 본문을 포함."""
         prs = [
@@ -404,6 +447,44 @@ class TestConvertActivities:
         assert len(commented[0].comment_contexts) == 1
         assert commented[0].comment_contexts[0]["path"] == "src/main.py"
 
+    def test_reviewed_contexts_span_dates_commented_only_target(self, normalizer):
+        """리뷰 inline은 날짜 무관, PR_COMMENTED context는 당일 코멘트만."""
+        prs = [
+            _make_pr(
+                author="other",
+                reviews=[_review(author="testuser")],
+                comments=[
+                    _comment(
+                        author="testuser", path="src/old.py", created_at="2025-02-15T10:00:00Z"
+                    ),
+                    _comment(author="testuser", path="src/new.py"),
+                    _comment(author="someone", path="src/other.py"),
+                ],
+            )
+        ]
+        result = normalizer._convert_activities(prs, DATE)
+        by_kind = {a.kind: a for a in result}
+        reviewed = by_kind[ActivityKind.PR_REVIEWED]
+        commented = by_kind[ActivityKind.PR_COMMENTED]
+        assert [c["path"] for c in reviewed.comment_contexts] == ["src/old.py", "src/new.py"]
+        assert [c["path"] for c in commented.comment_contexts] == ["src/new.py"]
+        assert len(commented.evidence_urls) == 1
+
+    def test_commented_ts_is_earliest_same_day_comment(self, normalizer):
+        """PR_COMMENTED ts는 순서와 무관하게 당일 가장 이른 코멘트 시각."""
+        prs = [
+            _make_pr(
+                author="other",
+                comments=[
+                    _comment(author="testuser", created_at="2025-02-16T15:00:00Z"),
+                    _comment(author="testuser", created_at="2025-02-16T10:00:00Z"),
+                    _comment(author="testuser", created_at="2025-02-17T01:00:00Z"),
+                ],
+            )
+        ]
+        result = normalizer._convert_activities(prs, DATE)
+        assert [a.ts for a in result] == ["2025-02-16T10:00:00Z"]
+
     def test_comment_contexts_empty_when_no_inline(self, normalizer):
         """일반 코멘트만 있으면 comment_contexts 빈 리스트."""
         prs = [
@@ -531,6 +612,25 @@ class TestComputeStats:
         stats = NormalizerService._compute_stats(activities, DATE)
         assert stats.github.repos_touched == ["org/a", "org/b"]
 
+    def test_non_github_kind_counts_repo_only(self):
+        """GitHub 외 kind도 repo에는 포함, 카운트/합산에는 미포함."""
+        activities = [
+            Activity(
+                ts="t",
+                kind=ActivityKind.CONFLUENCE_PAGE_EDITED,
+                repo="space/DOC",
+                external_id=1,
+                title="t",
+                url="u",
+                summary="s",
+                additions=7,
+            ),
+        ]
+        stats = NormalizerService._compute_stats(activities, DATE)
+        assert stats.github.repos_touched == ["space/DOC"]
+        assert stats.github.authored_count == 0
+        assert stats.github.total_additions == 0
+
     def test_authored_prs_list(self):
         activities = [
             Activity(
@@ -783,6 +883,22 @@ class TestConvertIssueActivities:
         assert ActivityKind.ISSUE_AUTHORED in kinds
         assert ActivityKind.ISSUE_COMMENTED in kinds
 
+    def test_commented_ts_is_earliest_same_day_comment(self, normalizer):
+        """ISSUE_COMMENTED ts는 순서와 무관하게 당일 가장 이른 코멘트 시각."""
+        issues = [
+            _make_issue(
+                author="other",
+                comments=[
+                    _comment(author="testuser", created_at="2025-02-16T15:00:00Z"),
+                    _comment(author="testuser", created_at="2025-02-15T08:00:00Z"),
+                    _comment(author="testuser", created_at="2025-02-16T10:00:00Z"),
+                ],
+            )
+        ]
+        result = normalizer._convert_issue_activities(issues, DATE)
+        assert result[0].ts == "2025-02-16T10:00:00Z"
+        assert len(result[0].comment_bodies) == 2
+
     def test_date_filtering_authored(self, normalizer):
         issues = [_make_issue(author="testuser", created_at="2025-02-15T09:00:00Z")]
         result = normalizer._convert_issue_activities(issues, DATE)
@@ -1055,6 +1171,37 @@ class TestIsDateNormalized:
         """디렉토리 없음 → False."""
         assert normalizer._is_date_normalized("2099-01-01") is False
 
+    def test_scan_normalized_dates(self, normalizer, test_config):
+        """월 디렉토리 scan으로 두 파일이 모두 있는 요청 날짜만 수집."""
+        for d, names in [
+            ("2025-02-14", ["activities.jsonl", "stats.json"]),
+            ("2025-02-15", ["stats.json"]),
+            ("2025-02-20", ["activities.jsonl", "stats.json"]),  # 범위 밖
+        ]:
+            norm_dir = test_config.date_normalized_dir(d)
+            norm_dir.mkdir(parents=True, exist_ok=True)
+            for name in names:
+                (norm_dir / name).write_text("")
+
+        dates = ["2025-02-14", "2025-02-15", "2025-02-16", "2025-03-01"]
+        assert normalizer._scan_normalized_dates(dates) == {"2025-02-14"}
+
+    def test_range_skip_uses_scan_index(self, normalizer, test_config):
+        """normalize_range는 시작 시 한 번 scan한 날짜 집합으로 skip 판정한다."""
+        norm_dir = test_config.date_normalized_dir("2025-02-14")
+        norm_dir.mkdir(parents=True, exist_ok=True)
+        (norm_dir / "activities.jsonl").write_text("")
+        (norm_dir / "stats.json").write_text("{}")
+        _save_raw(test_config, [_make_pr(author="testuser")], date="2025-02-15")
+
+        with patch.object(
+            type(normalizer), "_scan_normalized_dates", autospec=True, return_value={"2025-02-14"}
+        ) as scan:
+            results = normalizer.normalize_range("2025-02-14", "2025-02-15")
+
+        assert [r["status"] for r in results] == ["skipped", "success"]
+        scan.assert_called_once()
+
 
 # ── Normalize Checkpoint 테스트 ──
 
@@ -1333,6 +1480,111 @@ class TestLLMEnrichment:
         assert activities[0].change_summary == ""
         assert activities[0].intent == ""
 
+    def test_enrich_template_read_once(self, test_config):
+        """enrich.md는 첫 호출에만 읽고 이후 캐시된 Template 재사용."""
+        template_path = test_config.prompts_dir / "enrich.md"
+        template_path.write_text("system rules\n<!-- SPLIT -->\nclassify\n", encoding="utf-8")
+        normalizer = NormalizerService(test_config)
+
+        first = normalizer._prepare_enrich_prompt(self._make_activities())
+        template_path.unlink()
+        second = normalizer._prepare_enrich_prompt(self._make_activities())
+
+        assert first == ("system rules", "classify")
+        assert second == first
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            '[{"index": 0, "change_summary": "요약", "intent": "feature"}]',
+            '```json\n[{"index": 0, "change_summary": "요약", "intent": "feature"}]\n```',
+            '```\n[{"index": 0, "change_summary": "요약", "intent": "feature"}]\n```\n',
+        ],
+    )
+    def test_apply_enrichment_accepts_code_fence(self, response):
+        """LLM 응답이 code fence로 감싸져 있어도 파싱."""
+        activities = self._make_activities()
+        NormalizerService._apply_enrichment(activities, response)
+        assert activities[0].change_summary == "요약"
+        assert activities[0].intent == "feature"
+
+    def test_apply_enrichment_invalid_json_keeps_fields(self):
+        """JSON이 아니면 경고만 남기고 필드 유지."""
+        activities = self._make_activities()
+        NormalizerService._apply_enrichment(activities, "```json\nnot json\n```")
+        assert activities[0].change_summary == ""
+
+    def test_enrichment_split_into_concurrent_chunks(self, test_config):
+        """enrich_chunk_size 초과 시 chunk별 요청, chunk 내 index로 결과 적용."""
+        (test_config.prompts_dir / "enrich.md").write_text("classify", encoding="utf-8")
+        config = AppConfig(
+            ghes_url=test_config.ghes_url,
+            ghes_token=test_config.ghes_token,
+            username=test_config.username,
+            data_dir=test_config.data_dir,
+            prompts_dir=test_config.prompts_dir,
+            enrich_chunk_size=2,
+        )
+        calls = 0
+        lock = threading.Lock()
+
+        def chat(*args, **kwargs):
+            nonlocal calls
+            with lock:
+                calls += 1
+                if calls == 2:
+                    raise RuntimeError("rate limited")
+            return json.dumps([{"index": 0, "intent": "x"}, {"index": 1, "intent": "y"}])
+
+        mock_llm = MagicMock()
+        mock_llm.chat.side_effect = chat
+        activities = [self._make_activities()[0] for _ in range(6)]
+
+        NormalizerService(config, llm=mock_llm)._enrich_activities(activities)
+
+        assert mock_llm.chat.call_count == 3
+        pairs = [(activities[i].intent, activities[i + 1].intent) for i in range(0, 6, 2)]
+        # chunk마다 index 0/1이 자기 위치에 적용되고, 실패한 chunk 하나만 빈 필드
+        assert sorted(pairs) == [("", ""), ("x", "y"), ("x", "y")]
+
+    def test_enrichment_concurrency_shared_across_dates(self, test_config):
+        """여러 날짜의 chunk 요청이 동시에 돌아도 LLM 동시 요청은 max_workers개까지."""
+        (test_config.prompts_dir / "enrich.md").write_text("classify", encoding="utf-8")
+        config = AppConfig(
+            ghes_url=test_config.ghes_url,
+            ghes_token=test_config.ghes_token,
+            username=test_config.username,
+            data_dir=test_config.data_dir,
+            prompts_dir=test_config.prompts_dir,
+            max_workers=2,
+            enrich_chunk_size=1,
+        )
+        active = peak = 0
+        lock = threading.Lock()
+
+        def chat(*args, **kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return json.dumps([{"index": 0, "intent": "x"}])
+
+        mock_llm = MagicMock()
+        mock_llm.chat.side_effect = chat
+        normalizer = NormalizerService(config, llm=mock_llm)
+        per_date = [[self._make_activities()[0] for _ in range(3)] for _ in range(3)]
+
+        # normalize_range 병렬 실행처럼 날짜별 _enrich_activities를 동시에 호출
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(normalizer._enrich_activities, per_date))
+
+        assert mock_llm.chat.call_count == 9
+        assert peak == 2
+        assert all(a.intent == "x" for acts in per_date for a in acts)
+
     def test_no_llm_leaves_fields_empty(self, test_config):
         """LLM 미주입 시 빈 필드."""
         normalizer = NormalizerService(test_config)
@@ -1574,3 +1826,61 @@ class TestParallelNormalizeRange:
         results = normalizer.normalize_range("2025-02-14", "2025-02-16", max_workers=3)
         result_dates = [r["date"] for r in results]
         assert result_dates == dates
+
+    def test_process_pool_records_state_in_parent(self, test_config):
+        """LLM 없으면 프로세스 분산, daily_state 기록은 부모에서 날짜별로 수행."""
+        dates = ["2025-02-14", "2025-02-15", "2025-02-16"]
+        self._prepare_raw(test_config, dates)
+        mock_ds = MagicMock()
+        mock_ds.is_normalize_stale.return_value = True
+        normalizer = NormalizerService(test_config, daily_state=mock_ds)
+        results = normalizer.normalize_range("2025-02-14", "2025-02-16", max_workers=3)
+        assert [r["status"] for r in results] == ["success"] * 3
+        recorded = sorted(c.args[1] for c in mock_ds.set_timestamp.call_args_list)
+        assert recorded == dates
+        for d in dates:
+            assert (test_config.date_normalized_dir(d) / "activities.jsonl").exists()
+
+    def test_process_pool_reused_across_calls(self, test_config):
+        """월별 normalize_range 호출들이 spawn ProcessPool 하나를 재사용, close()로 종료."""
+        dates = ["2025-02-14", "2025-02-15", "2025-02-16"]
+        self._prepare_raw(test_config, dates)
+        normalizer = NormalizerService(test_config)
+        with patch(
+            "workrecap.services.normalizer.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+        ) as pool_cls:
+            first = normalizer.normalize_range("2025-02-14", "2025-02-15", max_workers=2)
+            second = normalizer.normalize_range("2025-02-16", "2025-02-16", max_workers=2)
+            normalizer.close()
+
+        assert [r["status"] for r in first + second] == ["success"] * 3
+        pool_cls.assert_called_once()
+        assert normalizer._process_pool is None
+
+    def test_process_pool_progress_on_completion(self, test_config):
+        """진행 상황은 제출이 아니라 날짜 완료 시점에 보고."""
+        dates = ["2025-02-14", "2025-02-15"]
+        self._prepare_raw(test_config, dates)
+        normalizer = NormalizerService(test_config)
+        messages: list[str] = []
+        normalizer.normalize_range(
+            "2025-02-14", "2025-02-15", progress=messages.append, max_workers=2
+        )
+        normalizer.close()
+
+        assert messages[0] == "Normalizing 2025-02-14..2025-02-15 (2 dates)"
+        # 완료 순서는 비결정적 → 날짜 집합과 완료 카운터를 따로 확인
+        done = [m.split() for m in messages[1:]]
+        assert sorted(d for _, d, _ in done) == dates
+        assert [n for _, _, n in done] == ["(1/2)", "(2/2)"]
+        assert all(word == "Normalized" for word, _, _ in done)
+
+    def test_threads_used_when_llm_configured(self, test_config):
+        """LLM enrichment가 있으면 프로세스 대신 스레드 풀 사용."""
+        dates = ["2025-02-14", "2025-02-15"]
+        self._prepare_raw(test_config, dates)
+        normalizer = NormalizerService(test_config, llm=MagicMock())
+        normalizer._normalize_range_processes = MagicMock()
+        results = normalizer.normalize_range("2025-02-14", "2025-02-15", max_workers=2)
+        assert [r["status"] for r in results] == ["success"] * 2
+        normalizer._normalize_range_processes.assert_not_called()
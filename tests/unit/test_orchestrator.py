@@ -284,6 +284,114 @@ class TestRunRangeOptimized:
 
         assert call_order == ["fetch_range", "normalize_range", "daily_range"]
 
+    def test_multi_month_pipelines_chunks(self, orchestrator_with_config, mocks):
+        """월 경계 range → chunk별 fetch, 이전 chunk normalize가 다음 fetch와 겹침."""
+        import threading
+
+        first_normalized = threading.Event()
+        overlapped = []
+
+        def fetch_range(s, u, types=None, force=False, progress=None):
+            if s == "2025-02-01":
+                # 1월 chunk의 normalize가 2월 fetch 도중 시작돼야 함
+                overlapped.append(first_normalized.wait(timeout=5))
+            return [{"date": s, "status": "success"}]
+
+        def normalize_range(s, u, force=False, progress=None, max_workers=1, batch=False):
+            first_normalized.set()
+            return [{"date": s, "status": "success"}]
+
+        mocks["fetcher"].fetch_range.side_effect = fetch_range
+        mocks["normalizer"].normalize_range.side_effect = normalize_range
+        mocks["summarizer"].daily_range.side_effect = lambda s, u, **kw: [
+            {"date": s, "status": "success"}
+        ]
+
+        results = orchestrator_with_config.run_range("2025-01-30", "2025-02-02")
+
+        assert [c.args[:2] for c in mocks["fetcher"].fetch_range.call_args_list] == [
+            ("2025-01-30", "2025-01-31"),
+            ("2025-02-01", "2025-02-02"),
+        ]
+        assert overlapped == [True]
+        assert [r["date"] for r in results] == ["2025-01-30", "2025-02-01"]
+        assert all(r["status"] == "success" for r in results)
+
+    def test_downstream_failure_stops_fetching(self, orchestrator_with_config, mocks):
+        """1월 chunk normalize 실패 → 3월 chunk는 fetch하지 않고 즉시 전파."""
+        import threading
+        import time
+
+        second_fetching = threading.Event()
+        first_failed = threading.Event()
+
+        def fetch_range(s, u, types=None, force=False, progress=None):
+            if s == "2025-02-01":
+                second_fetching.set()
+                first_failed.wait(timeout=5)
+                time.sleep(0.1)  # future가 예외로 완료될 때까지
+            return [{"date": s, "status": "success"}]
+
+        def normalize_range(s, u, force=False, progress=None, max_workers=1, batch=False):
+            # 2월 fetch 도중에 실패
+            second_fetching.wait(timeout=5)
+            first_failed.set()
+            raise NormalizeError("boom")
+
+        mocks["fetcher"].fetch_range.side_effect = fetch_range
+        mocks["normalizer"].normalize_range.side_effect = normalize_range
+
+        with pytest.raises(NormalizeError, match="boom"):
+            orchestrator_with_config.run_range("2025-01-30", "2025-03-02")
+
+        assert [c.args[0] for c in mocks["fetcher"].fetch_range.call_args_list] == [
+            "2025-01-30",
+            "2025-02-01",
+        ]
+        # 2월 chunk는 제출됐지만 취소되어 normalize가 한 번만 실행됨
+        assert mocks["normalizer"].normalize_range.call_count == 1
+
+    def test_closes_normalizer_after_range(self, orchestrator_with_config, mocks):
+        """월별 normalize_range가 재사용한 ProcessPool → range 종료 후 close."""
+        mocks["normalizer"].normalize_range.side_effect = NormalizeError("boom")
+
+        with pytest.raises(NormalizeError):
+            orchestrator_with_config.run_range("2025-01-30", "2025-02-02")
+
+        mocks["normalizer"].close.assert_called_once()
+
+    def test_merge_sorts_union_of_phase_dates(self, orchestrator_with_config, mocks):
+        """phase별 결과 순서/누락과 무관하게 날짜 합집합을 정렬해 병합."""
+        mocks["fetcher"].fetch_range.return_value = [
+            {"date": "2025-02-15", "status": "skipped"},
+            {"date": "2025-02-14", "status": "skipped"},
+        ]
+        mocks["normalizer"].normalize_range.return_value = [
+            {"date": "2025-02-14", "status": "skipped"},
+        ]
+        mocks["summarizer"].daily_range.return_value = [
+            {"date": "2025-02-16", "status": "failed", "error": "boom"},
+            {"date": "2025-02-14", "status": "skipped"},
+        ]
+
+        results = orchestrator_with_config.run_range("2025-02-14", "2025-02-16")
+
+        assert [(r["date"], r["status"]) for r in results] == [
+            ("2025-02-14", "skipped"),
+            ("2025-02-15", "success"),
+            ("2025-02-16", "failed"),
+        ]
+        assert "'summarize'" in results[2]["error"]
+
+    def test_batch_mode_does_not_split_range(self, orchestrator_with_config, mocks):
+        """batch=True → 기간 전체를 한 번에 처리 (batch 호출 1회 유지)."""
+        orchestrator_with_config.run_range("2025-01-30", "2025-02-02", batch=True)
+
+        mocks["fetcher"].fetch_range.assert_called_once_with(
+            "2025-01-30", "2025-02-02", types=None, force=False, progress=None
+        )
+        mocks["normalizer"].normalize_range.assert_called_once()
+
     def test_all_success_includes_path(self, orchestrator_with_config, mocks, mock_config):
         """All phases succeed → result includes path from config."""
         mocks["fetcher"].fetch_range.return_value = [
@@ -2,7 +2,7 @@ import logging
 import shutil
 from datetime import date
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -123,6 +123,23 @@ class TestRenderPrompt:
         with pytest.raises(SummarizeError, match="Prompt template not found"):
             summarizer._render_prompt("nonexistent.md")
 
+    def test_template_cached_until_mtime_changes(self, summarizer, test_config):
+        """같은 mtime이면 캐시된 Template 재사용, 파일이 수정되면 다시 로드."""
+        import os
+
+        path = test_config.prompts_dir / "cached.md"
+        path.write_text("system\n<!-- SPLIT -->\nfirst", encoding="utf-8")
+        assert summarizer._render_split_prompt("cached.md") == ("system", "first")
+        cached = summarizer._template_cache["cached.md"]
+
+        assert summarizer._render_split_prompt("cached.md") == ("system", "first")
+        assert summarizer._template_cache["cached.md"] is cached
+
+        path.write_text("plain second", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, cached[0] + 1_000_000_000))
+        assert summarizer._render_split_prompt("cached.md") == ("plain second", "")
+
 
 class TestFormatActivities:
     def test_formats_activities(self):
@@ -147,6 +164,10 @@ class TestFormatActivities:
         result = SummarizerService._format_activities([])
         assert result == "(활동 없음)"
 
+    def test_truncate_boundary(self):
+        assert SummarizerService._truncate("a" * 500, 500) == "a" * 500
+        assert SummarizerService._truncate("a" * 501, 500) == "a" * 500 + "..."
+
     def test_truncates_files(self):
         activities = [
             {
@@ -660,6 +681,32 @@ class TestCollectDailyForWeek:
         contents = summarizer._collect_daily_for_week(2025, 7)
         assert len(contents) == 3
 
+    def test_week_spanning_year_boundary(self, summarizer, test_config):
+        # 2025-W01: Mon 2024-12-30 ~ Sun 2025-01-05 — 부모 디렉토리가 두 개
+        _save_daily_summary(test_config, "2024-12-31", "Dec 31")
+        _save_daily_summary(test_config, "2025-01-02", "Jan 2")
+
+        contents = summarizer._collect_daily_for_week(2025, 1)
+        assert contents == ["Dec 31", "Jan 2"]
+
+    def test_missing_directory(self, summarizer):
+        assert summarizer._collect_daily_for_week(2025, 7) == []
+
+    def test_contents_cached_until_mtime_changes(self, summarizer, test_config):
+        import os
+
+        _save_daily_summary(test_config, "2025-02-10", "first")
+        path = test_config.daily_summary_path("2025-02-10")
+        assert summarizer._collect_daily_for_week(2025, 7) == ["first"]
+
+        with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+            assert summarizer._collect_daily_for_week(2025, 7) == ["first"]
+
+        mtime_ns = path.stat().st_mtime_ns
+        path.write_text("second", encoding="utf-8")
+        os.utime(path, ns=(mtime_ns, mtime_ns + 1_000_000_000))
+        assert summarizer._collect_daily_for_week(2025, 7) == ["second"]
+
 
 class TestMonthly:
     def test_generates_monthly_summary(self, summarizer, mock_llm, test_config):
@@ -817,6 +864,33 @@ class TestIsDateSummarized:
         """daily summary 파일 없음 → False."""
         assert summarizer._is_date_summarized("2099-01-01") is False
 
+    def test_scan_summarized_dates(self, summarizer, test_config):
+        """연도 디렉토리 scan 결과 중 요청한 날짜만 반환."""
+        _save_daily_summary(test_config, "2024-12-31")
+        _save_daily_summary(test_config, "2025-01-02")
+        _save_daily_summary(test_config, "2025-03-01")
+        dates = ["2024-12-31", "2025-01-01", "2025-01-02"]
+        assert summarizer._scan_summarized_dates(dates) == {"2024-12-31", "2025-01-02"}
+
+    def test_daily_range_skips_without_stat(self, summarizer, test_config):
+        """daily_range의 skip 판정은 scan 결과 사용 — 날짜별 exists() 호출 없음."""
+        _save_normalized(test_config, "2025-02-15")
+        _save_daily_summary(test_config, "2025-02-15")
+        _save_normalized(test_config, DATE)
+
+        config_cls = type(test_config)
+        with patch.object(
+            config_cls,
+            "daily_summary_path",
+            autospec=True,
+            side_effect=config_cls.daily_summary_path,
+        ) as spy:
+            results = summarizer.daily_range("2025-02-15", DATE)
+
+        assert [r["status"] for r in results] == ["skipped", "success"]
+        # daily()가 출력 경로를 만들 때 한 번만 호출
+        spy.assert_called_once_with(test_config, DATE, repo=None)
+
 
 # ── Summarize Checkpoint 테스트 ──
 
@@ -978,6 +1052,53 @@ class TestSummarizerDailyStateIntegration:
 
         mock_ds.set_timestamp.assert_called_once_with("summarize", DATE)
 
+    def test_daily_range_flushes_once(self, test_config, mock_llm, prompts_dir):
+        """daily_range는 checkpoint와 daily_state를 범위 끝에서 한 번씩만 기록."""
+        mock_ds = MagicMock()
+        mock_ds.is_summarize_stale.return_value = True
+        summarizer = SummarizerService(test_config, mock_llm, daily_state=mock_ds)
+        dates = ["2025-02-14", "2025-02-15", "2025-02-16"]
+        for d in dates:
+            _save_normalized(test_config, d)
+
+        with patch("workrecap.services.checkpoint.update_checkpoint") as mock_update:
+            summarizer.daily_range(dates[0], dates[-1])
+
+        mock_update.assert_called_once_with(
+            test_config.checkpoints_path, "last_summarize_date", "2025-02-16"
+        )
+        mock_ds.set_timestamp.assert_not_called()
+        mock_ds.set_timestamps.assert_called_once_with("summarize", dates)
+
+        # 범위가 끝나면 daily()는 다시 즉시 기록
+        summarizer.daily(DATE)
+        mock_ds.set_timestamp.assert_called_once_with("summarize", DATE)
+
+    def test_overlapping_daily_range_keeps_pending(self, test_config, mock_llm, prompts_dir):
+        """같은 인스턴스에서 daily_range가 겹쳐도 먼저 시작한 호출의 날짜가 유실되지 않는다."""
+        mock_ds = MagicMock()
+        mock_ds.is_summarize_stale.return_value = True
+        summarizer = SummarizerService(test_config, mock_llm, daily_state=mock_ds)
+        for d in ["2025-02-14", "2025-02-15", "2025-02-16"]:
+            _save_normalized(test_config, d)
+
+        calls = iter([None, lambda: summarizer.daily_range("2025-02-16", "2025-02-16"), None])
+
+        def chat(*args, **kwargs):
+            nested = next(calls)
+            if nested:
+                nested()
+            return "# Summary"
+
+        mock_llm.chat.side_effect = chat
+        summarizer.daily_range("2025-02-14", "2025-02-15")
+
+        flushed = [c.args for c in mock_ds.set_timestamps.call_args_list]
+        assert flushed == [
+            ("summarize", ["2025-02-16"]),
+            ("summarize", ["2025-02-14", "2025-02-15"]),
+        ]
+
 
 # ── _is_stale 테스트 ──
 